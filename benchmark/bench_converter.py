@@ -0,0 +1,90 @@
+#! /usr/bin/env python3
+
+"""Сравнение скорости упаковки и распаковки типов SDOT, DOT0, DOT3 и CLK с
+исходной реализацией на основе Decimal и двоичных строк.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+from binascii import hexlify, unhexlify
+from decimal import Decimal
+from pathlib import Path
+from struct import pack
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))    # запуск из любого каталога
+
+from owen.owen.converter import OWEN_TYPE, unpack_many
+
+
+def ref_pack_sdot(value: float) -> bytes:
+    sign, digits, exponent = Decimal(str(value)).as_tuple()
+    mantissa = int(Decimal((0, digits, 0)))
+
+    frmt, size, chunk = {mantissa < 16: (">B", 4, slice(1)),
+                         mantissa >= 4096: (">I", 20, slice(1, 4)),
+                        }.get(True, (">H", 12, slice(2)))
+
+    bin_str = f"{sign:1b}{abs(exponent):03b}{mantissa:0{size}b}"
+    return pack(frmt, int(bin_str, 2))[chunk]
+
+
+def ref_unpack_sdot(value: bytes) -> int | float:
+    data = int.from_bytes(value, "big")
+    bin_str = f"{data:0{len(value) * 8}b}"
+    return (-1) ** int(bin_str[0], 2) * 10 ** (-int(bin_str[1:4], 2)) * int(bin_str[4:], 2)
+
+
+def ref_pack_dot0(value: float) -> bytes:
+    s = str(int(value))
+    return unhexlify(s.zfill(len(s) + len(s) % 2))
+
+
+def ref_unpack_dot0(value: bytes) -> int:
+    return int(hexlify(value).decode())
+
+
+REFERENCE = {
+    "SDOT": (ref_pack_sdot, ref_unpack_sdot),
+    "DOT0": (ref_pack_dot0, ref_unpack_dot0),
+    "DOT3": (lambda value: ref_pack_dot0(value * 1000),
+             lambda value: ref_unpack_dot0(value) / 1000.0),
+    "CLK": (lambda value: b"".join(ref_pack_dot0(val).rjust(size, b"\x00")
+                                   for val, size in zip(value, (3, 1, 1, 1))),
+            lambda value: tuple(ref_unpack_dot0(value[slice(*chunk)])
+                                for chunk in ((0, 3), (3, 4), (4, 5), (5, 6)))),
+}
+
+
+def samples(frmt: str, count: int) -> list:
+    rnd = random.Random(0)
+    if frmt == "SDOT":
+        return [round(rnd.uniform(-9999, 9999), rnd.randint(0, 3)) for _ in range(count)]
+    if frmt == "DOT0":
+        return [rnd.randint(0, 99999999) for _ in range(count)]
+    if frmt == "DOT3":
+        return [rnd.randint(0, 9999999) / 1000 for _ in range(count)]
+    return [(rnd.randint(0, 999999), rnd.randint(0, 59), rnd.randint(0, 59),
+             rnd.randint(0, 23)) for _ in range(count)]
+
+
+def main(count: int = 10000) -> None:
+    for frmt, (ref_pack, ref_unpack) in REFERENCE.items():
+        pack_func = OWEN_TYPE[frmt]["pack"]
+        unpack_func = OWEN_TYPE[frmt]["unpack"]
+        values = samples(frmt, count)
+
+        packed = [pack_func(value) for value in values]
+        assert packed == [ref_pack(value) for value in values], frmt
+        assert unpack_many(frmt, packed) == [ref_unpack(data) for data in packed], frmt
+
+        ref = timeit.timeit(lambda: [ref_unpack(ref_pack(value)) for value in values], number=1)
+        new = timeit.timeit(lambda: unpack_many(frmt, map(pack_func, values)), number=1)
+        print(f"{frmt:5} round trip x{count}: reference {ref * 1e3:8.2f} ms, "
+              f"native {new * 1e3:8.2f} ms, speedup {ref / new:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
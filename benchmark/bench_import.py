@@ -0,0 +1,38 @@
+#! /usr/bin/env python3
+
+"""Сравнение времени импорта пакета owen.device при загрузке одной таблицы
+настроек и всех таблиц (как при импорте всех модулей устройств).
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+
+SETUP = "import importlib, time, typing; start = time.perf_counter(); "
+CASES = {
+    "import owen.device": "import owen.device",
+    "owen.device.TRM201": "import owen.device; owen.device.TRM201",
+    "all devices": "import owen.device as d; [d.get_device(name) for name in d.devices()]",
+}
+
+
+def measure(code: str, repeat: int) -> float:
+    """Медиана времени выполнения кода в новом процессе, мс."""
+
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", SETUP + code + "; print(time.perf_counter() - start)"],
+                                capture_output=True, text=True, check=True)
+        times.append(float(result.stdout) * 1e3)
+    return statistics.median(times)
+
+
+def main(repeat: int = 20) -> None:
+    for name, code in CASES.items():
+        print(f"{name:20} {measure(code, repeat):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+#! /usr/bin/env python3
+
+"""Пример использования асинхронного клиента библиотеки."""
+
+import asyncio
+import logging
+
+from owen.client import (AsyncOwenDevice, AsyncModbusSerialTransport,
+                                          AsyncModbusTcpTransport,
+                                          AsyncOwenSerialTransport)
+from owen.device import TRM202
+
+logging.basicConfig(level=logging.INFO)
+
+
+async def main() -> None:
+    """ !!!
+        Для асинхронного транспорта протокола ОВЕН требуется пакет
+        pyserial-asyncio (pip install python-owen[asyncio]).
+
+        Один цикл событий опрашивает все устройства одновременно, запросы к
+        устройствам на одной шине RS485 выполняются по очереди.
+    """
+
+    async with AsyncOwenSerialTransport(port="COM5", baudrate=115200, timeout=1.0) as transport:
+    # async with AsyncModbusSerialTransport(port="COM5", baudrate=115200, timeout=1.0) as transport:
+    # async with AsyncModbusTcpTransport(host="192.168.1.99", timeout=1.0) as transport:
+
+        devices = [AsyncOwenDevice(transport=transport, device=TRM202, unit=unit)
+                   for unit in (1, 2, 3)]
+
+        results = await asyncio.gather(*(device.get_many([("SP", 0), ("SP", 1)])
+                                         for device in devices))
+        for device, result in zip(devices, results):
+            print(f"{device} = {result}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
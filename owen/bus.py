@@ -0,0 +1,348 @@
+#! /usr/bin/env python3
+# mypy: disable-error-code="explicit-any"
+
+"""Реестр последовательных портов, общих для всех транспортов процесса,
+блокировка шины для обменов из нескольких потоков и объединение одновременных
+одинаковых запросов.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections import deque
+from threading import Event, Lock, get_ident
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, TypeVar
+
+from owen.exception import OwenError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Hashable
+
+T = TypeVar("T")
+
+_HANDOFF = -1           # владелец блокировки, передаваемой следующему в очереди
+
+
+class LockStats(NamedTuple):
+    """Статистика ожидания блокировки шины."""
+
+    acquisitions: int   # количество захватов (без повторных захватов владельцем)
+    contended: int      # количество захватов с ожиданием в очереди
+    wait_total: float   # суммарное время ожидания, с
+    wait_max: float     # максимальное время ожидания, с
+    waiting: int        # количество потоков в очереди
+
+
+class BusLock:
+    """Справедливая реентерабельная блокировка шины.
+
+    Потоки получают блокировку строго в порядке очереди: освобождающий поток
+    передает ее первому ожидающему, и новые потоки не могут захватить шину
+    вне очереди. Время ожидания накапливается для оценки загрузки шины.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация свободной блокировки."""
+
+        self._lock = Lock()
+        self._waiters: deque[Lock] = deque()
+        self._owner: int | None = None
+        self._count = 0
+
+        self._acquisitions = 0
+        self._contended = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def __enter__(self) -> BusLock:
+        """Захват блокировки при входе в блок with."""
+
+        self.acquire()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Освобождение блокировки при выходе из блока with."""
+
+        self.release()
+
+    def acquire(self) -> None:
+        """Захват блокировки с ожиданием своей очереди."""
+
+        ident = get_ident()
+        with self._lock:
+            if self._owner == ident:
+                self._count += 1
+                return
+            if self._owner is None:
+                self._owner = ident
+                self._count = 1
+                self._acquisitions += 1
+                return
+
+            waiter = Lock()
+            waiter.acquire()
+            self._waiters.append(waiter)
+
+        start = perf_counter()
+        waiter.acquire()                # освобождается предыдущим владельцем
+        wait = perf_counter() - start
+
+        with self._lock:
+            self._owner = ident
+            self._count = 1
+            self._acquisitions += 1
+            self._contended += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+
+    def release(self) -> None:
+        """Освобождение блокировки и передача ее следующему в очереди."""
+
+        with self._lock:
+            if self._owner != get_ident():
+                msg = "cannot release un-acquired lock"
+                raise RuntimeError(msg)
+
+            self._count -= 1
+            if self._count:
+                return
+            if self._waiters:
+                self._owner = _HANDOFF
+                self._waiters.popleft().release()
+            else:
+                self._owner = None
+
+    def locked(self) -> bool:
+        """Проверка захвата блокировки."""
+
+        return self._owner is not None
+
+    def stats(self) -> LockStats:
+        """Статистика ожидания блокировки."""
+
+        with self._lock:
+            return LockStats(self._acquisitions, self._contended, self._wait_total,
+                             self._wait_max, len(self._waiters))
+
+
+class FlightStats(NamedTuple):
+    """Статистика объединения запросов."""
+
+    executed: int       # количество выполненных запросов
+    shared: int         # количество запросов, получивших результат чужого запроса
+    in_flight: int      # количество выполняющихся запросов
+
+
+class _Flight:
+    """Выполняющийся запрос."""
+
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Объединение одновременных одинаковых запросов из нескольких потоков.
+
+    Если запрос с тем же ключом уже выполняется, поток не ставит на шину
+    собственную транзакцию, а ожидает завершения выполняющейся и получает ее
+    результат или исключение.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация без выполняющихся запросов."""
+
+        self._flights: dict[Hashable, _Flight] = {}
+        self._lock = Lock()
+        self._executed = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Выполнение запроса или ожидание результата такого же запроса."""
+
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self._executed += 1
+                leader = True
+            else:
+                self._shared += 1
+                leader = False
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = func()
+        except BaseException as err:
+            flight.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def stats(self) -> FlightStats:
+        """Статистика объединения запросов."""
+
+        with self._lock:
+            return FlightStats(self._executed, self._shared, len(self._flights))
+
+
+class AsyncSingleFlight:
+    """Объединение одновременных одинаковых запросов из нескольких сопрограмм.
+
+    Запрос выполняется отдельной задачей, поэтому отмена одной из ожидающих
+    сопрограмм не отменяет запрос для остальных.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация без выполняющихся запросов."""
+
+        self._flights: dict[Hashable, asyncio.Future[Any]] = {}
+        self._executed = 0
+        self._shared = 0
+
+    def _done(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        """Удаление завершенного запроса."""
+
+        if self._flights.get(key) is future:
+            del self._flights[key]
+        if not future.cancelled():
+            future.exception()          # исключение получено ожидающими
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Выполнение запроса или ожидание результата такого же запроса."""
+
+        future = self._flights.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            future.add_done_callback(lambda future: self._done(key, future))
+            self._flights[key] = future
+            self._executed += 1
+        else:
+            self._shared += 1
+        return await asyncio.shield(future)
+
+    def stats(self) -> FlightStats:
+        """Статистика объединения запросов."""
+
+        return FlightStats(self._executed, self._shared, len(self._flights))
+
+
+class SerialBus:
+    """Открытый последовательный порт (физическая шина RS485)."""
+
+    def __init__(self, port: str | None, protocol: str, settings: dict[str, Any],
+                       socket: Any) -> None:
+        """Инициализация описания открытого порта.
+
+        Args:
+            port: Имя порта
+            protocol: Протокол обмена на шине (owen или modbus)
+            settings: Параметры порта
+            socket: Объект открытого порта
+
+        """
+
+        self.port = port
+        self.protocol = protocol
+        self.settings = settings
+        self.socket = socket
+        self.lock = BusLock()
+        self.flights = SingleFlight()
+        self.refs = 0
+
+    def __repr__(self) -> str:
+        """Строковое представление шины."""
+
+        return f"SerialBus(port={self.port!r}, protocol={self.protocol!r}, refs={self.refs})"
+
+
+def bus_key(port: str) -> str:
+    """Приведение имени порта к общему виду (ссылки /dev/serial/by-id и т.д.)."""
+
+    if os.name == "nt":
+        return port.upper()
+    return os.path.realpath(port)
+
+
+class BusRegistry:
+    """Реестр открытых последовательных портов.
+
+    Каждый порт открывается один раз при первом запросе и закрывается после
+    освобождения последним транспортом. Повторный запрос порта с другим
+    протоколом или другими параметрами приводит к ошибке.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пустого реестра."""
+
+        self._buses: dict[str, SerialBus] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Количество открытых портов."""
+
+        return len(self._buses)
+
+    def acquire(self, port: str | None, protocol: str, settings: dict[str, Any],
+                      factory: Callable[[], Any]) -> SerialBus:
+        """Получение открытого порта с увеличением счетчика ссылок.
+
+        Args:
+            port: Имя порта (None - порт без регистрации в реестре)
+            protocol: Протокол обмена на шине (owen или modbus)
+            settings: Параметры порта
+            factory: Функция открытия порта
+
+        """
+
+        if port is None:
+            private = SerialBus(port, protocol, settings, factory())
+            private.refs = 1
+            return private
+
+        key = bus_key(port)
+        with self._lock:
+            bus = self._buses.get(key)
+            if bus is None:
+                bus = SerialBus(port, protocol, settings, factory())
+                self._buses[key] = bus
+            elif bus.protocol != protocol:
+                msg = f"Port '{port}' is already used by {bus.protocol} protocol"
+                raise OwenError(msg)
+            elif bus.settings != settings:
+                diff = {name: (bus.settings.get(name), settings.get(name))
+                        for name in bus.settings.keys() | settings.keys()
+                        if bus.settings.get(name) != settings.get(name)}
+                msg = f"Port '{port}' is already open with different settings: {diff}"
+                raise OwenError(msg)
+
+            bus.refs += 1
+            return bus
+
+    def release(self, bus: SerialBus) -> None:
+        """Освобождение порта; порт закрывается после последнего освобождения."""
+
+        with self._lock:
+            bus.refs -= 1
+            if bus.refs > 0:
+                return
+            if bus.port is not None and self._buses.get(bus_key(bus.port)) is bus:
+                del self._buses[bus_key(bus.port)]
+
+        bus.socket.close()
+
+
+registry = BusRegistry()
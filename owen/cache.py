@@ -0,0 +1,122 @@
+#! /usr/bin/env python3
+
+"""Кэш значений параметров устройства с ограниченным временем хранения."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Mapping
+
+# Параметры, которые не меняются во время работы устройства (хранятся без ограничения)
+STATIC_TTL: dict[str, float | None] = {"DEV": None, "VER": None, "DEVICE": None, "VERSION": None}
+
+
+class CachedValue(NamedTuple):
+    """Значение параметра с признаком устаревания."""
+
+    value: float | str
+    age: float          # время, прошедшее с момента чтения из устройства, с
+    cached: bool        # значение получено из кэша
+
+
+class CacheInfo(NamedTuple):
+    """Статистика кэша значений."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class ValueCache:
+    """Кэш значений параметров одного устройства.
+
+    Время хранения задается для всего кэша и может быть переопределено для
+    отдельных параметров (None - без ограничения). При превышении maxsize
+    удаляются давно не использовавшиеся значения.
+    """
+
+    def __init__(self, ttl: float = 1.0,
+                       maxsize: int = 1024,
+                       ttls: Mapping[str, float | None] | None = None,
+                       clock: Callable[[], float] = monotonic) -> None:
+        """Инициализация кэша значений.
+
+        Args:
+            ttl: Время хранения значений, с
+            maxsize: Максимальное количество значений в кэше
+            ttls: Время хранения отдельных параметров {название: время, с}
+            clock: Источник времени
+
+        """
+
+        self.default_ttl = ttl
+        self.maxsize = maxsize
+        self.ttls = {**STATIC_TTL, **{name.upper(): value for name, value in (ttls or {}).items()}}
+        self.clock = clock
+
+        self._values: OrderedDict[Hashable, tuple[float, float | str]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        """Количество значений в кэше."""
+
+        return len(self._values)
+
+    def ttl(self, name: str) -> float | None:
+        """Время хранения значения параметра, с (None - без ограничения)."""
+
+        return self.ttls.get(name, self.default_ttl)
+
+    def get(self, key: tuple[str, int | None]) -> CachedValue | None:
+        """Получение значения из кэша (None - значения нет или оно устарело)."""
+
+        now = self.clock()
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is not None:
+                ttl = self.ttl(key[0])
+                if ttl is None or now - entry[0] < ttl:
+                    self._values.move_to_end(key)
+                    self._hits += 1
+                    return CachedValue(entry[1], now - entry[0], True)
+                del self._values[key]
+            self._misses += 1
+        return None
+
+    def put(self, key: tuple[str, int | None], value: float | str) -> CachedValue:
+        """Сохранение прочитанного или записанного значения."""
+
+        now = self.clock()
+        with self._lock:
+            self._values[key] = (now, value)
+            self._values.move_to_end(key)
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+                self._evictions += 1
+        return CachedValue(value, 0.0, False)
+
+    def invalidate(self, key: tuple[str, int | None] | None = None) -> None:
+        """Удаление значения из кэша (None - очистка всего кэша)."""
+
+        with self._lock:
+            if key is None:
+                self._values.clear()
+            else:
+                self._values.pop(key, None)
+
+    def info(self) -> CacheInfo:
+        """Статистика кэша значений."""
+
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self.maxsize,
+                             len(self._values))
@@ -1,4 +1,5 @@
 #! /usr/bin/env python3
+# mypy: disable-error-code="method-assign"
 
 """Реализация класса клиента."""
 
@@ -6,24 +7,87 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Union
 
-from owen.modbus.protocol import Modbus
-from owen.modbus.transport import ModbusSerialTransport, ModbusTcpTransport
-from owen.owen.protocol import Owen
-from owen.owen.transport import OwenSerialTransport
+from owen.cache import CachedValue
+from owen.device._table import device_table
+from owen.exception import OwenError
+from owen.modbus.pipeline import AsyncModbusPipelineTransport
+from owen.modbus.protocol import AsyncModbus, Modbus, ModbusParam
+from owen.modbus.transport import (AsyncModbusSerialTransport, AsyncModbusTcpTransport,
+                                   ModbusSerialTransport, ModbusTcpTransport)
+from owen.owen.protocol import AsyncOwen, Owen, OwenParam
+from owen.owen.transport import AsyncOwenSerialTransport, OwenSerialTransport
 
 if TYPE_CHECKING:
-    from owen.device._types import DEVICE
+    from collections.abc import Iterable, Mapping
+
+    from owen.bus import BusLock, LockStats
+    from owen.cache import CacheInfo, ValueCache
+    from owen.device._table import DeviceLike
 
 Transport = Union[ModbusSerialTransport, ModbusTcpTransport, OwenSerialTransport]
+AsyncTransport = Union[AsyncModbusSerialTransport, AsyncModbusTcpTransport,
+                       AsyncModbusPipelineTransport, AsyncOwenSerialTransport]
+
+
+class DeviceParam:
+    """Подготовленный параметр устройства (см. OwenDevice.param).
+
+    Чтение выполняется без проверки названия и индекса, поиска типа и
+    построения запроса. Кэш значений и объединение запросов не используются,
+    записанное значение сохраняется в кэше устройства.
+    """
+
+    __slots__ = ("_handle", "_lock", "device", "index", "name")
+
+    def __init__(self, device: OwenDevice, handle: OwenParam | ModbusParam) -> None:
+        """Инициализация подготовленного параметра устройства."""
+
+        self.device = device
+        self.name = handle.name
+        self.index = handle.index
+        self._handle = handle
+        self._lock = device.lock
+
+    def __repr__(self) -> str:
+        """Строковое представление параметра."""
+
+        return f"DeviceParam(name={self.name!r}, index={self.index})"
+
+    def read(self) -> float | str:
+        """Чтение значения параметра."""
+
+        with self._lock:
+            return self._handle.read()
+
+    def write(self, value: float | str | None = None) -> bool:
+        """Запись значения параметра."""
+
+        try:
+            with self._lock:
+                result = self._handle.write(value)
+        except OwenError as err:
+            self.device._written(self.name, self.index, err)
+            raise
+        self.device._written(self.name, self.index, True if value is None else value)
+        return result
 
 
 class OwenDevice:
-    """Класс клиента для работы с устройствами ОВЕН."""
+    """Класс клиента для работы с устройствами ОВЕН.
+
+    Методы клиента можно вызывать из нескольких потоков: каждая операция
+    выполняется целиком под блокировкой шины транспорта, потоки получают
+    шину в порядке очереди.
+
+    Если задан кэш значений, чтение параметра, прочитанного или записанного
+    недавно, выполняется без обращения к шине.
+    """
 
     def __init__(self, transport: Transport,
-                       device: DEVICE,
+                       device: DeviceLike,
                        unit: int,
-                       addr_len_8: bool = True) -> None:
+                       addr_len_8: bool = True,
+                       cache: ValueCache | None = None) -> None:
         """Инициализация класса клиента для работы с устройствами ОВЕН.
 
         Args:
@@ -31,27 +95,312 @@ class OwenDevice:
             device: Название устройства (например: TRM201)
             unit: Адрес устройства (0...2047 - для Овен, 0...255 - для Modbus)
             addr_len_8: Длина адреса в битах (True=8, False=11). Для Modbus игнорируется
+            cache: Кэш значений параметров (None - без кэша)
+
+        """
+
+        table = device_table(device)
+        self._protocol: Owen | Modbus
+        if isinstance(transport, OwenSerialTransport):
+            self._protocol = Owen(unit, table, addr_len_8)
+            self._protocol.read = transport.read
+            self._protocol.write = transport.write
+            self._protocol.read_size = transport.read
+            self._protocol.lock = transport.lock
+        else:
+            self._protocol = Modbus(unit, table, addr_len_8)
+            self._protocol.read = transport.read
+            self._protocol.write = transport.write
+        self._lock = transport.lock
+        self._flights = transport.flights
+        self.cache = cache
+        self._dp_names = table.dp_names
+
+    @property
+    def lock(self) -> BusLock:
+        """Блокировка шины устройства (общая для всех устройств шины)."""
+
+        return self._lock
+
+    def lock_stats(self) -> LockStats:
+        """Статистика ожидания блокировки шины (общая для всех устройств шины)."""
+
+        return self._lock.stats()
+
+    def cache_info(self) -> CacheInfo | None:
+        """Статистика кэша значений (None - кэш не используется)."""
+
+        return None if self.cache is None else self.cache.info()
+
+    def _key(self, name: str, index: int | None) -> tuple[str, int | None]:
+        """Ключ кэша параметра (индекс приводится к виду, принятому протоколом)."""
 
+        try:
+            return name, self._protocol.check_index(name, index)[1]
+        except (KeyError, OwenError):
+            return name, index
+
+    def _written(self, name: str, index: int | None, value: float | str | bool | OwenError) -> None:
+        """Обновление кэша после записи параметра."""
+
+        if self.cache is None:
+            return
+        if name in self._dp_names:
+            self.cache.invalidate()
+        elif value is True or isinstance(value, OwenError):
+            self.cache.invalidate(self._key(name, index))
+        else:
+            self.cache.put(self._key(name, index), value)
+
+    def get_value(self, name: str, index: int | None = None) -> CachedValue:
+        """Чтение значения параметра устройства с учетом кэша.
+
+        Returns:
+            Значение, время с момента его чтения из устройства и признак
+            получения значения из кэша
+
+        """
+
+        name = name.upper()
+        if self.cache is None:
+            return CachedValue(self.get_param(name, index), 0.0, False)
+
+        key = self._key(name, index)
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry
+        return self.cache.put(key, self._read(*key))
+
+    def _flight_key(self, *request: object) -> tuple[object, ...]:
+        """Ключ объединения одновременных чтений: адрес устройства, длина
+        адреса (только ОВЕН) и запрос.
+        """
+
+        return (self._protocol.unit, getattr(self._protocol, "addr_len_8", None), *request)
+
+    def _read(self, name: str, index: int | None) -> float | str:
+        """Чтение параметра из устройства.
+
+        Одновременные чтения одного параметра из нескольких потоков
+        объединяются в одну транзакцию на шине.
         """
 
-        self._protocol = {OwenSerialTransport: Owen,
-                          ModbusSerialTransport: Modbus,
-                          ModbusTcpTransport: Modbus,
-                         }[transport.__class__](unit, device, addr_len_8)
-        self._protocol.read = transport.read
-        self._protocol.write = transport.write
+        def read() -> float | str:
+            with self._lock:
+                return self._protocol.get_param(name, index)
+
+        return self._flights.do(self._flight_key(name, index), read)
+
+    def _read_many(self, items: list[tuple[str, int | None]],
+                   ) -> dict[tuple[str, int | None], float | str | OwenError]:
+        """Чтение группы параметров из устройства (одновременные чтения
+        одинаковых групп объединяются).
+        """
+
+        def read() -> dict[tuple[str, int | None], float | str | OwenError]:
+            with self._lock:
+                return self._protocol.get_many(items)
+
+        return self._flights.do(self._flight_key(tuple(items)), read)
+
+    def param(self, name: str, index: int | None = None) -> DeviceParam:
+        """Подготовка параметра для многократного чтения и записи.
+
+        Название, индекс, адрес и формат параметра проверяются один раз,
+        поэтому чтение подготовленного параметра быстрее get_param.
+        """
+
+        return DeviceParam(self, self._protocol.prepare(name.upper(), index))
 
     def get_param(self, name: str, index: int | None = None) -> float | str:
         """Чтение значения параметра устройства."""
 
-        return self._protocol.get_param(name.upper(), index)
+        if self.cache is not None:
+            return self.get_value(name, index).value
+        return self._read(*self._key(name.upper(), index))
 
     def set_param(self, name: str, index: int | None = None,
                         value: float | str | None = None) -> bool:
         """Запись нового значения параметра устройства."""
 
-        return self._protocol.set_param(name.upper(), index, value)
+        name = name.upper()
+        try:
+            with self._lock:
+                result = self._protocol.set_param(name, index, value)
+        except OwenError as err:
+            self._written(name, index, err)
+            raise
+        self._written(name, index, True if value is None else value)
+        return result
+
+    def get_many(self, items: Iterable[tuple[str, int | None]],
+                 ) -> dict[tuple[str, int | None], float | str | OwenError]:
+        """Чтение группы параметров устройства.
+
+        Args:
+            items: Список пар (название параметра, индекс)
+
+        Returns:
+            Словарь {(название, индекс): значение или OwenError}
+
+        """
+
+        items = list(items)
+        if self.cache is not None:
+            return {item: value.value if isinstance(value, CachedValue) else value
+                    for item, value in self.get_values(items).items()}
+
+        result = self._read_many([(name.upper(), index) for name, index in items])
+        return {(name, index): result[name.upper(), index] for name, index in items}
+
+    def get_values(self, items: Iterable[tuple[str, int | None]],
+                   ) -> dict[tuple[str, int | None], CachedValue | OwenError]:
+        """Чтение группы параметров устройства с учетом кэша.
+
+        Параметры, отсутствующие в кэше, читаются одной группой (get_many).
+        """
+
+        items = list(items)
+        keys = {(name, index): self._key(name.upper(), index) for name, index in items}
+        if self.cache is None:
+            result: dict[tuple[str, int | None], CachedValue | OwenError] = {}
+            for item, value in self.get_many(items).items():
+                result[item] = value if isinstance(value, OwenError) else CachedValue(value, 0.0, False)
+            return result
+
+        cached: dict[tuple[str, int | None], CachedValue | OwenError] = {}
+        missing = []
+        for key in set(keys.values()):
+            entry = self.cache.get(key)
+            if entry is None:
+                missing.append(key)
+            else:
+                cached[key] = entry
+        if missing:
+            values = self._read_many(missing)
+            for key in missing:
+                value = values[key]
+                cached[key] = value if isinstance(value, OwenError) else self.cache.put(key, value)
+
+        return {item: cached[key] for item, key in keys.items()}
+
+    def get_raw_many(self, items: Iterable[tuple[str, int | None]],
+                     ) -> dict[tuple[str, int | None], bytes | OwenError]:
+        """Чтение группы параметров устройства без распаковки значений.
+
+        Данные параметра не меняются, пока не меняется его значение, поэтому
+        их можно сравнивать с предыдущими до распаковки (см. decode_raw).
+        """
+
+        items = list(items)
+        with self._lock:
+            result = self._protocol.get_raw_many([(name.upper(), index) for name, index in items])
+        return {(name, index): result[name.upper(), index] for name, index in items}
+
+    def decode_raw(self, name: str, index: int | None, raw: bytes) -> float | str:
+        """Распаковка значения параметра, прочитанного get_raw_many."""
+
+        return self._protocol.decode_raw(name.upper(), index, raw)
+
+    def set_many(self, items: Mapping[tuple[str, int | None], float | str],
+                 ) -> dict[tuple[str, int | None], bool | OwenError]:
+        """Запись группы параметров устройства.
+
+        Args:
+            items: Словарь {(название параметра, индекс): значение}
+
+        Returns:
+            Словарь {(название, индекс): True или OwenError}
+
+        """
+
+        with self._lock:
+            result = self._protocol.set_many({(name.upper(), index): value
+                                              for (name, index), value in items.items()})
+        for (name, index), value in items.items():
+            status = result[name.upper(), index]
+            self._written(name.upper(), index, value if status is True else status)
+        return {(name, index): result[name.upper(), index] for name, index in items}
+
+
+class AsyncOwenDevice:
+    """Класс асинхронного клиента для работы с устройствами ОВЕН.
+
+    Один цикл событий обслуживает любое количество устройств и шин: запросы к
+    устройствам на разных шинах и соединениях выполняются одновременно.
+    """
+
+    def __init__(self, transport: AsyncTransport,
+                       device: DeviceLike,
+                       unit: int,
+                       addr_len_8: bool = True) -> None:
+        """Инициализация класса асинхронного клиента для работы с устройствами ОВЕН.
+
+        Args:
+            transport: Тип используемого асинхронного транспорта
+            device: Название устройства (например: TRM201)
+            unit: Адрес устройства (0...2047 - для Овен, 0...255 - для Modbus)
+            addr_len_8: Длина адреса в битах (True=8, False=11). Для Modbus игнорируется
+
+        """
+
+        self._protocol: AsyncOwen | AsyncModbus
+        if isinstance(transport, AsyncOwenSerialTransport):
+            self._protocol = AsyncOwen(unit, device, addr_len_8)
+            self._protocol.exchange = transport.exchange
+        else:
+            self._protocol = AsyncModbus(unit, device, addr_len_8)
+            self._protocol.read = transport.read
+            self._protocol.write = transport.write
+        self._flights = transport.flights
+
+    def _flight_key(self, *request: object) -> tuple[object, ...]:
+        """Ключ объединения одновременных чтений: адрес устройства, длина
+        адреса (только ОВЕН) и запрос.
+        """
+
+        return (self._protocol.unit, getattr(self._protocol, "addr_len_8", None), *request)
+
+    async def get_param(self, name: str, index: int | None = None) -> float | str:
+        """Чтение значения параметра устройства.
+
+        Одновременные чтения одного параметра объединяются в одну транзакцию.
+        """
+
+        name = name.upper()
+        try:
+            index = self._protocol.check_index(name, index)[1]
+        except (KeyError, OwenError):
+            pass
+        return await self._flights.do(self._flight_key(name, index),
+                                      lambda: self._protocol.get_param(name, index))
+
+    async def set_param(self, name: str, index: int | None = None,
+                              value: float | str | None = None) -> bool:
+        """Запись нового значения параметра устройства."""
+
+        return await self._protocol.set_param(name.upper(), index, value)
+
+    async def get_many(self, items: Iterable[tuple[str, int | None]],
+                       ) -> dict[tuple[str, int | None], float | str | OwenError]:
+        """Чтение группы параметров устройства."""
+
+        items = list(items)
+        request = [(name.upper(), index) for name, index in items]
+        result = await self._flights.do(self._flight_key(tuple(request)),
+                                        lambda: self._protocol.get_many(request))
+        return {(name, index): result[name.upper(), index] for name, index in items}
+
+    async def set_many(self, items: Mapping[tuple[str, int | None], float | str],
+                       ) -> dict[tuple[str, int | None], bool | OwenError]:
+        """Запись группы параметров устройства."""
+
+        result = await self._protocol.set_many({(name.upper(), index): value
+                                                for (name, index), value in items.items()})
+        return {(name, index): result[name.upper(), index] for name, index in items}
 
 
-__all__ = ["ModbusSerialTransport", "ModbusTcpTransport",
+__all__ = ["AsyncModbusPipelineTransport", "AsyncModbusSerialTransport", "AsyncModbusTcpTransport",
+           "AsyncOwenDevice", "AsyncOwenSerialTransport", "DeviceParam",
+           "ModbusSerialTransport", "ModbusTcpTransport",
            "OwenDevice", "OwenSerialTransport"]
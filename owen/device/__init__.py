@@ -1,37 +1,130 @@
 #! /usr/bin/env python3
 
-"""Список поддерживаемых устройств."""
-
-from owen.device._2trm1 import _2TRM1 as _2TRM1
-from owen.device.mk210 import MK210_301 as MK210_301
-from owen.device.mk210 import MK210_302 as MK210_302
-from owen.device.mu210 import MU210_401 as MU210_401
-from owen.device.mu210 import MU210_402 as MU210_402
-from owen.device.mu210 import MU210_403 as MU210_403
-from owen.device.mu210 import MU210_412 as MU210_412
-from owen.device.mu210 import MU210_502 as MU210_502
-from owen.device.mv210 import MV210_101 as MV210_101
-from owen.device.mv210 import MV210_202 as MV210_202
-from owen.device.mv210 import MV210_212 as MV210_212
-from owen.device.mv210 import MV210_221 as MV210_221
-from owen.device.pr103 import PR103_24_1610_03 as PR103_24_1610_03
-from owen.device.pr103 import PR103_24_1610_06 as PR103_24_1610_06
-from owen.device.pr103 import PR103_24_1612_05 as PR103_24_1612_05
-from owen.device.pr103 import PR103_24_1618_16 as PR103_24_1618_16
-from owen.device.pr103 import PR103_24_1618_17 as PR103_24_1618_17
-from owen.device.pr103 import PR103_230_1610_01 as PR103_230_1610_01
-from owen.device.si8 import SI8 as SI8
-from owen.device.si30 import SI30 as SI30
-from owen.device.th01 import TH01 as TH01
-from owen.device.trm10 import TRM10 as TRM10
-from owen.device.trm101 import TRM101 as TRM101
-from owen.device.trm136 import TRM136 as TRM136
-from owen.device.trm138 import TRM138 as TRM138
-from owen.device.trm148 import TRM148 as TRM148
-from owen.device.trm151 import TRM151 as TRM151
-from owen.device.trm200 import TRM200 as TRM200
-from owen.device.trm201 import TRM201 as TRM201
-from owen.device.trm202 import TRM202 as TRM202
-from owen.device.trm210 import TRM210 as TRM210
-from owen.device.trm212 import TRM212 as TRM212
-from owen.device.trm251 import TRM251 as TRM251
+"""Список поддерживаемых устройств.
+
+Таблицы настроек загружаются при первом обращении (owen.device.TRM201 или
+get_device("TRM201")), поэтому импорт пакета не загружает модули остальных
+устройств. Загруженная таблица преобразуется при создании первого протокола,
+работающего с ней (owen.device._table).
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from owen.device._2trm1 import _2TRM1 as _2TRM1
+    from owen.device._types import DEVICE
+    from owen.device.mk210 import MK210_301 as MK210_301
+    from owen.device.mk210 import MK210_302 as MK210_302
+    from owen.device.mu210 import MU210_401 as MU210_401
+    from owen.device.mu210 import MU210_402 as MU210_402
+    from owen.device.mu210 import MU210_403 as MU210_403
+    from owen.device.mu210 import MU210_412 as MU210_412
+    from owen.device.mu210 import MU210_502 as MU210_502
+    from owen.device.mv210 import MV210_101 as MV210_101
+    from owen.device.mv210 import MV210_202 as MV210_202
+    from owen.device.mv210 import MV210_212 as MV210_212
+    from owen.device.mv210 import MV210_221 as MV210_221
+    from owen.device.pr103 import PR103_24_1610_03 as PR103_24_1610_03
+    from owen.device.pr103 import PR103_24_1610_06 as PR103_24_1610_06
+    from owen.device.pr103 import PR103_24_1612_05 as PR103_24_1612_05
+    from owen.device.pr103 import PR103_24_1618_16 as PR103_24_1618_16
+    from owen.device.pr103 import PR103_24_1618_17 as PR103_24_1618_17
+    from owen.device.pr103 import PR103_230_1610_01 as PR103_230_1610_01
+    from owen.device.si8 import SI8 as SI8
+    from owen.device.si30 import SI30 as SI30
+    from owen.device.th01 import TH01 as TH01
+    from owen.device.trm10 import TRM10 as TRM10
+    from owen.device.trm101 import TRM101 as TRM101
+    from owen.device.trm136 import TRM136 as TRM136
+    from owen.device.trm138 import TRM138 as TRM138
+    from owen.device.trm148 import TRM148 as TRM148
+    from owen.device.trm151 import TRM151 as TRM151
+    from owen.device.trm200 import TRM200 as TRM200
+    from owen.device.trm201 import TRM201 as TRM201
+    from owen.device.trm202 import TRM202 as TRM202
+    from owen.device.trm210 import TRM210 as TRM210
+    from owen.device.trm212 import TRM212 as TRM212
+    from owen.device.trm251 import TRM251 as TRM251
+
+# название таблицы настроек: модуль, в котором она описана
+_DEVICES = {
+    "_2TRM1": "_2trm1",
+    "MK210_301": "mk210",
+    "MK210_302": "mk210",
+    "MU210_401": "mu210",
+    "MU210_402": "mu210",
+    "MU210_403": "mu210",
+    "MU210_412": "mu210",
+    "MU210_502": "mu210",
+    "MV210_101": "mv210",
+    "MV210_202": "mv210",
+    "MV210_212": "mv210",
+    "MV210_221": "mv210",
+    "PR103_24_1610_03": "pr103",
+    "PR103_24_1610_06": "pr103",
+    "PR103_24_1612_05": "pr103",
+    "PR103_24_1618_16": "pr103",
+    "PR103_24_1618_17": "pr103",
+    "PR103_230_1610_01": "pr103",
+    "SI8": "si8",
+    "SI30": "si30",
+    "TH01": "th01",
+    "TRM10": "trm10",
+    "TRM101": "trm101",
+    "TRM136": "trm136",
+    "TRM138": "trm138",
+    "TRM148": "trm148",
+    "TRM151": "trm151",
+    "TRM200": "trm200",
+    "TRM201": "trm201",
+    "TRM202": "trm202",
+    "TRM210": "trm210",
+    "TRM212": "trm212",
+    "TRM251": "trm251",
+}
+
+# таблицы настроек, загруженные из реестра (id таблицы: таблица)
+_loaded: dict[int, DEVICE] = {}
+
+
+def devices() -> list[str]:
+    """Список названий таблиц настроек поддерживаемых устройств."""
+
+    return sorted(_DEVICES)
+
+
+def get_device(name: str) -> DEVICE:
+    """Получение таблицы настроек устройства по названию (например: TRM201)."""
+
+    key = name.upper().replace("-", "_")
+    if key not in _DEVICES and f"_{key}" in _DEVICES:
+        key = f"_{key}"             # название начинается с цифры (_2TRM1)
+    if key not in _DEVICES:
+        msg = f"Unknown device '{name}'"
+        raise KeyError(msg)
+
+    device: DEVICE = getattr(import_module(f"owen.device.{_DEVICES[key]}"), key)
+    _loaded[id(device)] = device        # общая преобразованная таблица для протоколов
+    globals()[key] = device             # последующие обращения без __getattr__
+    return device
+
+
+def __getattr__(name: str) -> DEVICE:
+    """Загрузка таблицы настроек при первом обращении к атрибуту пакета."""
+
+    if name not in _DEVICES:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return get_device(name)
+
+
+def __dir__() -> list[str]:
+    """Список атрибутов пакета, включая незагруженные таблицы."""
+
+    return sorted({*globals(), *_DEVICES})
+
+
+__all__ = ["devices", "get_device", *_DEVICES]
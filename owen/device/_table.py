@@ -0,0 +1,119 @@
+#! /usr/bin/env python3
+
+"""Компактное неизменяемое представление таблиц настроек устройств.
+
+Описания параметров хранятся в кортежах с именованными полями, названия типов
+интернируются, количество регистров Modbus вычисляется заранее. Таблицы,
+загруженные из реестра owen.device, преобразуются один раз при создании
+первого протокола и используются всеми экземплярами протоколов; остальные
+словари настроек преобразуются при каждом создании протокола.
+
+Отсортированный индекс адресов Modbus не хранится: планировщик запросов
+(owen.modbus.planner) сортирует только запрошенные параметры, что дешевле
+выборки из индекса всей таблицы.
+"""
+
+from __future__ import annotations
+
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple, Union
+
+from owen.device import _loaded
+from owen.modbus.converter import MODBUS_TYPE
+from owen.owen.command import CommandTable
+from owen.owen.converter import OWEN_TYPE
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from owen.device._types import DEVICE
+
+
+class OwenParamInfo(NamedTuple):
+    """Описание параметра протокола ОВЕН."""
+
+    name: str
+    type: str                                 # интернированное название типа
+    indexes: Mapping[int | None, int | None]  # индекс: адрес индекса
+    size: int | None                          # размер значения, байт (None - переменный)
+
+
+class ModbusParamInfo(NamedTuple):
+    """Описание параметра протокола Modbus."""
+
+    name: str
+    type: str                                 # интернированное название типа
+    indexes: Mapping[int | None, int]         # индекс: адрес регистра
+    dp: str | None                            # параметр, задающий положение точки
+    precision: int                            # количество знаков после запятой
+    registers: int                            # количество регистров
+
+
+class DeviceTable:
+    """Преобразованная таблица настроек устройства."""
+
+    __slots__ = ("_commands", "byteorder", "dp_names", "modbus", "owen", "wordorder")
+
+    def __init__(self, device: DEVICE) -> None:
+        """Преобразование таблицы настроек устройства."""
+
+        owen = device.get("owen", {})
+        modbus = device.get("modbus", {})
+
+        self.owen: Mapping[str, OwenParamInfo] = MappingProxyType({
+            name: OwenParamInfo(name, sys.intern(dev["type"]), MappingProxyType(dict(dev["index"])),
+                                OWEN_TYPE[dev["type"]]["size"])
+            for name, dev in owen.items()})
+        self.modbus: Mapping[str, ModbusParamInfo] = MappingProxyType({
+            name: ModbusParamInfo(name, sys.intern(dev["type"]), MappingProxyType(dict(dev["index"])),
+                                  dev["dp"], dev["precision"], MODBUS_TYPE[dev["type"]]["size"])
+            for name, dev in modbus.items()})
+        self.byteorder = device.get("byteorder", ">")
+        self.wordorder = device.get("wordorder", ">")
+
+        # параметры, от которых зависит масштаб других параметров (DP)
+        self.dp_names = frozenset(dev.dp for dev in self.modbus.values() if dev.dp)
+        self._commands: CommandTable | None = None
+
+    def __repr__(self) -> str:
+        """Строковое представление таблицы."""
+
+        return f"DeviceTable(owen={len(self.owen)}, modbus={len(self.modbus)})"
+
+    @property
+    def commands(self) -> CommandTable:
+        """Таблица hash-кодов параметров протокола ОВЕН (строится при первом
+        обращении).
+        """
+
+        if self._commands is None:
+            self._commands = CommandTable(self.owen)
+        return self._commands
+
+
+DeviceLike = Union["DEVICE", DeviceTable]
+
+# преобразованные таблицы из реестра owen.device
+_registry: dict[int, tuple[DEVICE, DeviceTable]] = {}
+
+
+def device_table(device: DeviceLike) -> DeviceTable:
+    """Получение преобразованной таблицы для таблицы настроек.
+
+    Для таблиц из реестра owen.device возвращается общая таблица, остальные
+    словари преобразуются заново, поэтому их изменения учитываются при
+    следующем создании протокола.
+    """
+
+    if isinstance(device, DeviceTable):
+        return device
+
+    entry = _registry.get(id(device))
+    if entry is not None and entry[0] is device:
+        return entry[1]
+
+    table = DeviceTable(device)
+    if _loaded.get(id(device)) is device:
+        _registry[id(device)] = (device, table)
+    return table
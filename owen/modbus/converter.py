@@ -4,89 +4,107 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, TypedDict
+from functools import lru_cache
+from struct import Struct, pack
+from typing import TYPE_CHECKING, Any, Callable, TypedDict
 
 if TYPE_CHECKING:
-    from pymodbus.payload import BinaryPayloadBuilder, BinaryPayloadDecoder
+    from collections.abc import Sequence
 
 
 class TYPE(TypedDict):
     """Параметры типов для MODBUS_TYPE."""
 
-    pack: Callable[[BinaryPayloadBuilder, int | float | str], None]
-    unpack: Callable[[BinaryPayloadDecoder], int | float | str]
+    format: str
+    convert: Callable[[Any], int | float | str]
     size: int
 
 
+# format - формат struct значения (для строк - длина строки в байтах),
+# convert - приведение значения перед упаковкой, size - количество регистров
 MODBUS_TYPE: dict[str, TYPE] = {
-    "U8": {
-        "pack": lambda builder, value: builder.add_16bit_uint(int(value)),
-        "unpack": lambda decoder: decoder.decode_16bit_uint(),
-        "size": 1,
-    },
-    "I8": {
-        "pack": lambda builder, value: builder.add_16bit_int(int(value)),
-        "unpack": lambda decoder: decoder.decode_16bit_int(),
-        "size": 1,
-    },
-    "U16": {
-        "pack": lambda builder, value: builder.add_16bit_uint(int(value)),
-        "unpack": lambda decoder: decoder.decode_16bit_uint(),
-        "size": 1,
-    },
-    "I16": {
-        "pack": lambda builder, value: builder.add_16bit_int(int(value)),
-        "unpack": lambda decoder: decoder.decode_16bit_int(),
-        "size": 1,
-    },
-    "U32": {
-        "pack": lambda builder, value: builder.add_32bit_uint(int(value)),
-        "unpack": lambda decoder: decoder.decode_32bit_uint(),
-        "size": 2,
-    },
-    "I32": {
-        "pack": lambda builder, value: builder.add_32bit_int(int(value)),
-        "unpack": lambda decoder: decoder.decode_32bit_int(),
-        "size": 2,
-    },
-    "F32": {
-        "pack": lambda builder, value: builder.add_32bit_float(float(value)),
-        "unpack": lambda decoder: decoder.decode_32bit_float(),
-        "size": 2,
-    },
-    "STR6": {
-        "pack": lambda builder, value: builder.add_string(str(value)),
-        "unpack": lambda decoder: decoder.decode_string(6).decode("cp1251"),
-        "size": 3,
-    },
-    "STR8": {
-        "pack": lambda builder, value: builder.add_string(str(value)),
-        "unpack": lambda decoder: decoder.decode_string(8).decode("cp1251"),
-        "size": 4,
-    },
-    "STR16": {
-        "pack": lambda builder, value: builder.add_string(str(value)),
-        "unpack": lambda decoder: decoder.decode_string(16).decode("cp1251"),
-        "size": 8,
-    },
-    "STR32": {
-        "pack": lambda builder, value: builder.add_string(str(value)),
-        "unpack": lambda decoder: decoder.decode_string(32).decode("cp1251"),
-        "size": 16,
-    },
-    "STR64": {
-        "pack": lambda builder, value: builder.add_string(str(value)),
-        "unpack": lambda decoder: decoder.decode_string(64).decode("cp1251"),
-        "size": 4,
-    },
-    "STR128": {
-        "pack": lambda builder, value: builder.add_string(str(value)),
-        "unpack": lambda decoder: decoder.decode_string(128).decode("cp1251"),
-        "size": 8,
-    },
-    "STR256": {
-        "pack": lambda builder, value: builder.add_string(str(value)),
-        "unpack": lambda decoder: decoder.decode_string(256).decode("cp1251"),
-        "size": 16,
-    },
+    "U8": {"format": "H", "convert": int, "size": 1},
+    "I8": {"format": "h", "convert": int, "size": 1},
+    "U16": {"format": "H", "convert": int, "size": 1},
+    "I16": {"format": "h", "convert": int, "size": 1},
+    "U32": {"format": "I", "convert": int, "size": 2},
+    "I32": {"format": "i", "convert": int, "size": 2},
+    "F32": {"format": "f", "convert": float, "size": 2},
+    "STR6": {"format": "6s", "convert": str, "size": 3},
+    "STR8": {"format": "8s", "convert": str, "size": 4},
+    "STR16": {"format": "16s", "convert": str, "size": 8},
+    "STR32": {"format": "32s", "convert": str, "size": 16},
+    "STR64": {"format": "64s", "convert": str, "size": 4},
+    "STR128": {"format": "128s", "convert": str, "size": 8},
+    "STR256": {"format": "256s", "convert": str, "size": 16},
 }
+
+
+class Codec:
+    """Упаковка и распаковка значений одного типа в регистры Modbus с заданным
+    порядком байт в регистре и порядком регистров.
+    """
+
+    def __init__(self, frmt: str, byteorder: str, wordorder: str) -> None:
+        """Подготовка структур упаковки для типа данных."""
+
+        info = MODBUS_TYPE[frmt]
+        self.size = info["size"]
+        self.convert = info["convert"]
+        self.string = info["format"].endswith("s")
+
+        if self.string:     # строки передаются без перестановки байт
+            self.length = min(int(info["format"][:-1]), self.size * 2)
+            byteorder = wordorder = ">"
+
+        self._value = Struct(">" + info["format"])
+        self._words = Struct(f"{byteorder}{self.size}H")
+        self._registers = Struct(f">{self.size}H")
+        self._reverse = wordorder == "<" and self.size > 1
+        self._direct = byteorder == ">" and not self._reverse and not self.string
+
+    def decode(self, registers: Sequence[int]) -> int | float | str:
+        """Распаковка значения из списка регистров."""
+
+        registers = registers[:self.size]
+        if self._reverse:
+            registers = registers[::-1]
+
+        data = self._words.pack(*registers)
+        if self.string:
+            return data[:self.length].decode("cp1251")
+        return self._value.unpack(data)[0]
+
+    def decode_from(self, buffer: bytes | memoryview, offset: int) -> int | float | str:
+        """Распаковка значения из буфера регистров (big-endian) по смещению в
+        регистрах.
+        """
+
+        if self._direct:
+            return self._value.unpack_from(buffer, offset * 2)[0]
+        return self.decode(self._registers.unpack_from(buffer, offset * 2))
+
+    def encode(self, value: float | str) -> list[int]:
+        """Упаковка значения в список регистров."""
+
+        value = self.convert(value)
+        if self.string:
+            data = str(value).encode()
+            data += b"\x00" * (len(data) % 2)
+            return list(Struct(f">{len(data) // 2}H").unpack(data))
+
+        registers = list(self._words.unpack(self._value.pack(value)))
+        return registers[::-1] if self._reverse else registers
+
+
+@lru_cache(maxsize=None)
+def get_codec(frmt: str, byteorder: str, wordorder: str) -> Codec:
+    """Получение общего объекта упаковки для типа и порядка байт."""
+
+    return Codec(frmt, byteorder, wordorder)
+
+
+def pack_registers(registers: Sequence[int]) -> bytes:
+    """Преобразование списка регистров в буфер (big-endian)."""
+
+    return pack(f">{len(registers)}H", *registers)
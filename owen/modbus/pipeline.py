@@ -0,0 +1,190 @@
+#! /usr/bin/env python3
+
+"""Асинхронный транспорт MODBUS TCP с конвейерной передачей запросов.
+
+Несколько транзакций отправляются по одному соединению без ожидания ответов на
+предыдущие. Ответы сопоставляются с запросами по идентификатору транзакции
+MBAP, поэтому могут приходить в любом порядке. Для каждого запроса действует
+собственный тайм-аут, ответы на запросы с истекшим тайм-аутом отбрасываются.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+from struct import Struct, pack
+from typing import NamedTuple, cast
+
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+
+from owen.bus import AsyncSingleFlight
+
+MBAP = Struct(">HHHB")          # транзакция, протокол, длина, адрес устройства
+READ_HOLDING_REGISTERS = 0x03
+WRITE_MULTIPLE_REGISTERS = 0x10
+
+
+class ModbusResponse(NamedTuple):
+    """Ответ устройства на запрос MODBUS."""
+
+    function_code: int
+    registers: list[int]
+    exception_code: int = 0
+
+    def isError(self) -> bool:
+        """Проверка ответа на ошибку (совместимо с ответами pymodbus)."""
+
+        return self.function_code > 0x80
+
+
+def decode_pdu(pdu: bytes) -> ModbusResponse:
+    """Разбор PDU ответа."""
+
+    function_code = pdu[0]
+    if function_code > 0x80:
+        return ModbusResponse(function_code, [], pdu[1] if len(pdu) > 1 else 0)
+    if function_code == READ_HOLDING_REGISTERS:
+        count = min(pdu[1], len(pdu) - 2) // 2
+        return ModbusResponse(function_code, list(Struct(f">{count}H").unpack_from(pdu, 2)))
+    return ModbusResponse(function_code, [])
+
+
+class AsyncModbusPipelineTransport(asyncio.Protocol):
+    """Класс асинхронного транспорта для взаимодействия с устройствами по
+    протоколу MODBUS TCP с несколькими одновременными транзакциями.
+
+    Подходит для шлюзов MODBUS TCP/RTU и удаленных сетей, где пропускная
+    способность ограничена временем прохождения запроса, а не скоростью канала.
+    Для устройств, не принимающих новый запрос до отправки ответа на
+    предыдущий, следует задать max_pending=1.
+    """
+
+    def __init__(self, host: str, port: int = 502,
+                       timeout: float = 1.0,
+                       max_pending: int = 16) -> None:
+        """Инициализация класса асинхронного транспорта MODBUS TCP.
+
+        Args:
+            timeout: Время ожидания ответа на каждый запрос, с
+            max_pending: Максимальное количество транзакций без ответа
+
+        """
+
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.max_pending = max_pending
+        self.socket: asyncio.Transport | None = None
+        self.late_replies = 0
+        self.flights = AsyncSingleFlight()
+
+        self._buffer = bytearray()
+        self._pending: dict[int, tuple[asyncio.Future[ModbusResponse], int, int]] = {}
+        self._slots: asyncio.Semaphore | None = None
+        self._tid = 0
+
+    async def __aenter__(self) -> AsyncModbusPipelineTransport:
+        """Подключение при входе в блок async with."""
+
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Закрытие соединения при выходе из блока async with."""
+
+        self.close()
+
+    async def connect(self) -> None:
+        """Подключение к устройству или шлюзу."""
+
+        loop = asyncio.get_running_loop()
+        await loop.create_connection(lambda: self, self.host, self.port)
+
+    def close(self) -> None:
+        """Закрытие соединения."""
+
+        if self.socket is not None:
+            self.socket.close()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Настройка соединения после подключения."""
+
+        sock = transport.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.socket = cast(asyncio.Transport, transport)
+        self._buffer.clear()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Завершение ожидающих транзакций при разрыве соединения."""
+
+        self.socket = None
+        for future, _, _ in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionException(f"Connection lost: {exc}"))
+        self._pending.clear()
+
+    def data_received(self, data: bytes) -> None:
+        """Выделение ответов из потока и передача их ожидающим транзакциям."""
+
+        buffer = self._buffer
+        buffer += data
+        while len(buffer) >= MBAP.size:
+            tid, _, length, unit = MBAP.unpack_from(buffer)
+            size = 6 + length
+            if len(buffer) < size:
+                break
+
+            pdu = bytes(buffer[MBAP.size:size])
+            del buffer[:size]
+
+            future, request_unit, function_code = self._pending.pop(tid, (None, 0, 0))
+            if future is None or future.done():
+                self.late_replies += 1
+            elif not pdu or unit != request_unit or pdu[0] & 0x7F != function_code:
+                future.set_exception(ModbusIOException(f"Unexpected response to transaction {tid}"))
+            else:
+                future.set_result(decode_pdu(pdu))
+
+    def next_tid(self) -> int:
+        """Получение свободного идентификатора транзакции."""
+
+        while True:
+            self._tid = self._tid % 0xFFFF + 1
+            if self._tid not in self._pending:
+                return self._tid
+
+    async def execute(self, unit: int, pdu: bytes) -> ModbusResponse:
+        """Отправка запроса и ожидание ответа на него."""
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+
+        async with self._slots:
+            if self.socket is None:
+                msg = f"Not connected to {self.host}:{self.port}"
+                raise ConnectionException(msg)
+
+            tid = self.next_tid()
+            future = asyncio.get_running_loop().create_future()
+            self._pending[tid] = (future, unit, pdu[0])
+            self.socket.write(MBAP.pack(tid, 0, len(pdu) + 1, unit) + pdu)
+            try:
+                return await asyncio.wait_for(future, self.timeout)
+            except asyncio.TimeoutError:
+                msg = f"No response to transaction {tid} (unit {unit})"
+                raise ModbusIOException(msg) from None
+            finally:
+                self._pending.pop(tid, None)
+
+    async def read(self, address: int, count: int, unit: int) -> ModbusResponse:
+        """Чтение регистров хранения (функция 0x03)."""
+
+        return await self.execute(unit, pack(">BHH", READ_HOLDING_REGISTERS, address, count))
+
+    async def write(self, address: int, payload: list[int], unit: int) -> ModbusResponse:
+        """Запись регистров хранения (функция 0x10)."""
+
+        count = len(payload)
+        pdu = pack(f">BHHB{count}H", WRITE_MULTIPLE_REGISTERS, address, count, 2 * count, *payload)
+        return await self.execute(unit, pdu)
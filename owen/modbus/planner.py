@@ -0,0 +1,151 @@
+#! /usr/bin/env python3
+
+"""Объединение запросов чтения и записи смежных регистров Modbus в блоки."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Hashable, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from owen.device._table import ModbusParamInfo
+
+MAX_COUNT = 125         # максимальное количество регистров в одном запросе (FC3)
+MAX_WRITE_COUNT = 123   # максимальное количество регистров в одном запросе (FC16)
+
+
+class BlockItem(NamedTuple):
+    """Параметр в составе блока регистров."""
+
+    key: Hashable
+    dev: ModbusParamInfo
+    param_index: int | None
+    offset: int
+    registers: int
+
+
+class ReadBlock:
+    """Блок смежных регистров, читаемый одним запросом."""
+
+    def __init__(self, address: int) -> None:
+        """Инициализация пустого блока с заданным начальным адресом."""
+
+        self.address = address
+        self.count = 0
+        self.items: list[BlockItem] = []
+
+    def __repr__(self) -> str:
+        """Строковое представление блока."""
+
+        return f"ReadBlock(address={self.address}, count={self.count}, items={len(self.items)})"
+
+    def add(self, key: Hashable, dev: ModbusParamInfo, index: int | None, address: int, count: int) -> None:
+        """Добавление параметра в блок."""
+
+        offset = address - self.address
+        self.items.append(BlockItem(key, dev, index, offset, count))
+        self.count = max(self.count, offset + count)
+
+
+def plan_reads(params: Iterable[tuple[Hashable, ModbusParamInfo, int | None]],
+               max_count: int = MAX_COUNT, max_gap: int = 0) -> list[ReadBlock]:
+    """Построение минимального набора запросов чтения.
+
+    Args:
+        params: Список (ключ, описание параметра, индекс)
+        max_count: Максимальное количество регистров в одном запросе
+        max_gap: Максимальное количество неиспользуемых регистров между
+                 параметрами, при котором они читаются одним запросом
+
+    Returns:
+        Список блоков в порядке возрастания адресов
+
+    """
+
+    entries = sorted(((dev.indexes[index], dev.registers, key, dev, index)
+                      for key, dev, index in params), key=lambda entry: entry[:2])
+
+    blocks: list[ReadBlock] = []
+    for address, count, key, dev, index in entries:
+        block = blocks[-1] if blocks else None
+        if block is None or address - (block.address + block.count) > max_gap or \
+           address + count - block.address > max_count:
+            block = ReadBlock(address)
+            blocks.append(block)
+        block.add(key, dev, index, address, count)
+
+    return blocks
+
+
+class WriteBlock:
+    """Блок смежных регистров, записываемый одним запросом."""
+
+    def __init__(self, address: int) -> None:
+        """Инициализация пустого блока с заданным начальным адресом."""
+
+        self.address = address
+        self.registers: list[int] = []
+        self.keys: list[Hashable] = []
+        self.sizes: list[int] = []
+
+    def __repr__(self) -> str:
+        """Строковое представление блока."""
+
+        return f"WriteBlock(address={self.address}, count={self.count}, items={len(self.keys)})"
+
+    @property
+    def count(self) -> int:
+        """Количество регистров в блоке."""
+
+        return len(self.registers)
+
+    def add(self, key: Hashable, registers: list[int]) -> None:
+        """Добавление значения параметра в конец блока."""
+
+        self.keys.append(key)
+        self.sizes.append(len(registers))
+        self.registers += registers
+
+    def split(self) -> list[WriteBlock]:
+        """Разделение блока на блоки отдельных параметров."""
+
+        blocks = []
+        offset = 0
+        for key, count in zip(self.keys, self.sizes):
+            block = WriteBlock(self.address + offset)
+            block.add(key, self.registers[offset:offset + count])
+            blocks.append(block)
+            offset += count
+        return blocks
+
+
+def plan_writes(params: Iterable[tuple[Hashable, int, list[int]]],
+                max_count: int = MAX_WRITE_COUNT) -> list[WriteBlock]:
+    """Построение минимального набора запросов записи.
+
+    В отличие от чтения, блок записи не может содержать разрывов: в один
+    запрос объединяются только значения, занимающие непрерывный диапазон
+    регистров.
+
+    Args:
+        params: Список (ключ, адрес, значения регистров)
+        max_count: Максимальное количество регистров в одном запросе
+
+    Returns:
+        Список блоков в порядке возрастания адресов
+
+    """
+
+    entries = sorted(params, key=lambda entry: entry[1])
+
+    blocks: list[WriteBlock] = []
+    for key, address, registers in entries:
+        block = blocks[-1] if blocks else None
+        if block is None or address != block.address + block.count or \
+           block.count + len(registers) > max_count:
+            block = WriteBlock(address)
+            blocks.append(block)
+        block.add(key, registers)
+
+    return blocks
@@ -0,0 +1,175 @@
+#! /usr/bin/env python3
+# mypy: disable-error-code="explicit-any"
+
+"""Пул соединений MODBUS TCP, общих для транспортов с одним адресом."""
+
+from __future__ import annotations
+
+import logging
+import random
+import socket
+from contextlib import contextmanager
+from threading import Condition, Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable
+
+from pymodbus.client import ModbusTcpClient
+from pymodbus.exceptions import ConnectionException, ModbusException
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_logger = logging.getLogger(__name__)
+_logger.addHandler(logging.NullHandler())
+
+
+class HostPool:
+    """Соединения с одним адресом (host, port)."""
+
+    def __init__(self, host: str, port: int) -> None:
+        """Инициализация пустого набора соединений."""
+
+        self.host = host
+        self.port = port
+        self.idle: list[ModbusTcpClient] = []
+        self.created = 0
+        self.failures = 0
+        self.next_attempt = 0.0
+        self.condition = Condition(Lock())
+
+
+class ConnectionPool:
+    """Пул соединений MODBUS TCP.
+
+    Соединения с одним адресом (host, port) используются совместно всеми
+    транспортами пула. Каждое соединение одновременно выдается только одному
+    потоку, количество соединений с одним адресом ограничено max_connections.
+    Повторное подключение после ошибки выполняется не раньше, чем через
+    экспоненциально растущую задержку со случайной составляющей, что исключает
+    одновременное переподключение всех клиентов после сбоя сети.
+    """
+
+    def __init__(self, max_connections: int = 1,
+                       backoff: float = 0.5,
+                       max_backoff: float = 30.0,
+                       keepalive: bool = True,
+                       factory: Callable[..., ModbusTcpClient] = ModbusTcpClient,
+                       **kwargs: Any) -> None:
+        """Инициализация пула соединений.
+
+        Args:
+            max_connections: Максимальное количество соединений с одним адресом
+            backoff: Начальная задержка повторного подключения, с
+            max_backoff: Максимальная задержка повторного подключения, с
+            keepalive: Включение TCP keepalive для соединений
+            factory: Класс клиента pymodbus
+            kwargs: Параметры клиента (timeout, retries и т.д.)
+
+        """
+
+        self.max_connections = max_connections
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.keepalive = keepalive
+        self.factory = factory
+        self.kwargs = kwargs
+        self._hosts: dict[tuple[str, int], HostPool] = {}
+        self._lock = Lock()
+
+    def host(self, host: str, port: int) -> HostPool:
+        """Получение набора соединений с адресом."""
+
+        with self._lock:
+            if (host, port) not in self._hosts:
+                self._hosts[host, port] = HostPool(host, port)
+            return self._hosts[host, port]
+
+    def configure(self, client: ModbusTcpClient) -> None:
+        """Настройка сокета подключенного клиента."""
+
+        sock = getattr(client, "socket", None)
+        if not isinstance(sock, socket.socket):
+            return
+
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self.keepalive:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    def connect(self, pool: HostPool, client: ModbusTcpClient) -> None:
+        """Подключение клиента с учетом задержки после предыдущих ошибок."""
+
+        with pool.condition:
+            delay = pool.next_attempt - monotonic()
+        if delay > 0:
+            msg = f"Reconnect to {pool.host}:{pool.port} is postponed for {delay:.1f} s"
+            raise ConnectionException(msg)
+
+        if client.connect():
+            self.configure(client)
+            with pool.condition:
+                pool.failures = 0
+                pool.next_attempt = 0.0
+            return
+
+        with pool.condition:
+            pool.failures += 1
+            delay = min(self.max_backoff, self.backoff * 2 ** (pool.failures - 1))
+            delay *= random.uniform(0.5, 1.0)
+            pool.next_attempt = monotonic() + delay
+        _logger.debug("Connection to %s:%s failed, next attempt in %.1f s", pool.host, pool.port, delay)
+        msg = f"Failed to connect to {pool.host}:{pool.port}"
+        raise ConnectionException(msg)
+
+    @contextmanager
+    def connection(self, host: str, port: int = 502) -> Iterator[ModbusTcpClient]:
+        """Получение соединения в монопольное пользование на время блока with.
+
+        Если свободных соединений нет и их количество достигло
+        max_connections, поток ожидает освобождения соединения.
+        """
+
+        pool = self.host(host, port)
+        with pool.condition:
+            while not pool.idle and pool.created >= self.max_connections:
+                pool.condition.wait()
+            if pool.idle:
+                client = pool.idle.pop()
+            else:
+                client = self.factory(host=host, port=port, **self.kwargs)
+                pool.created += 1
+
+        try:
+            if not client.connected:
+                self.connect(pool, client)
+            yield client
+        except ModbusException:
+            client.close()
+            raise
+        finally:
+            with pool.condition:
+                pool.idle.append(client)
+                pool.condition.notify()
+
+    def close(self) -> None:
+        """Закрытие всех свободных соединений."""
+
+        with self._lock:
+            pools = list(self._hosts.values())
+        for pool in pools:
+            with pool.condition:
+                for client in pool.idle:
+                    client.close()
+
+
+_default_pool: ConnectionPool | None = None
+_default_lock = Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Получение общего пула соединений процесса."""
+
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = ConnectionPool()
+        return _default_pool
@@ -4,85 +4,489 @@
 
 from __future__ import annotations
 
+import asyncio
 from operator import mul, truediv
-from typing import TYPE_CHECKING, Callable
+from struct import error
+from time import monotonic
+from typing import TYPE_CHECKING, Callable, cast
 
-from pymodbus.payload import BinaryPayloadBuilder, BinaryPayloadDecoder
+from pymodbus.exceptions import ModbusException
 
+from owen.device._table import device_table
 from owen.exception import OwenError
-from owen.modbus.converter import MODBUS_TYPE
+from owen.modbus.converter import Codec, get_codec, pack_registers
+from owen.modbus.planner import MAX_COUNT, MAX_WRITE_COUNT, ReadBlock, WriteBlock, plan_reads, plan_writes
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Mapping
+
     from pymodbus.pdu import ModbusPDU
 
-    from owen.device._types import DEVICE, MODBUS
+    from owen.device._table import DeviceLike, ModbusParamInfo
+    from owen.modbus.pipeline import ModbusResponse
 
 
-class Modbus:
-    """Класс, описывающий протокол Modbus."""
+class ModbusParam:
+    """Подготовленный параметр протокола Modbus.
 
-    def __init__(self, unit: int, device: DEVICE, addr_len_8: bool) -> None:
-        """Инициализация класса, описывающего протокол Modbus."""
+    Адрес, количество регистров, объект упаковки и масштаб определяются один
+    раз при создании. Значение DP по-прежнему берется из кэша протокола.
+    """
 
-        self.unit = unit
-        self.device = device["modbus"]
-        self.byteorder = device["byteorder"]
-        self.wordorder = device["wordorder"]
+    __slots__ = ("address", "codec", "count", "dp", "index", "name", "protocol", "scale")
 
-    def read(self, address: int, count: int, unit: int) -> ModbusPDU:
-        """Чтение данных."""
+    def __init__(self, protocol: Modbus, name: str, index: int | None) -> None:
+        """Подготовка параметра к чтению и записи."""
 
-        raise NotImplementedError
+        dev, index = protocol.check_index(name, index)
+        self.protocol = protocol
+        self.name = name
+        self.index = index
+        self.address = dev.indexes[index]
+        self.count = dev.registers
+        self.codec = protocol.codec(dev)
+        self.dp = dev.dp
+        self.scale = 10.0**dev.precision if dev.precision else None
 
-    def write(self, address: int, payload: list[int], unit: int) -> ModbusPDU:
-        """Запись данных."""
+    def __repr__(self) -> str:
+        """Строковое представление параметра."""
 
-        raise NotImplementedError
+        return f"ModbusParam(name={self.name!r}, index={self.index}, address={self.address}, count={self.count})"
+
+    def read(self) -> float | str:
+        """Чтение значения параметра."""
+
+        protocol = self.protocol
+        result = protocol.read(self.address, self.count, protocol.unit)
+        protocol.check_error(result)
+        value = self.codec.decode(result.registers)
+        if isinstance(value, str):
+            return value
+
+        if self.dp:
+            value /= 10.0**protocol.get_dp(self.dp, self.index)
+        if self.scale:
+            value /= self.scale
+        return value
+
+    def write(self, value: float | str | None) -> bool:
+        """Запись значения параметра."""
+
+        protocol = self.protocol
+        if value is None:
+            msg = f"'{self.name}' requires a value"
+            raise OwenError(msg)
+        if isinstance(value, str):
+            if self.dp or self.scale:
+                msg = f"'{self.name}' requires a numeric value"
+                raise TypeError(msg)
+        else:
+            if self.dp:
+                value *= 10.0**protocol.get_dp(self.dp, self.index)
+            if self.scale:
+                value *= self.scale
+
+        result = protocol.write(self.address, self.codec.encode(value), protocol.unit)
+        protocol.invalidate_dp(protocol.unit, self.name, self.index)
+        return protocol.check_error(result)
+
+
+class ModbusCore:
+    """Общая часть протокола Modbus: планирование запросов, упаковка и
+    пересчет значений без обмена данными с устройством.
+    """
+
+    max_count = MAX_COUNT   # максимальное количество регистров в одном запросе
+    max_write_count = MAX_WRITE_COUNT   # то же для запроса записи
+    max_gap = 0             # допустимый разрыв между параметрами при групповом чтении
+    # Время хранения значений DP в кэше, с (0 - DP читается при каждом обращении).
+    # Кэш принадлежит экземпляру: изменение DP другим экземпляром или с панели
+    # прибора становится видно только по истечении dp_ttl.
+    dp_ttl = 0.0
+
+    def __init__(self, unit: int, device: DeviceLike, addr_len_8: bool) -> None:
+        """Инициализация общей части протокола Modbus."""
+
+        self.unit = unit
+        table = device_table(device)
+        self.device = table.modbus
+        self.byteorder = table.byteorder
+        self.wordorder = table.wordorder
+        self._dp: dict[tuple[int, str, int | None], tuple[float, int]] = {}
 
     @staticmethod
-    def check_error(retcode: ModbusPDU) -> bool:
+    def check_error(retcode: ModbusPDU | ModbusResponse) -> bool:
         """Проверка возвращаемого значения на ошибку."""
 
         if retcode.isError():
             raise OwenError(retcode)
         return True
 
-    def _read(self, dev: MODBUS, index: int | None) -> float | str:
-        """Чтение данных из регистра Modbus."""
+    def codec(self, dev: ModbusParamInfo) -> Codec:
+        """Получение объекта упаковки для типа параметра."""
 
-        count = MODBUS_TYPE[dev["type"]]["size"]
-        result = self.read(dev["index"][index], count, self.unit)
-        self.check_error(result)
-        decoder = BinaryPayloadDecoder.fromRegisters(registers=result.registers,
-                                                     byteorder=self.byteorder,
-                                                     wordorder=self.wordorder)
-        return MODBUS_TYPE[dev["type"]]["unpack"](decoder)
+        return get_codec(dev.type, self.byteorder, self.wordorder)
+
+    def decode(self, dev: ModbusParamInfo, registers: list[int]) -> float | str:
+        """Распаковка значения параметра из списка регистров."""
+
+        return self.codec(dev).decode(registers)
+
+    def decode_block(self, block: ReadBlock, registers: list[int],
+                     ) -> dict[Hashable, float | str | OwenError]:
+        """Распаковка параметров блока из прочитанных регистров."""
+
+        buffer = pack_registers(registers)
+        values: dict[Hashable, float | str | OwenError] = {}
+        for item in block.items:
+            try:
+                values[item.key] = self.codec(item.dev).decode_from(buffer, item.offset)
+            except (error, TypeError, ValueError) as err:
+                values[item.key] = OwenError(err)
+        return values
+
+    def dp_expired(self, name: str, index: int | None) -> bool:
+        """Проверка отсутствия актуального значения DP в кэше."""
+
+        entry = self._dp.get((self.unit, name, index))
+        return entry is None or monotonic() - entry[0] >= self.dp_ttl
+
+    def store_dp(self, name: str, index: int | None, value: float | str) -> None:
+        """Сохранение прочитанного значения DP в кэше."""
+
+        self._dp[self.unit, name, index] = (monotonic(), int(value))
 
-    def modify_value(self, func: Callable[[float, float], float], dev: MODBUS,
-                           index: int | None, value: float) -> float:
-        """Преобразование значения к нужной точности."""
+    def invalidate_dp(self, unit: int, name: str, index: int | None) -> None:
+        """Удаление значения DP из кэша (например, после записи DP)."""
 
-        if dev["dp"]:
-            dp_dev = self.device[dev["dp"]]
-            dp = self._read(dp_dev, index)
-            value = func(value, 10.0**int(dp))
+        self._dp.pop((unit, name, index), None)
 
-        prec = dev["precision"]
+    def plan_dp(self, items: Iterable[tuple[str, int | None]]) -> list[ReadBlock]:
+        """Построение запросов чтения группы значений DP."""
+
+        params = [((name, index), self.device[name], index) for name, index in items]
+        return plan_reads(params, self.max_count, self.max_gap)
+
+    def store_dp_values(self, values: Mapping[Hashable, float | str | OwenError],
+                        ) -> dict[tuple[str, int | None], int | OwenError]:
+        """Сохранение в кэше прочитанных значений DP (ключи - (название, индекс))."""
+
+        result: dict[tuple[str, int | None], int | OwenError] = {}
+        for key, value in values.items():
+            name, index = cast("tuple[str, int | None]", key)
+            if not isinstance(value, OwenError):
+                self.store_dp(name, index, value)
+                value = int(value)
+            result[name, index] = value
+        return result
+
+    def cached_dp(self, name: str, index: int | None) -> int | None:
+        """Получение значения DP из кэша (None - значение устарело)."""
+
+        if not self.dp_ttl or self.dp_expired(name, index):
+            return None
+        return self._dp[self.unit, name, index][1]
+
+    @staticmethod
+    def scale_value(func: Callable[[float, float], float], dev: ModbusParamInfo,
+                    value: float | str, dp: int | None) -> float | str:
+        """Преобразование значения к нужной точности при известном значении DP."""
+
+        if isinstance(value, str):
+            if dev.dp or dev.precision:
+                msg = f"'{dev.name}' requires a numeric value"
+                raise TypeError(msg)
+            return value
+
+        if dev.dp and dp is not None:
+            value = func(value, 10.0**dp)
+
+        prec = dev.precision
         return func(value, 10.0**prec) if prec else value
 
-    def check_index(self, name: str, index: int | None) -> tuple[MODBUS, int | None]:
+    def check_index(self, name: str, index: int | None) -> tuple[ModbusParamInfo, int | None]:
         """Проверка индекса."""
 
         dev = self.device[name]
 
         if not index:
-            index = None if None in dev["index"] else 0
-        if index not in dev["index"]:
+            index = None if None in dev.indexes else 0
+        if index not in dev.indexes:
             msg = f"'{name}' does not support index '{index}'"
             raise OwenError(msg)
+        if dev.dp and index not in self.device[dev.dp].indexes:
+            msg = f"'{dev.dp}' does not support index '{index}' of '{name}'"
+            raise OwenError(msg)
 
         return dev, index
 
+    def resolve_many(self, items: Iterable[tuple[str, int | None]],
+                     ) -> tuple[dict[tuple[str, int | None], OwenError],
+                                dict[tuple[str, int | None], tuple[ModbusParamInfo, list[tuple[str, int | None]]]]]:
+        """Проверка группы параметров.
+
+        Returns:
+            Ошибки неизвестных параметров и индексов, а также словарь
+            {(название, индекс): (описание параметра, исходные ключи)}, в
+            котором повторяющиеся параметры объединены
+
+        """
+
+        errors: dict[tuple[str, int | None], OwenError] = {}
+        plan: dict[tuple[str, int | None], tuple[ModbusParamInfo, list[tuple[str, int | None]]]] = {}
+
+        for name, index in items:
+            try:
+                dev, idx = self.check_index(name, index)
+            except KeyError:
+                errors[name, index] = OwenError(f"Unknown parameter '{name}'")
+            except OwenError as err:
+                errors[name, index] = err
+            else:
+                plan.setdefault((name, idx), (dev, []))[1].append((name, index))
+
+        return errors, plan
+
+    def plan_get_many(self, plan: dict[tuple[str, int | None], tuple[ModbusParamInfo, list[tuple[str, int | None]]]],
+                      ) -> tuple[dict[tuple[str, int | None], int], list[ReadBlock]]:
+        """Построение запросов чтения группы параметров.
+
+        Значения DP, от которых зависят параметры и которых нет в кэше,
+        читаются вместе с параметрами (ключ (None, название, индекс)).
+
+        Returns:
+            Значения DP из кэша и список блоков чтения
+
+        """
+
+        dp_cached: dict[tuple[str, int | None], int] = {}
+        dp_items: set[tuple[str, int | None]] = set()
+        for key, (dev, _) in plan.items():
+            if dev.dp:
+                value = self.cached_dp(dev.dp, key[1])
+                if value is None:
+                    dp_items.add((dev.dp, key[1]))
+                else:
+                    dp_cached[dev.dp, key[1]] = value
+
+        params: list[tuple[Hashable, ModbusParamInfo, int | None]]
+        params = [(key, dev, key[1]) for key, (dev, _) in plan.items()]
+        params += [((None, *item), self.device[item[0]], item[1]) for item in dp_items]
+        return dp_cached, plan_reads(params, self.max_count, self.max_gap)
+
+    def finish_get_many(self, result: dict[tuple[str, int | None], float | str | OwenError],
+                        plan: dict[tuple[str, int | None], tuple[ModbusParamInfo, list[tuple[str, int | None]]]],
+                        dp_cached: dict[tuple[str, int | None], int],
+                        values: dict[Hashable, float | str | OwenError],
+                        ) -> dict[tuple[str, int | None], float | str | OwenError]:
+        """Пересчет прочитанных значений группы параметров с учетом DP."""
+
+        dp_values: dict[tuple[str, int | None], int | OwenError] = dict(dp_cached)
+        dp_values.update(self.store_dp_values({key[1:]: value for key, value in values.items()
+                                               if isinstance(key, tuple) and key[0] is None}))
+
+        for key, (dev, keys) in plan.items():
+            value = values[key]
+            dp = dp_values[dev.dp, key[1]] if dev.dp else None
+            if not isinstance(value, OwenError):
+                value = dp if isinstance(dp, OwenError) else self.scale_value(truediv, dev, value, dp)
+            result.update(dict.fromkeys(keys, value))
+
+        return result
+
+    def decode_raw(self, name: str, index: int | None, raw: bytes) -> float | str:
+        """Распаковка данных, прочитанных get_raw_many."""
+
+        dev, index = self.check_index(name, index)
+        dp = None
+        if dev.dp:
+            raw, dp = raw[:-1], int.from_bytes(raw[-1:], "big", signed=True)
+        value = self.codec(dev).decode_from(raw, 0)
+        return self.scale_value(truediv, dev, value, dp)
+
+    def plan_set_many(self, items: Mapping[tuple[str, int | None], float | str],
+                      plan: dict[tuple[str, int | None], tuple[ModbusParamInfo, list[tuple[str, int | None]]]],
+                      ) -> tuple[dict[tuple[str, int | None], float | str | OwenError], set[tuple[str, int | None]]]:
+        """Подготовка значений DP для записи группы параметров.
+
+        Returns:
+            Известные значения DP (записываемые в этой же группе или из кэша)
+            и значения DP, которые нужно прочитать
+
+        """
+
+        dp_values: dict[tuple[str, int | None], float | str | OwenError] = {}
+        dp_items: set[tuple[str, int | None]] = set()
+        for key, (dev, _) in plan.items():
+            if not dev.dp:
+                continue
+            dp_key = (dev.dp, key[1])
+            if dp_key in dp_values or dp_key in dp_items:
+                continue
+            if dp_key in plan:
+                dp_values[dp_key] = items[plan[dp_key][1][-1]]
+            elif (value := self.cached_dp(*dp_key)) is not None:
+                dp_values[dp_key] = value
+            else:
+                dp_items.add(dp_key)
+
+        return dp_values, dp_items
+
+    def pack_many(self, result: dict[tuple[str, int | None], bool | OwenError],
+                        items: Mapping[tuple[str, int | None], float | str],
+                        plan: dict[tuple[str, int | None], tuple[ModbusParamInfo, list[tuple[str, int | None]]]],
+                        dp_values: dict[tuple[str, int | None], float | str | OwenError],
+                        ) -> list[WriteBlock]:
+        """Пересчет и упаковка значений группы параметров в блоки записи."""
+
+        params: list[tuple[Hashable, int, list[int]]] = []
+        for key, (dev, keys) in plan.items():
+            try:
+                dp = dp_values[dev.dp, key[1]] if dev.dp else None
+                if isinstance(dp, OwenError):
+                    raise dp
+                value = self.scale_value(mul, dev, items[keys[-1]], None if dp is None else int(dp))
+                params.append((key, dev.indexes[key[1]], self.codec(dev).encode(value)))
+            except OwenError as err:
+                result.update(dict.fromkeys(keys, err))
+            except (error, TypeError, ValueError) as err:
+                result.update(dict.fromkeys(keys, OwenError(err)))
+
+        return plan_writes(params, self.max_write_count)
+
+    def finish_set_many(self, result: dict[tuple[str, int | None], bool | OwenError],
+                        plan: dict[tuple[str, int | None], tuple[ModbusParamInfo, list[tuple[str, int | None]]]],
+                        values: dict[Hashable, bool | OwenError],
+                        ) -> dict[tuple[str, int | None], bool | OwenError]:
+        """Сбор результатов записи группы параметров."""
+
+        for key, (_, keys) in plan.items():
+            if key in values:
+                result.update(dict.fromkeys(keys, values[key]))
+
+        for name, index in plan:
+            self.invalidate_dp(self.unit, name, index)
+
+        return result
+
+
+class Modbus(ModbusCore):
+    """Класс, описывающий протокол Modbus."""
+
+    def read(self, address: int, count: int, unit: int) -> ModbusPDU:
+        """Чтение данных."""
+
+        raise NotImplementedError
+
+    def write(self, address: int, payload: list[int], unit: int) -> ModbusPDU:
+        """Запись данных."""
+
+        raise NotImplementedError
+
+    def _read(self, dev: ModbusParamInfo, index: int | None) -> float | str:
+        """Чтение данных из регистра Modbus."""
+
+        count = dev.registers
+        result = self.read(dev.indexes[index], count, self.unit)
+        self.check_error(result)
+        return self.decode(dev, result.registers)
+
+    def read_block(self, block: ReadBlock) -> dict[Hashable, float | str | OwenError]:
+        """Чтение блока регистров и распаковка входящих в него параметров.
+
+        Если устройство отвечает ошибкой на чтение блока (например, из-за
+        неиспользуемых регистров между параметрами), параметры блока читаются
+        по отдельности.
+        """
+
+        try:
+            result = self.read(block.address, block.count, self.unit)
+            self.check_error(result)
+        except ModbusException as err:
+            return dict.fromkeys((item.key for item in block.items), OwenError(err))
+        except OwenError as err:
+            if len(block.items) == 1:
+                return {block.items[0].key: err}
+
+            values: dict[Hashable, float | str | OwenError] = {}
+            for item in block.items:
+                try:
+                    values[item.key] = self._read(item.dev, item.param_index)
+                except OwenError as item_err:
+                    values[item.key] = item_err
+                except (ModbusException, error, TypeError, ValueError) as item_err:
+                    values[item.key] = OwenError(item_err)
+            return values
+
+        return self.decode_block(block, result.registers)
+
+    def write_block(self, block: WriteBlock) -> dict[Hashable, bool | OwenError]:
+        """Запись блока регистров одним запросом.
+
+        Если устройство отвечает ошибкой на запись блока, параметры блока
+        записываются по отдельности, чтобы определить ошибочное значение.
+        """
+
+        try:
+            result = self.write(block.address, block.registers, self.unit)
+            self.check_error(result)
+        except ModbusException as err:
+            return dict.fromkeys(block.keys, OwenError(err))
+        except OwenError as err:
+            if len(block.keys) == 1:
+                return {block.keys[0]: err}
+
+            values: dict[Hashable, bool | OwenError] = {}
+            for sub in block.split():
+                values.update(self.write_block(sub))
+            return values
+
+        return dict.fromkeys(block.keys, True)
+
+    def load_dp(self, items: Iterable[tuple[str, int | None]],
+                ) -> dict[tuple[str, int | None], int | OwenError]:
+        """Чтение группы значений DP минимальным числом запросов."""
+
+        values: dict[Hashable, float | str | OwenError] = {}
+        for block in self.plan_dp(items):
+            values.update(self.read_block(block))
+        return self.store_dp_values(values)
+
+    def get_dp(self, name: str, index: int | None) -> int:
+        """Получение значения DP.
+
+        При первом обращении или по истечении dp_ttl одним запросом читаются
+        значения DP для всех индексов параметра.
+        """
+
+        dev = self.device[name]
+        if not self.dp_ttl:
+            return int(self._read(dev, index))
+
+        value: int | OwenError | None = self.cached_dp(name, index)
+        if value is None:
+            value = self.load_dp((name, idx) for idx in dev.indexes)[name, index]
+        if isinstance(value, OwenError):
+            raise value
+        return value
+
+    def modify_value(self, func: Callable[[float, float], float], dev: ModbusParamInfo,
+                           index: int | None, value: float | str, dp: int | None = None) -> float | str:
+        """Преобразование значения к нужной точности.
+
+        Значение DP, если не передано явно, берется из кэша или читается из
+        устройства.
+        """
+
+        if dev.dp and dp is None:
+            dp = self.get_dp(dev.dp, index)
+        return self.scale_value(func, dev, value, dp)
+
+    def prepare(self, name: str, index: int | None = None) -> ModbusParam:
+        """Подготовка параметра для многократного чтения и записи."""
+
+        return ModbusParam(self, name, index)
+
     def get_param(self, name: str, index: int | None = None) -> float | str:
         """Чтение данных из устройства."""
 
@@ -90,17 +494,285 @@ class Modbus:
         value = self._read(dev, index)
         return self.modify_value(truediv, dev, index, value)
 
+    def get_many(self, items: Iterable[tuple[str, int | None]],
+                 ) -> dict[tuple[str, int | None], float | str | OwenError]:
+        """Чтение группы параметров из устройства.
+
+        Повторяющиеся параметры читаются один раз, параметры в смежных
+        регистрах (с разрывом не более max_gap) читаются одним запросом.
+        Ошибка чтения параметра возвращается вместо его значения и не прерывает
+        чтение остальных.
+        """
+
+        errors, plan = self.resolve_many(items)
+        result: dict[tuple[str, int | None], float | str | OwenError] = dict(errors)
+        dp_cached, blocks = self.plan_get_many(plan)
+
+        values: dict[Hashable, float | str | OwenError] = {}
+        for block in blocks:
+            values.update(self.read_block(block))
+
+        return self.finish_get_many(result, plan, dp_cached, values)
+
+    def read_block_raw(self, block: ReadBlock) -> dict[Hashable, bytes | OwenError]:
+        """Чтение блока регистров без распаковки параметров.
+
+        Returns:
+            Словарь {ключ: регистры параметра (big-endian) или OwenError}
+
+        """
+
+        try:
+            result = self.read(block.address, block.count, self.unit)
+            self.check_error(result)
+        except ModbusException as err:
+            return dict.fromkeys((item.key for item in block.items), OwenError(err))
+        except OwenError as err:
+            if len(block.items) == 1:
+                return {block.items[0].key: err}
+
+            values: dict[Hashable, bytes | OwenError] = {}
+            for item in block.items:
+                try:
+                    single = self.read(item.dev.indexes[item.param_index], item.registers, self.unit)
+                    self.check_error(single)
+                    values[item.key] = pack_registers(single.registers[:item.registers])
+                except (ModbusException, OwenError) as item_err:
+                    values[item.key] = OwenError(item_err)
+            return values
+
+        buffer = pack_registers(result.registers)
+        return {item.key: buffer[item.offset * 2:(item.offset + item.registers) * 2]
+                for item in block.items}
+
+    def get_raw_many(self, items: Iterable[tuple[str, int | None]],
+                     ) -> dict[tuple[str, int | None], bytes | OwenError]:
+        """Чтение группы параметров из устройства без распаковки.
+
+        Для параметров, зависящих от DP, к регистрам добавляется байт со
+        значением DP, поэтому изменение DP также меняет данные параметра.
+
+        Returns:
+            Словарь {(название, индекс): данные параметра или OwenError}
+
+        """
+
+        errors, plan = self.resolve_many(items)
+        result: dict[tuple[str, int | None], bytes | OwenError] = dict(errors)
+        dp_cached, blocks = self.plan_get_many(plan)
+
+        values: dict[Hashable, bytes | OwenError] = {}
+        for block in blocks:
+            values.update(self.read_block_raw(block))
+
+        dp_values: dict[tuple[str, int | None], int | OwenError] = dict(dp_cached)
+        dp_raw = {key[1:]: value for key, value in values.items() if isinstance(key, tuple) and key[0] is None}
+        dp_values.update(self.store_dp_values({
+            key: value if isinstance(value, OwenError) else self.codec(self.device[key[0]]).decode_from(value, 0)
+            for key, value in dp_raw.items()}))
+
+        for key, (dev, keys) in plan.items():
+            value = values[key]
+            dp = dp_values[dev.dp, key[1]] if dev.dp else None
+            if not isinstance(value, OwenError):
+                if isinstance(dp, OwenError):
+                    value = dp
+                elif dp is not None:
+                    value += dp.to_bytes(1, "big", signed=True)
+            result.update(dict.fromkeys(keys, value))
+
+        return result
+
     def set_param(self, name: str, index: int | None = None,
                         value: float | str | None = None) -> bool:
         """Запись данных в устройство."""
 
         dev, index = self.check_index(name, index)
+        if value is None:
+            msg = f"'{name}' requires a value"
+            raise OwenError(msg)
         value = self.modify_value(mul, dev, index, value)
 
-        builder = BinaryPayloadBuilder(payload=None,
-                                       byteorder=self.byteorder,
-                                       wordorder=self.wordorder)
-        MODBUS_TYPE[dev["type"]]["pack"](builder, value)
+        payload = self.codec(dev).encode(value)
+        result = self.write(dev.indexes[index], payload, self.unit)
+        self.invalidate_dp(self.unit, name, index)
+        return self.check_error(result)
+
+    def set_many(self, items: Mapping[tuple[str, int | None], float | str],
+                 ) -> dict[tuple[str, int | None], bool | OwenError]:
+        """Запись группы параметров в устройство.
+
+        Значения параметров, занимающих непрерывный диапазон регистров,
+        записываются одним запросом (не более max_write_count регистров).
+        Значения DP, от которых зависит пересчет, читаются заранее одной группой;
+        если DP записывается в этой же группе, используется новое значение.
+        Ошибка записи параметра возвращается вместо True и не прерывает запись
+        остальных.
+        """
+
+        errors, plan = self.resolve_many(items)
+        result: dict[tuple[str, int | None], bool | OwenError] = dict(errors)
+        dp_values, dp_items = self.plan_set_many(items, plan)
+        if dp_items:
+            dp_values.update(self.load_dp(dp_items))
+
+        values: dict[Hashable, bool | OwenError] = {}
+        for block in self.pack_many(result, items, plan, dp_values):
+            values.update(self.write_block(block))
+
+        return self.finish_set_many(result, plan, values)
+
+
+class AsyncModbus(ModbusCore):
+    """Класс, описывающий протокол Modbus, для работы в asyncio.
+
+    Планирование запросов, упаковка и пересчет значений выполняются методами
+    класса ModbusCore, обмен данными с устройством - сопрограммами транспорта.
+    """
+
+    async def read(self, address: int, count: int, unit: int) -> ModbusPDU | ModbusResponse:
+        """Чтение данных."""
+
+        raise NotImplementedError
+
+    async def write(self, address: int, payload: list[int], unit: int) -> ModbusPDU | ModbusResponse:
+        """Запись данных."""
 
-        result = self.write(dev["index"][index], builder.to_registers(), self.unit)
+        raise NotImplementedError
+
+    async def _read(self, dev: ModbusParamInfo, index: int | None) -> float | str:
+        """Чтение данных из регистра Modbus."""
+
+        count = dev.registers
+        result = await self.read(dev.indexes[index], count, self.unit)
+        self.check_error(result)
+        return self.decode(dev, result.registers)
+
+    async def read_block(self, block: ReadBlock) -> dict[Hashable, float | str | OwenError]:
+        """Чтение блока регистров и распаковка входящих в него параметров."""
+
+        try:
+            result = await self.read(block.address, block.count, self.unit)
+            self.check_error(result)
+        except ModbusException as err:
+            return dict.fromkeys((item.key for item in block.items), OwenError(err))
+        except OwenError as err:
+            if len(block.items) == 1:
+                return {block.items[0].key: err}
+
+            values: dict[Hashable, float | str | OwenError] = {}
+            for item in block.items:
+                try:
+                    values[item.key] = await self._read(item.dev, item.param_index)
+                except OwenError as item_err:
+                    values[item.key] = item_err
+                except (ModbusException, error, TypeError, ValueError) as item_err:
+                    values[item.key] = OwenError(item_err)
+            return values
+
+        return self.decode_block(block, result.registers)
+
+    async def read_blocks(self, blocks: list[ReadBlock]) -> list[dict[Hashable, float | str | OwenError]]:
+        """Одновременное чтение нескольких блоков регистров.
+
+        Запросы отправляются без ожидания ответов на предыдущие; транспорт
+        либо передает их по очереди, либо держит несколько транзакций в пути.
+        """
+
+        return await asyncio.gather(*(self.read_block(block) for block in blocks))
+
+    async def write_block(self, block: WriteBlock) -> dict[Hashable, bool | OwenError]:
+        """Запись блока регистров одним запросом."""
+
+        try:
+            result = await self.write(block.address, block.registers, self.unit)
+            self.check_error(result)
+        except ModbusException as err:
+            return dict.fromkeys(block.keys, OwenError(err))
+        except OwenError as err:
+            if len(block.keys) == 1:
+                return {block.keys[0]: err}
+
+            values: dict[Hashable, bool | OwenError] = {}
+            for sub in block.split():
+                values.update(await self.write_block(sub))
+            return values
+
+        return dict.fromkeys(block.keys, True)
+
+    async def load_dp(self, items: Iterable[tuple[str, int | None]],
+                      ) -> dict[tuple[str, int | None], int | OwenError]:
+        """Чтение группы значений DP минимальным числом запросов."""
+
+        values: dict[Hashable, float | str | OwenError] = {}
+        for block_values in await self.read_blocks(self.plan_dp(items)):
+            values.update(block_values)
+        return self.store_dp_values(values)
+
+    async def get_dp(self, name: str, index: int | None) -> int:
+        """Получение значения DP."""
+
+        dev = self.device[name]
+        if not self.dp_ttl:
+            return int(await self._read(dev, index))
+
+        value: int | OwenError | None = self.cached_dp(name, index)
+        if value is None:
+            value = (await self.load_dp((name, idx) for idx in dev.indexes))[name, index]
+        if isinstance(value, OwenError):
+            raise value
+        return value
+
+    async def get_param(self, name: str, index: int | None = None) -> float | str:
+        """Чтение данных из устройства."""
+
+        dev, index = self.check_index(name, index)
+        value = await self._read(dev, index)
+        dp = await self.get_dp(dev.dp, index) if dev.dp else None
+        return self.scale_value(truediv, dev, value, dp)
+
+    async def get_many(self, items: Iterable[tuple[str, int | None]],
+                       ) -> dict[tuple[str, int | None], float | str | OwenError]:
+        """Чтение группы параметров из устройства."""
+
+        errors, plan = self.resolve_many(items)
+        result: dict[tuple[str, int | None], float | str | OwenError] = dict(errors)
+        dp_cached, blocks = self.plan_get_many(plan)
+
+        values: dict[Hashable, float | str | OwenError] = {}
+        for block_values in await self.read_blocks(blocks):
+            values.update(block_values)
+
+        return self.finish_get_many(result, plan, dp_cached, values)
+
+    async def set_param(self, name: str, index: int | None = None,
+                              value: float | str | None = None) -> bool:
+        """Запись данных в устройство."""
+
+        dev, index = self.check_index(name, index)
+        if value is None:
+            msg = f"'{name}' requires a value"
+            raise OwenError(msg)
+        dp = await self.get_dp(dev.dp, index) if dev.dp else None
+        value = self.scale_value(mul, dev, value, dp)
+
+        payload = self.codec(dev).encode(value)
+        result = await self.write(dev.indexes[index], payload, self.unit)
+        self.invalidate_dp(self.unit, name, index)
         return self.check_error(result)
+
+    async def set_many(self, items: Mapping[tuple[str, int | None], float | str],
+                       ) -> dict[tuple[str, int | None], bool | OwenError]:
+        """Запись группы параметров в устройство."""
+
+        errors, plan = self.resolve_many(items)
+        result: dict[tuple[str, int | None], bool | OwenError] = dict(errors)
+        dp_values, dp_items = self.plan_set_many(items, plan)
+        if dp_items:
+            dp_values.update(await self.load_dp(dp_items))
+
+        values: dict[Hashable, bool | OwenError] = {}
+        for block in self.pack_many(result, items, plan, dp_values):
+            values.update(await self.write_block(block))
+
+        return self.finish_set_many(result, plan, values)
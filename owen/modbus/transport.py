@@ -7,13 +7,23 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
-from pymodbus.client import ModbusSerialClient, ModbusTcpClient
+from pymodbus.client import (AsyncModbusSerialClient, AsyncModbusTcpClient,
+                             ModbusSerialClient, ModbusTcpClient)
+from pymodbus.exceptions import ConnectionException
+
+from owen.bus import AsyncSingleFlight, BusLock, SingleFlight, registry
+from owen.exception import OwenError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pymodbus.pdu import ModbusPDU
 
+    from owen.modbus.pool import ConnectionPool
+
 
 class ModbusSerialTransport:
     """Класс транспорта для взаимодействия с устройством по протоколу MODBUS
@@ -30,33 +40,53 @@ class ModbusSerialTransport:
         протоколу MODBUS через интерфейс RS485.
         """
 
-        self.socket = ModbusSerialClient(port=port,
-                                         baudrate=baudrate,
-                                         bytesize=bytesize,
-                                         parity=parity,
-                                         stopbits=stopbits,
-                                         **kwargs)
-        self.socket.connect()
+        settings = dict(baudrate=baudrate, bytesize=bytesize, parity=parity,
+                        stopbits=stopbits, **kwargs)
+        self.bus = registry.acquire(port, "modbus", settings,
+                                    lambda: self._open(port, settings))
+        self.socket = self.bus.socket
+        self.lock = self.bus.lock
+        self.flights = self.bus.flights
+
+    @staticmethod
+    def _open(port: str, settings: dict[str, Any]) -> ModbusSerialClient:
+        """Открытие порта."""
+
+        socket = ModbusSerialClient(port=port, **settings)
+        socket.connect()
+        return socket
 
     def __del__(self) -> None:
-        """Закрытие соединения с устройством при удалении объекта."""
+        """Освобождение соединения при удалении объекта."""
 
-        if hasattr(self, "socket"):
+        self.close()
+
+    def close(self) -> None:
+        """Освобождение соединения; общий порт закрывается вместе с последним
+        транспортом.
+        """
+
+        if getattr(self, "bus", None) is not None:
+            registry.release(self.bus)
+            self.bus = None
+        elif getattr(self, "socket", None) is not None:
             self.socket.close()
 
     def write(self, address: int, payload: list[int], unit: int) -> ModbusPDU:
         """Запись данных по интерфейсу."""
 
-        return self.socket.write_registers(address=address,
-                                           values=payload,
-                                           slave=unit)
+        with self.lock:
+            return self.socket.write_registers(address=address,
+                                               values=payload,
+                                               slave=unit)
 
     def read(self, address: int, count: int, unit: int) -> ModbusPDU:
         """Чтение данных по интерфейсу."""
 
-        return self.socket.read_holding_registers(address=address,
-                                                  count=count,
-                                                  slave=unit)
+        with self.lock:
+            return self.socket.read_holding_registers(address=address,
+                                                      count=count,
+                                                      slave=unit)
 
 
 class ModbusTcpTransport(ModbusSerialTransport):
@@ -64,10 +94,136 @@ class ModbusTcpTransport(ModbusSerialTransport):
     через интерфейс Ethernet.
     """
 
-    def __init__(self, host: str, port: int = 502, **kwargs: Any) -> None:
+    def __init__(self, host: str, port: int = 502,
+                       pool: ConnectionPool | None = None,
+                       **kwargs: Any) -> None:
         """Инициализация класса транспорта для взаимодействия с устройством по
         протоколу MODBUS TCP через интерфейс Ethernet.
+
+        Args:
+            pool: Пул соединений (например, owen.modbus.pool.get_pool()). Если
+                  задан, транспорт не открывает собственное соединение, а
+                  получает общее соединение из пула на время каждого запроса
+
         """
 
+        self.host = host
+        self.port = port
+        self.pool = pool
+        self.lock = BusLock()
+        self.flights = SingleFlight()
+
+        if pool is not None:
+            if kwargs:
+                msg = "Client settings of a pooled transport are defined by the pool"
+                raise OwenError(msg)
+            return
+
         self.socket = ModbusTcpClient(host=host, port=port, **kwargs)
         self.socket.connect()
+
+    def write(self, address: int, payload: list[int], unit: int) -> ModbusPDU:
+        """Запись данных по интерфейсу."""
+
+        if self.pool is None:
+            return super().write(address, payload, unit)
+
+        with self.pool.connection(self.host, self.port) as client:
+            return client.write_registers(address=address, values=payload, slave=unit)
+
+    def read(self, address: int, count: int, unit: int) -> ModbusPDU:
+        """Чтение данных по интерфейсу."""
+
+        if self.pool is None:
+            return super().read(address, count, unit)
+
+        with self.pool.connection(self.host, self.port) as client:
+            return client.read_holding_registers(address=address, count=count, slave=unit)
+
+
+class AsyncModbusSerialTransport:
+    """Класс асинхронного транспорта для взаимодействия с устройством по
+    протоколу MODBUS через интерфейс RS485.
+
+    Клиент pymodbus требует запущенного цикла событий, поэтому создается и
+    подключается в сопрограмме connect или при входе в блок async with.
+    """
+
+    def __init__(self, port: str,
+                       baudrate: int = 9600,
+                       bytesize: int = 8,
+                       parity: str = "N",
+                       stopbits: int = 2,
+                       **kwargs: Any) -> None:
+        """Инициализация класса асинхронного транспорта для взаимодействия с
+        устройством по протоколу MODBUS через интерфейс RS485.
+        """
+
+        self._client: Callable[[], AsyncModbusSerialClient | AsyncModbusTcpClient]
+        self._client = partial(AsyncModbusSerialClient, port=port,
+                                                        baudrate=baudrate,
+                                                        bytesize=bytesize,
+                                                        parity=parity,
+                                                        stopbits=stopbits,
+                                                        **kwargs)
+        self.socket: AsyncModbusSerialClient | AsyncModbusTcpClient | None = None
+        self.flights = AsyncSingleFlight()
+
+    async def __aenter__(self) -> AsyncModbusSerialTransport:
+        """Подключение к устройству при входе в блок async with."""
+
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Закрытие соединения при выходе из блока async with."""
+
+        self.close()
+
+    async def connect(self) -> bool:
+        """Подключение к устройству."""
+
+        if self.socket is None:
+            self.socket = self._client()
+        return await self.socket.connect()
+
+    def close(self) -> None:
+        """Закрытие соединения с устройством."""
+
+        if self.socket is not None:
+            self.socket.close()
+
+    async def write(self, address: int, payload: list[int], unit: int) -> ModbusPDU:
+        """Запись данных по интерфейсу."""
+
+        if self.socket is None:
+            msg = "Transport is not connected"
+            raise ConnectionException(msg)
+        return await self.socket.write_registers(address=address,
+                                                 values=payload,
+                                                 slave=unit)
+
+    async def read(self, address: int, count: int, unit: int) -> ModbusPDU:
+        """Чтение данных по интерфейсу."""
+
+        if self.socket is None:
+            msg = "Transport is not connected"
+            raise ConnectionException(msg)
+        return await self.socket.read_holding_registers(address=address,
+                                                        count=count,
+                                                        slave=unit)
+
+
+class AsyncModbusTcpTransport(AsyncModbusSerialTransport):
+    """Класс асинхронного транспорта для взаимодействия с устройством по
+    протоколу MODBUS TCP через интерфейс Ethernet.
+    """
+
+    def __init__(self, host: str, port: int = 502, **kwargs: Any) -> None:
+        """Инициализация класса асинхронного транспорта для взаимодействия с
+        устройством по протоколу MODBUS TCP через интерфейс Ethernet.
+        """
+
+        self._client = partial(AsyncModbusTcpClient, host=host, port=port, **kwargs)
+        self.socket = None
+        self.flights = AsyncSingleFlight()
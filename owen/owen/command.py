@@ -0,0 +1,62 @@
+#! /usr/bin/env python3
+
+"""Таблица hash-кодов команд (имен параметров) протокола ОВЕН."""
+
+from __future__ import annotations
+
+from functools import reduce
+from typing import TYPE_CHECKING
+
+from owen.owen.crc import owen_hash
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+OWEN_ASCII = {"0":  0, "1":  2, "2":  4, "3":  6, "4":  8,
+              "5": 10, "6": 12, "7": 14, "8": 16, "9": 18,
+              "A": 20, "B": 22, "C": 24, "D": 26, "E": 28,
+              "F": 30, "G": 32, "H": 34, "I": 36, "J": 38,
+              "K": 40, "L": 42, "M": 44, "N": 46, "O": 48,
+              "P": 50, "Q": 52, "R": 54, "S": 56, "T": 58,
+              "U": 60, "V": 62, "W": 64, "X": 66, "Y": 68,
+              "Z": 70, "-": 72, "_": 74, "/": 76, " ": 78}
+
+
+def name2code(name: str) -> tuple[int, ...]:
+    """Преобразование локального идентификатора в числовой код."""
+
+    code: list[int] = reduce(lambda x, ch: [*x[:-1], x[-1] + 1] if ch == "."
+                             else [*x, OWEN_ASCII[ch]], name.upper(), [])
+    return (*code, *[OWEN_ASCII[" "]] * (4 - len(code)))
+
+
+class CommandTable:
+    """Соответствие имен параметров и hash-кодов команд."""
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        """Инициализация таблицы hash-кодов для заданных имен параметров."""
+
+        self.codes: dict[str, int] = {}
+        self.names: dict[int, str] = {}
+        for name in names:
+            self.add(name)
+
+    def add(self, name: str) -> int:
+        """Вычисление hash-кода параметра и добавление его в таблицу."""
+
+        cmd = owen_hash(name2code(name))
+        self.codes[name] = cmd
+        self.names.setdefault(cmd, name)
+        return cmd
+
+    def code(self, name: str) -> int:
+        """Получение hash-кода по имени параметра."""
+
+        cmd = self.codes.get(name)
+        return self.add(name) if cmd is None else cmd
+
+    def name(self, cmd: int) -> str | None:
+        """Получение имени параметра по hash-коду."""
+
+        return self.names.get(cmd)
@@ -4,112 +4,174 @@
 
 from __future__ import annotations
 
-from binascii import hexlify, unhexlify
+from binascii import unhexlify
 from decimal import Decimal
-from struct import pack, unpack
+from struct import Struct, pack, unpack
+from typing import Any, Callable, Iterable, TypedDict
+
+_SDOT_FORMATS = ((Struct(">B"), 4, slice(1)),
+                 (Struct(">H"), 12, slice(2)),
+                 (Struct(">I"), 20, slice(1, 4)))
+_SDOT_SIGN = (1, -1)
+_SDOT_POW10 = tuple(10 ** (-exponent) for exponent in range(8))
+
+
+def _sdot_fields(value: float) -> tuple[int, int, int]:
+    """Разложение числа на знак, показатель степени и мантиссу."""
+
+    text = str(value)
+    sign = text.startswith("-")
+    integer, _, fraction = text.lstrip("-").partition(".")
+    digits = integer + fraction
+    if digits.isdecimal():
+        return sign, len(fraction), int(digits)
+
+    # экспоненциальная запись
+    decimal = Decimal(text).as_tuple()
+    return sign, abs(int(decimal.exponent)), int(Decimal((0, decimal.digits, 0)))
 
 
 def pack_sdot(value: float) -> bytes:
     """Упаковка данных типа STORED_DOT."""
 
-    sign, digits, exponent = Decimal(str(value)).as_tuple()
-    mantissa = int(Decimal((0, digits, 0)))
+    sign, exponent, mantissa = _sdot_fields(value)
+    frmt, size, chunk = _SDOT_FORMATS[(mantissa >= 16) + (mantissa >= 4096)]
 
-    frmt, size, chunk = {mantissa < 16: (">B", 4, slice(1)),
-                         mantissa >= 4096: (">I", 20, slice(1, 4)),
-                        }.get(True, (">H", 12, slice(2)))
-
-    bin_str = f"{sign:1b}{abs(exponent):03b}{mantissa:0{size}b}"
-    return pack(frmt, int(bin_str, 2))[chunk]
+    size = max(size, mantissa.bit_length())
+    width = size + max(3, exponent.bit_length())
+    return frmt.pack(sign << width | exponent << size | mantissa)[chunk]
 
 
 def unpack_sdot(value: bytes) -> int | float:
     """Распаковка данных типа STORED_DOT."""
 
     data = int.from_bytes(value, "big")
-    bin_str = f"{data:0{len(value) * 8}b}"
-
-    sign = int(bin_str[0], 2)
-    exponent = int(bin_str[1:4], 2)
-    mantissa = int(bin_str[4:], 2)
+    size = len(value) * 8 - 4
 
-    return (-1) ** sign * 10 ** (-exponent) * mantissa
+    return _SDOT_SIGN[data >> size + 3] * _SDOT_POW10[data >> size & 7] * \
+           (data & (1 << size) - 1)
 
 
 def pack_dot0(value: float) -> bytes:
     """Упаковка данных типа DEC_DOT0."""
 
     s = str(int(value))
-    return unhexlify(s.zfill(len(s) + len(s) % 2))
+    return unhexlify("0" + s if len(s) % 2 else s)
 
 
 def unpack_dot0(value: bytes) -> int:
     """Распаковка данных типа DEC_DOT0."""
 
-    return int(hexlify(value).decode())
+    return int(value.hex())
+
+
+def pack_clk(value: tuple[int, int, int, int]) -> bytes:
+    """Упаковка данных типа CLK_FRM."""
+
+    s = "%06d%02d%02d%02d" % tuple(value)
+    if len(s) == 12:
+        return unhexlify(s)
+    return b"".join(pack_dot0(val).rjust(size, b"\x00")
+                    for val, size in zip(value, (3, 1, 1, 1)))
+
+
+def unpack_clk(value: bytes) -> tuple[int, int, int, int]:
+    """Распаковка данных типа CLK_FRM."""
+
+    s = value[:6].hex()
+    return int(s[:6]), int(s[6:8]), int(s[8:10]), int(s[10:12])
+
+
+def unpack_many(frmt: str, values: Iterable[bytes]) -> list[Any]:
+    """Распаковка последовательности значений одного формата."""
+
+    func: Callable[[bytes], Any] = OWEN_TYPE[frmt]["unpack"]
+    return [func(value) for value in values]
+
+
+class TYPE(TypedDict):
+    """Параметры типов для OWEN_TYPE."""
+
+    pack: Callable[..., bytes]
+    unpack: Callable[..., Any]
+    size: int | None
 
 
-OWEN_TYPE = {
+# size - размер данных в байтах (None - переменный размер)
+OWEN_TYPE: dict[str, TYPE] = {
     "U8": {
         "pack": lambda value: pack(">B", value)[:1],
         "unpack": lambda value: unpack(">B", value[:1])[0],
+        "size": 1,
     },
     "I8": {
         "pack": lambda value: pack(">b", value)[:1],
         "unpack": lambda value: unpack(">b", value[:1])[0],
+        "size": 1,
     },
     "U16": {
         "pack": lambda value: pack(">H", value)[:2],
         "unpack": lambda value: unpack(">H", value[:2])[0],
+        "size": 2,
     },
     "I16": {
         "pack": lambda value: pack(">h", value)[:2],
         "unpack": lambda value: unpack(">h", value[:2])[0],
+        "size": 2,
     },
     "U24": {
         "pack": lambda value: pack(">BH", *value)[:3],
         "unpack": lambda value: unpack(">BH", value[:3]),
+        "size": 3,
     },
     "U32": {
         "pack": lambda value: pack(">I", value)[:4],
         "unpack": lambda value: unpack(">I", value[:4])[0],
+        "size": 4,
     },
     "I32": {
         "pack": lambda value: pack(">i", value)[:4],
         "unpack": lambda value: unpack(">i", value[:4])[0],
+        "size": 4,
     },
     "F24": {
         "pack": lambda value: pack(">f", value)[:3],
         "unpack": lambda value: unpack(">f", value[:3] + b"\x00")[0],
+        "size": 3,
     },
     "F32": {
         "pack": lambda value: pack(">f", value)[:4],
         "unpack": lambda value: unpack(">f", value[:4])[0],
+        "size": 4,
     },
     "F32+T": {
         "pack": lambda value: pack(">fH", *value)[:6],
         "unpack": lambda value: unpack(">fH", value[:6]),
+        "size": 6,
     },
     "STR": {
         "pack": lambda value: str(value[::-1]).encode("cp1251"),
         "unpack": lambda value: bytes(value[::-1]).decode("cp1251"),
+        "size": None,
     },
     "SDOT": {
         "pack": pack_sdot,
         "unpack": unpack_sdot,
+        "size": None,
     },
     "DOT0": {
         "pack": pack_dot0,
         "unpack": unpack_dot0,
+        "size": None,
     },
     "DOT3": {
         "pack": lambda value: pack_dot0(value * 1000),
         "unpack": lambda value: unpack_dot0(value) / 1000.0,
+        "size": None,
     },
     "CLK": {
-        "pack": lambda value: b"".join(pack_dot0(val).rjust(size, b"\x00")
-                                       for val, size in zip(value, (3, 1, 1, 1))),
-        "unpack": lambda value: tuple(unpack_dot0(value[slice(*chunk)])
-                                      for chunk in ((0, 3), (3, 4), (4, 5), (5, 6))),
+        "pack": pack_clk,
+        "unpack": unpack_clk,
+        "size": 6,
     },
 }
@@ -0,0 +1,56 @@
+#! /usr/bin/env python3
+
+"""Табличное вычисление контрольной суммы и hash-функции протокола ОВЕН
+(полином 0x8F57).
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+POLYNOMIAL = 0x8F57
+
+
+def _make_table(bits: int) -> tuple[int, ...]:
+    """Построение таблицы значений полинома для старшего байта регистра."""
+
+    def calc(crc: int) -> int:
+        for _ in range(bits):
+            crc = crc << 1 & 0xFFFF ^ (POLYNOMIAL if crc & 0x8000 else 0)
+        return crc
+
+    return tuple(calc(i << 8) for i in range(256))
+
+
+CRC_TABLE = _make_table(8)
+HASH_TABLE = _make_table(7)
+
+
+def crc16_update(crc: int, data: Iterable[int]) -> int:
+    """Обновление контрольной суммы очередной порцией данных."""
+
+    table = CRC_TABLE
+    for value in data:
+        crc = crc << 8 & 0xFFFF ^ table[(crc >> 8 ^ value) & 0xFF]
+    return crc
+
+
+def hash_update(crc: int, data: Iterable[int]) -> int:
+    """Обновление hash-функции очередной порцией кодов символов (7 бит)."""
+
+    table = HASH_TABLE
+    for value in data:
+        crc = (crc & 0xFF) << 7 ^ table[(crc >> 8 ^ value << 1) & 0xFF]
+    return crc
+
+
+def crc16(data: Iterable[int]) -> int:
+    """Вычисление контрольной суммы."""
+
+    return crc16_update(0, data)
+
+
+def owen_hash(data: Iterable[int]) -> int:
+    """Вычисление hash-функции."""
+
+    return hash_update(0, data)
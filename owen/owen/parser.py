@@ -0,0 +1,97 @@
+#! /usr/bin/env python3
+
+"""Потоковый разбор пакетов протокола ОВЕН."""
+
+from __future__ import annotations
+
+HEADER = b"#"
+FOOTER = b"\r"
+OWEN_DIGITS = b"GHIJKLMNOPQRSTUV"
+
+# Минимальный пакет: адрес (2 байта), hash (2 байта) и CRC (2 байта), максимальный
+# дополнительно содержит 15 байт данных. Каждый байт передается двумя символами.
+MIN_FRAME_SIZE = 2 + 2 * 6
+MAX_FRAME_SIZE = 2 + 2 * (6 + 15)
+
+
+class FrameParser:
+    """Выделение пакетов протокола ОВЕН из потока байт.
+
+    Данные передаются порциями произвольной длины. Мусор между пакетами,
+    оборванные и поврежденные пакеты, а также эхо собственного запроса
+    отбрасываются с подсчетом потерянных байт и пакетов.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация разборщика пакетов."""
+
+        self._buffer = bytearray()
+        self.echo: bytes | None = None
+        self.dropped_bytes = 0
+        self.dropped_frames = 0
+
+    def reset(self, echo: bytes | None = None) -> None:
+        """Сброс буфера перед новой транзакцией.
+
+        Args:
+            echo: Отправленный запрос, эхо которого нужно отбросить. Ответ
+                  на запрос записи совпадает с самим запросом, поэтому
+                  отбрасывается только эхо запроса чтения
+
+        """
+
+        self.dropped_bytes += len(self._buffer)
+        self._buffer.clear()
+        self.echo = echo if echo and self.is_read_request(echo) else None
+
+    @staticmethod
+    def is_read_request(frame: bytes) -> bool:
+        """Проверка признака запроса чтения (флаг в старшей тетраде 2-го байта)."""
+
+        return len(frame) > 3 and bool(frame[3] - OWEN_DIGITS[0] & 1)
+
+    def _drop(self, size: int, frame: bool = False) -> None:
+        """Удаление данных из начала буфера."""
+
+        del self._buffer[:size]
+        self.dropped_bytes += size
+        self.dropped_frames += frame
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Добавление порции данных и получение списка завершенных пакетов."""
+
+        buffer = self._buffer
+        buffer += data
+        frames = []
+
+        while buffer:
+            start = buffer.find(HEADER)
+            if start < 0:
+                self._drop(len(buffer))
+                break
+            if start:
+                self._drop(start)
+
+            end = buffer.find(FOOTER, 1)
+            restart = buffer.find(HEADER, 1, MAX_FRAME_SIZE if end < 0 else end)
+            if restart > 0:                     # оборванный пакет
+                self._drop(restart, frame=True)
+                continue
+            if end < 0:
+                if len(buffer) >= MAX_FRAME_SIZE:
+                    self._drop(MAX_FRAME_SIZE, frame=True)
+                    continue
+                break
+
+            frame = bytes(buffer[:end + 1])
+            if not MIN_FRAME_SIZE <= len(frame) <= MAX_FRAME_SIZE or len(frame) % 2 or \
+               frame[1:-1].translate(None, OWEN_DIGITS):
+                self._drop(len(frame), frame=True)
+            elif frame == self.echo:
+                self._drop(len(frame), frame=True)
+                self.echo = None
+            else:
+                del buffer[:end + 1]
+                frames.append(frame)
+
+        return frames
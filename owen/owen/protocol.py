@@ -5,15 +5,25 @@
 from __future__ import annotations
 
 import logging
+from binascii import hexlify, unhexlify
+from collections import OrderedDict
 from functools import reduce
-from struct import error, unpack
-from typing import TYPE_CHECKING
+from struct import error
+from threading import Lock, RLock
+from typing import TYPE_CHECKING, NamedTuple
 
+from owen.device._table import device_table
 from owen.exception import OwenError
+from owen.owen.command import OWEN_ASCII as OWEN_ASCII
+from owen.owen.command import name2code
 from owen.owen.converter import OWEN_TYPE
+from owen.owen.crc import crc16, owen_hash
 
 if TYPE_CHECKING:
-    from owen.device._types import DEVICE, OWEN
+    from collections.abc import Callable, Iterable, Mapping
+
+    from owen.bus import BusLock
+    from owen.device._table import DeviceLike, OwenParamInfo
 
 
 _logger = logging.getLogger(__name__)
@@ -22,35 +32,132 @@ _logger.addHandler(logging.NullHandler())
 
 HEADER = ord("#")
 FOOTER = ord("\r")
-OWEN_ASCII = {"0":  0, "1":  2, "2":  4, "3":  6, "4":  8,
-              "5": 10, "6": 12, "7": 14, "8": 16, "9": 18,
-              "A": 20, "B": 22, "C": 24, "D": 26, "E": 28,
-              "F": 30, "G": 32, "H": 34, "I": 36, "J": 38,
-              "K": 40, "L": 42, "M": 44, "N": 46, "O": 48,
-              "P": 50, "Q": 52, "R": 54, "S": 56, "T": 58,
-              "U": 60, "V": 62, "W": 64, "X": 66, "Y": 68,
-              "Z": 70, "-": 72, "_": 74, "/": 76, " ": 78}
+OWEN_DIGITS = b"GHIJKLMNOPQRSTUV"
+HEX_DIGITS = b"0123456789abcdef"
 
+# Таблицы перекодировки символов ASCII-пакета ('G'...'V') в шестнадцатеричные
+# цифры и обратно. Недопустимые символы переводятся в 'x', что приводит к ошибке
+# при декодировании.
+ENCODE_TABLE = bytes.maketrans(HEX_DIGITS, OWEN_DIGITS)
+DECODE_TABLE = bytes(HEX_DIGITS[OWEN_DIGITS.index(ch)] if ch in OWEN_DIGITS
+                     else ord("x") for ch in range(256))
 
-class Owen:
-    """Класс, описывающий протокол ОВЕН."""
 
-    def __init__(self, unit: int, device: DEVICE, addr_len_8: bool) -> None:
-        """Инициализация класса, описывающего протокол ОВЕН."""
+class CacheInfo(NamedTuple):
+    """Статистика кэша пакетов запроса."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class OwenParam:
+    """Подготовленный параметр протокола ОВЕН.
+
+    Тип, функции упаковки и пакет запроса на чтение определяются один раз при
+    создании. Пакет запроса привязан к адресу устройства на момент создания.
+    """
+
+    __slots__ = ("index", "name", "pack", "packet", "protocol", "size", "type", "unpack")
+
+    def __init__(self, protocol: Owen, name: str, index: int | None) -> None:
+        """Подготовка параметра к чтению и записи."""
+
+        dev, index = protocol.check_index(name, index)
+        self.protocol = protocol
+        self.name = name
+        self.index = index
+        self.type = dev.type
+        self.pack = OWEN_TYPE[self.type]["pack"]
+        self.unpack = OWEN_TYPE[self.type]["unpack"]
+        self.packet = protocol.make_packet(1, name, index, b"")
+        self.size = protocol.response_size(name, index)
+
+    def __repr__(self) -> str:
+        """Строковое представление параметра."""
+
+        return f"OwenParam(name={self.name!r}, index={self.index}, type={self.type!r})"
+
+    def read(self) -> float | str:
+        """Чтение значения параметра."""
+
+        protocol = self.protocol
+        protocol.log_packet(self.packet, self.index)
+        with protocol.lock:
+            protocol.write(self.packet)
+            answer = protocol.receive(self.size)
+        data = protocol.parse_response(self.packet, answer)
+
+        try:
+            return self.unpack(data if self.index is None else data[:-2])
+        except error:
+            return protocol.unpack_value(self.type, data, self.index)   # код ошибки устройства
+
+    def write(self, value: float | str | None) -> bool:
+        """Запись значения параметра."""
+
+        data = b"" if value is None else self.pack(value)
+        result = self.protocol.send_message(0, self.name, self.index, data)
+        self.protocol.unpack_value(self.type, result, self.index)
+        return True
+
+
+class OwenCore:
+    """Общая часть протокола ОВЕН: формирование и разбор пакетов без обмена
+    данными с устройством.
+    """
+
+    frame_cache_size = 256
+
+    def __init__(self, unit: int, device: DeviceLike, addr_len_8: bool) -> None:
+        """Инициализация общей части протокола ОВЕН."""
+
+        self._frames: OrderedDict[tuple[str, int | None], bytes] = OrderedDict()
+        self._frames_lock = Lock()
+        self._hits = 0
+        self._misses = 0
 
         self.unit = unit
-        self.device = device["owen"]
+        table = device_table(device)
+        self.device = table.owen
         self.addr_len_8 = addr_len_8
+        self.commands = table.commands
 
-    def read(self) -> bytes:
-        """Чтение данных."""
+    @property
+    def unit(self) -> int:
+        """Адрес устройства."""
 
-        raise NotImplementedError
+        return self._unit
 
-    def write(self, packet: bytes) -> int | None:
-        """Запись данных."""
+    @unit.setter
+    def unit(self, value: int) -> None:
+        self._unit = value
+        self.cache_clear()
 
-        raise NotImplementedError
+    @property
+    def addr_len_8(self) -> bool:
+        """Длина адреса в битах (True=8, False=11)."""
+
+        return self._addr_len_8
+
+    @addr_len_8.setter
+    def addr_len_8(self, value: bool) -> None:
+        self._addr_len_8 = value
+        self.cache_clear()
+
+    def cache_info(self) -> CacheInfo:
+        """Статистика кэша пакетов запроса на чтение."""
+
+        return CacheInfo(self._hits, self._misses, self.frame_cache_size,
+                         len(self._frames))
+
+    def cache_clear(self) -> None:
+        """Очистка кэша пакетов запроса на чтение."""
+
+        with self._frames_lock:
+            self._frames.clear()
+            self._hits = self._misses = 0
 
     @staticmethod
     def fast_calc(value: int, crc: int, bits: int) -> int:
@@ -59,37 +166,45 @@ class Owen:
         return reduce(lambda crc, i: crc << 1 & 0xFFFF ^ (0x8F57
                       if (value << i ^ crc >> 8) & 0x80 else 0), range(bits), crc)
 
-    def owen_crc16(self, packet: tuple[int, ...]) -> int:
+    @staticmethod
+    def owen_crc16(packet: Iterable[int]) -> int:
         """Вычисление контрольной суммы."""
 
-        return reduce(lambda crc, val: self.fast_calc(val, crc, 8), packet, 0)
+        return crc16(packet)
 
-    def owen_hash(self, packet: tuple[int, ...]) -> int:
+    @staticmethod
+    def owen_hash(packet: Iterable[int]) -> int:
         """Вычисление hash-функции."""
 
-        return reduce(lambda crc, val: self.fast_calc(val << 1, crc, 7), packet, 0)
+        return owen_hash(packet)
 
     @staticmethod
     def name2code(name: str) -> tuple[int, ...]:
         """Преобразование локального идентификатора в числовой код."""
 
-        code: list[int] = reduce(lambda x, ch: [*x[:-1], x[-1] + 1] if ch == "."
-                                 else [*x, OWEN_ASCII[ch]], name.upper(), [])
-        return (*code, *[OWEN_ASCII[" "]] * (4 - len(code)))
+        return name2code(name)
 
     @staticmethod
-    def encode_frame(frame: tuple[int, ...]) -> bytes:
+    def encode_frame(frame: bytes | tuple[int, ...]) -> bytes:
         """Преобразование пакета из числового вида в строковый."""
 
-        chars = ([71 + (num >> 4), 71 + (num & 0xF)] for num in frame)
-        return bytes([HEADER, *sum(chars, []), FOOTER])
+        return b"#%b\r" % hexlify(bytes(frame)).translate(ENCODE_TABLE)
 
     @staticmethod
-    def decode_frame(frame: bytes) -> tuple[int, ...]:
+    def decode_bytes(frame: bytes) -> bytes:
+        """Преобразование пакета из строкового вида в двоичный."""
+
+        try:
+            return unhexlify(frame[1:-1].translate(DECODE_TABLE))
+        except ValueError:
+            msg = "Invalid message format"
+            raise OwenError(msg) from None
+
+    @classmethod
+    def decode_frame(cls, frame: bytes) -> tuple[int, ...]:
         """Преобразование пакета из строкового вида в числовой."""
 
-        pairs = zip(*[iter(frame[1:-1])] * 2)
-        return tuple((i - 71 << 4) + (j - 71 & 0xF) for i, j in pairs)
+        return tuple(cls.decode_bytes(frame))
 
     @staticmethod
     def pack_value(frmt: str, value: float | str | None) -> bytes:
@@ -113,24 +228,61 @@ class Owen:
 
     def make_packet(self, flag: int, name: str, index: int | None,
                           data: bytes) -> bytes:
-        """Формирование пакета для записи."""
+        """Формирование пакета для записи.
+
+        Пакеты запроса на чтение (flag=1, без данных) не зависят ни от чего,
+        кроме адреса, имени и индекса параметра, поэтому сохраняются в кэше.
+        """
+
+        packet: bytes | None
+        if flag != 1 or data:
+            packet = self._make_packet(flag, name, index, data)
+        else:
+            key = (name, index)
+            with self._frames_lock:
+                packet = self._frames.get(key)
+                if packet is not None:
+                    self._frames.move_to_end(key)
+                    self._hits += 1
+            if packet is None:
+                packet = self._make_packet(flag, name, index, data)
+                with self._frames_lock:
+                    self._misses += 1
+                    self._frames[key] = packet
+                    if len(self._frames) > self.frame_cache_size:
+                        self._frames.popitem(last=False)
+
+        self.log_packet(packet, index)
+        return packet
+
+    def log_packet(self, packet: bytes, index: int | None) -> None:
+        """Вывод отправляемого пакета в журнал (при каждой отправке, в том
+        числе пакетов из кэша).
+        """
+
+        if not _logger.isEnabledFor(logging.DEBUG):
+            return
+
+        frame = self.decode_bytes(packet)
+        _logger.debug("Send param: address=%d, flag=%d, size=%d, cmd=%04X, "
+                      "index=%s, data=%s, crc=%04X", self.unit, frame[1] >> 4 & 1,
+                      frame[1] & 0xF, frame[2] << 8 | frame[3], index, tuple(frame[4:-2]),
+                      frame[-2] << 8 | frame[-1])
+        _logger.debug("Send frame: %r, size=%d", packet, len(packet))
+
+    def _make_packet(self, flag: int, name: str, index: int | None,
+                           data: bytes) -> bytes:
+        """Построение пакета по полям протокола."""
 
         addr0, addr1 = (self.unit & 0xFF, 0) if self.addr_len_8 else \
                        (self.unit >> 3 & 0xFF, (self.unit & 0x07) << 5)
         if index is not None:
             data = bytes([*data, *index.to_bytes(2, "big")])
 
-        cmd = self.owen_hash(self.name2code(name))
-        frame = (addr0, addr1 | flag << 4 | len(data), *cmd.to_bytes(2, "big"), *data)
+        cmd = self.commands.code(name)
+        frame = bytes((addr0, addr1 | flag << 4 | len(data), cmd >> 8, cmd & 0xFF)) + data
         crc = self.owen_crc16(frame)
-        packet = self.encode_frame((*frame, *crc.to_bytes(2, "big")))
-
-        _logger.debug("Send param: address=%d, flag=%d, size=%d, cmd=%04X, "
-                      "index=%s, data=%s, crc=%04X", self.unit, flag, len(data),
-                      cmd, index, tuple(data), crc)
-        _logger.debug("Send frame: %r, size=%d", packet, len(packet))
-
-        return packet
+        return self.encode_frame(frame + crc.to_bytes(2, "big"))
 
     def parse_response(self, packet: bytes, answer: bytes) -> bytes:
         """Расшифровка прочитанного пакета."""
@@ -141,17 +293,23 @@ class Owen:
             msg = "Invalid message format"
             raise OwenError(msg)
 
-        frame = self.decode_frame(answer)
+        frame = self.decode_bytes(answer)
+        if len(frame) < 6 or len(frame) != (frame[1] & 0xF) + 6:
+            msg = "Invalid message format"
+            raise OwenError(msg)
 
         address = frame[0] if self.addr_len_8 else frame[0] << 3 | frame[1] >> 5
         flag = frame[1] >> 4 & 1
         size = frame[1] & 0xF
-        cmd, *data, crc = unpack(f">H{size}BH", bytes(frame[2:]))
+        cmd = frame[2] << 8 | frame[3]
+        crc = frame[-2] << 8 | frame[-1]
+        data = frame[4:-2]
 
-        _logger.debug("Recv param: address=%d, flag=%d, size=%d, cmd=%04X, data=%s, "
-                      "crc=%04X", address, flag, size, cmd, tuple(data), crc)
+        _logger.debug("Recv param: address=%d, flag=%d, size=%d, cmd=%04X, name=%s, "
+                      "data=%s, crc=%04X", address, flag, size, cmd,
+                      self.commands.name(cmd), tuple(data), crc)
 
-        if self.owen_crc16(frame[:-2]) != crc:
+        if self.owen_crc16(memoryview(frame)[:-2]) != crc:
             msg = "Checksum error"
             raise OwenError(msg)
         if address != self.unit:
@@ -161,43 +319,259 @@ class Owen:
             msg = "Network error={:02X}, hash={:02X}{:02X}".format(*data)
             raise OwenError(msg)
 
-        return bytes(data)
+        return data
 
-    def send_message(self, flag: int, name: str, index: int | None,
-                           data: bytes = b"") -> bytes:
-        """Обмен данными с устройством."""
+    def response_size(self, name: str, index: int | None) -> int | None:
+        """Ожидаемая длина ответа на запрос чтения в символах."""
 
-        packet = self.make_packet(flag, name, index, data)
-        self.write(packet)
-        answer = self.read()
-        return self.parse_response(packet, answer)
+        dev = self.device.get(name)
+        size = dev and dev.size
+        if size is None:
+            return None
+        if index is not None:
+            size += 2
+
+        return 2 + 2 * (6 + size)
 
-    def check_index(self, name: str, index: int | None) -> tuple[OWEN, int | None]:
+    def check_index(self, name: str, index: int | None) -> tuple[OwenParamInfo, int | None]:
         """Проверка индекса."""
 
         dev = self.device[name]
 
         if not index:
-            index = None if None in dev["index"] else 0
-        if index not in dev["index"]:
+            index = None if None in dev.indexes else 0
+        if index not in dev.indexes:
             msg = f"'{name}' does not support index '{index}'"
             raise OwenError(msg)
 
         return dev, index
 
+    def resolve_many(self, items: Iterable[tuple[str, int | None]],
+                     ) -> tuple[dict[tuple[str, int | None], OwenError],
+                                dict[tuple[str, int | None], tuple[OwenParamInfo, list[tuple[str, int | None]]]]]:
+        """Проверка группы параметров.
+
+        Returns:
+            Ошибки неизвестных параметров и индексов, а также словарь
+            {(название, индекс): (описание параметра, исходные ключи)}, в
+            котором повторяющиеся параметры объединены
+
+        """
+
+        errors: dict[tuple[str, int | None], OwenError] = {}
+        plan: dict[tuple[str, int | None], tuple[OwenParamInfo, list[tuple[str, int | None]]]] = {}
+
+        for name, index in items:
+            try:
+                dev, idx = self.check_index(name, index)
+            except KeyError:
+                errors[name, index] = OwenError(f"Unknown parameter '{name}'")
+            except OwenError as err:
+                errors[name, index] = err
+            else:
+                plan.setdefault((name, idx), (dev, []))[1].append((name, index))
+
+        return errors, plan
+
+    def decode_raw(self, name: str, index: int | None, raw: bytes) -> float | str:
+        """Распаковка данных, прочитанных get_raw_many."""
+
+        dev, index = self.check_index(name, index)
+        return self.unpack_value(dev.type, raw, index)
+
+
+class Owen(OwenCore):
+    """Класс, описывающий протокол ОВЕН."""
+
+    # Необязательное чтение с ожидаемой длиной ответа в символах (например,
+    # OwenSerialTransport.read). Если не задано, вызывается read() без аргументов.
+    read_size: Callable[[int | None], bytes] | None = None
+
+    def __init__(self, unit: int, device: DeviceLike, addr_len_8: bool) -> None:
+        """Инициализация класса, описывающего протокол ОВЕН."""
+
+        super().__init__(unit, device, addr_len_8)
+        self.lock: RLock | BusLock = RLock()    # блокировка шины на время обмена
+
+    def read(self) -> bytes:
+        """Чтение данных."""
+
+        raise NotImplementedError
+
+    def write(self, packet: bytes) -> int | None:
+        """Запись данных."""
+
+        raise NotImplementedError
+
+    def send_message(self, flag: int, name: str, index: int | None,
+                           data: bytes = b"") -> bytes:
+        """Обмен данными с устройством."""
+
+        packet = self.make_packet(flag, name, index, data)
+        with self.lock:
+            self.write(packet)
+            answer = self.receive(self.response_size(name, index) if flag else len(packet))
+        return self.parse_response(packet, answer)
+
+    def receive(self, size: int | None) -> bytes:
+        """Чтение ответа (с ожидаемой длиной, если задан read_size)."""
+
+        return self.read() if self.read_size is None else self.read_size(size)
+
+    def prepare(self, name: str, index: int | None = None) -> OwenParam:
+        """Подготовка параметра для многократного чтения и записи."""
+
+        return OwenParam(self, name, index)
+
     def get_param(self, name: str, index: int | None = None) -> float | str:
         """Чтение данных из устройства."""
 
         dev, index = self.check_index(name, index)
         result = self.send_message(1, name, index)
-        return self.unpack_value(dev["type"], result, index)
+        return self.unpack_value(dev.type, result, index)
+
+    def get_many(self, items: Iterable[tuple[str, int | None]],
+                 ) -> dict[tuple[str, int | None], float | str | OwenError]:
+        """Чтение группы параметров из устройства.
+
+        Повторяющиеся параметры читаются один раз. Ошибка чтения параметра
+        возвращается вместо его значения и не прерывает чтение остальных.
+        """
+
+        errors, plan = self.resolve_many(items)
+        result: dict[tuple[str, int | None], float | str | OwenError] = dict(errors)
+
+        for (name, index), (dev, keys) in plan.items():
+            try:
+                value: float | str | OwenError = self.unpack_value(dev.type, self.send_message(1, name, index), index)
+            except OwenError as err:
+                value = err
+            except (error, TypeError, ValueError) as err:
+                value = OwenError(err)
+            result.update(dict.fromkeys(keys, value))
+
+        return result
+
+    def get_raw_many(self, items: Iterable[tuple[str, int | None]],
+                     ) -> dict[tuple[str, int | None], bytes | OwenError]:
+        """Чтение группы параметров из устройства без распаковки.
+
+        Returns:
+            Словарь {(название, индекс): данные ответа или OwenError}
+
+        """
+
+        errors, plan = self.resolve_many(items)
+        result: dict[tuple[str, int | None], bytes | OwenError] = dict(errors)
+
+        for (name, index), (_, keys) in plan.items():
+            try:
+                value: bytes | OwenError = self.send_message(1, name, index)
+            except OwenError as err:
+                value = err
+            result.update(dict.fromkeys(keys, value))
+
+        return result
 
     def set_param(self, name: str, index: int | None = None,
                         value: float | str | None = None) -> bool:
         """Запись данных в устройство."""
 
         dev, index = self.check_index(name, index)
-        data = self.pack_value(dev["type"], value)
+        data = self.pack_value(dev.type, value)
         result = self.send_message(0, name, index, data)
-        self.unpack_value(dev["type"], result, index)
+        self.unpack_value(dev.type, result, index)
         return True
+
+    def set_many(self, items: Mapping[tuple[str, int | None], float | str],
+                 ) -> dict[tuple[str, int | None], bool | OwenError]:
+        """Запись группы параметров в устройство.
+
+        Протокол ОВЕН не поддерживает групповую запись, поэтому параметры
+        записываются по одному. Ошибка записи параметра возвращается вместо
+        True и не прерывает запись остальных.
+        """
+
+        result: dict[tuple[str, int | None], bool | OwenError] = {}
+        for (name, index), value in items.items():
+            try:
+                result[name, index] = self.set_param(name, index, value)
+            except KeyError:
+                result[name, index] = OwenError(f"Unknown parameter '{name}'")
+            except OwenError as err:
+                result[name, index] = err
+            except (error, TypeError, ValueError) as err:
+                result[name, index] = OwenError(err)
+        return result
+
+
+class AsyncOwen(OwenCore):
+    """Класс, описывающий протокол ОВЕН, для работы в asyncio.
+
+    Упаковка запросов и разбор ответов выполняются методами класса OwenCore,
+    обмен данными с устройством - сопрограммой exchange транспорта.
+    """
+
+    async def exchange(self, packet: bytes, size: int | None = None) -> bytes:
+        """Отправка запроса и получение ответа."""
+
+        raise NotImplementedError
+
+    async def send_message(self, flag: int, name: str, index: int | None,
+                                 data: bytes = b"") -> bytes:
+        """Обмен данными с устройством."""
+
+        packet = self.make_packet(flag, name, index, data)
+        answer = await self.exchange(packet, self.response_size(name, index) if flag else len(packet))
+        return self.parse_response(packet, answer)
+
+    async def get_param(self, name: str, index: int | None = None) -> float | str:
+        """Чтение данных из устройства."""
+
+        dev, index = self.check_index(name, index)
+        result = await self.send_message(1, name, index)
+        return self.unpack_value(dev.type, result, index)
+
+    async def get_many(self, items: Iterable[tuple[str, int | None]],
+                       ) -> dict[tuple[str, int | None], float | str | OwenError]:
+        """Чтение группы параметров из устройства."""
+
+        errors, plan = self.resolve_many(items)
+        result: dict[tuple[str, int | None], float | str | OwenError] = dict(errors)
+
+        for (name, index), (dev, keys) in plan.items():
+            try:
+                value: float | str | OwenError = self.unpack_value(dev.type, await self.send_message(1, name, index), index)
+            except OwenError as err:
+                value = err
+            except (error, TypeError, ValueError) as err:
+                value = OwenError(err)
+            result.update(dict.fromkeys(keys, value))
+
+        return result
+
+    async def set_param(self, name: str, index: int | None = None,
+                              value: float | str | None = None) -> bool:
+        """Запись данных в устройство."""
+
+        dev, index = self.check_index(name, index)
+        data = self.pack_value(dev.type, value)
+        result = await self.send_message(0, name, index, data)
+        self.unpack_value(dev.type, result, index)
+        return True
+
+    async def set_many(self, items: Mapping[tuple[str, int | None], float | str],
+                       ) -> dict[tuple[str, int | None], bool | OwenError]:
+        """Запись группы параметров в устройство."""
+
+        result: dict[tuple[str, int | None], bool | OwenError] = {}
+        for (name, index), value in items.items():
+            try:
+                result[name, index] = await self.set_param(name, index, value)
+            except KeyError:
+                result[name, index] = OwenError(f"Unknown parameter '{name}'")
+            except OwenError as err:
+                result[name, index] = err
+            except (error, TypeError, ValueError) as err:
+                result[name, index] = OwenError(err)
+        return result
@@ -7,9 +7,27 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import logging
+import os
+from typing import TYPE_CHECKING, Any, cast
 
 from serial import Serial
+from serial.serialutil import Timeout
+
+from owen.bus import AsyncSingleFlight, registry
+from owen.owen.parser import FOOTER, FrameParser
+
+if TYPE_CHECKING:
+    from owen.bus import SerialBus
+
+try:
+    import serial_asyncio  # type: ignore[import-untyped]
+except ImportError:
+    serial_asyncio = None
+
+_logger = logging.getLogger(__name__)
+_logger.addHandler(logging.NullHandler())
 
 
 class OwenSerialTransport:
@@ -22,33 +40,214 @@ class OwenSerialTransport:
                        bytesize: int = 8,
                        parity: str = "N",
                        stopbits: int = 1,
+                       low_latency: bool = False,
                        **kwargs: Any) -> None:
         """Инициализация класса транспорта для взаимодействия с устройством по
         протоколу ОВЕН через интерфейс RS485.
+
+        Args:
+            low_latency: Режим минимальной задержки: чтение ответа известной
+                         длины с межсимвольным тайм-аутом, флаг low latency
+                         порта в Linux и минимальный latency timer адаптеров FTDI
+
         """
 
-        self.socket = Serial(port=port,
-                             baudrate=baudrate,
-                             bytesize=bytesize,
-                             parity=parity,
-                             stopbits=stopbits,
-                             **kwargs)
+        if low_latency:
+            kwargs.setdefault("inter_byte_timeout", max(0.01, 30 * 11 / baudrate))
+
+        settings = dict(baudrate=baudrate, bytesize=bytesize, parity=parity,
+                        stopbits=stopbits, **kwargs)
+        self.bus: SerialBus | None = registry.acquire(port, "owen", settings,
+                                                      lambda: Serial(port=port, **settings))
+        self.socket = self.bus.socket
+        self.lock = self.bus.lock
+        self.flights = self.bus.flights
+        self.parser = FrameParser()
+
+        if low_latency and self.socket.is_open:
+            self.set_low_latency()
+
+    def set_low_latency(self) -> None:
+        """Включение режима минимальной задержки порта, если он доступен."""
+
+        try:
+            self.socket.set_low_latency_mode(True)
+        except (AttributeError, OSError, ValueError) as err:
+            _logger.debug("Low latency mode is not available: %s", err)
+
+        name = os.path.basename(os.path.realpath(self.socket.port))
+        try:
+            with open(f"/sys/bus/usb-serial/devices/{name}/latency_timer", "w") as f:
+                f.write("1")
+        except OSError as err:
+            _logger.debug("FTDI latency timer is not available: %s", err)
 
     def __del__(self) -> None:
-        """Закрытие соединения с устройством при удалении объекта."""
+        """Освобождение порта при удалении объекта."""
 
-        if hasattr(self, "socket"):
-            self.socket.close()
+        self.close()
+
+    def close(self) -> None:
+        """Освобождение порта; порт закрывается вместе с последним транспортом."""
+
+        bus = getattr(self, "bus", None)
+        if bus is not None:
+            registry.release(bus)
+            self.bus = None
 
     def write(self, packet: bytes) -> int | None:
         """Запись данных по интерфейсу."""
 
         self.socket.reset_input_buffer()
-        self.socket.reset_output_buffer()
+        self.parser.reset(echo=packet)
 
         return self.socket.write(packet)
 
-    def read(self) -> bytes:
-        """Чтение данных по интерфейсу."""
+    def read(self, size: int | None = None) -> bytes:
+        """Чтение данных по интерфейсу.
+
+        Мусор, оборванные пакеты и эхо запроса пропускаются, чтение
+        продолжается до получения первого корректного пакета или истечения
+        тайм-аута. Если задан межсимвольный тайм-аут и известна ожидаемая
+        длина ответа, первым чтением запрашивается сразу весь пакет.
+        """
+
+        if not self.socket.inter_byte_timeout:
+            size = None
+
+        timeout = Timeout(self.socket.timeout)
+        while True:
+            if size:
+                chunk = self.socket.read(size)
+                complete = len(chunk) == size
+                size = None
+            else:
+                chunk = self.socket.read_until(FOOTER)
+                complete = chunk.endswith(FOOTER)
+
+            frames = self.parser.feed(chunk)
+            if frames:
+                return frames[0]
+            if not complete or timeout.expired():
+                return b""
+
+
+class AsyncOwenSerialTransport(asyncio.Protocol):
+    """Класс асинхронного транспорта для взаимодействия с устройством по
+    протоколу ОВЕН через интерфейс RS485.
+
+    Требует установленного пакета pyserial-asyncio (pip install
+    python-owen[asyncio]). Входящие данные разбираются по мере поступления,
+    обмены разных устройств на одной шине выполняются по очереди.
+    """
+
+    def __init__(self, port: str,
+                       baudrate: int = 9600,
+                       bytesize: int = 8,
+                       parity: str = "N",
+                       stopbits: int = 1,
+                       timeout: float = 1.0,
+                       **kwargs: Any) -> None:
+        """Инициализация класса асинхронного транспорта для взаимодействия с
+        устройством по протоколу ОВЕН через интерфейс RS485.
+
+        Args:
+            timeout: Время ожидания ответа устройства, с
+
+        """
+
+        self.port = port
+        self.timeout = timeout
+        self._settings = dict(baudrate=baudrate, bytesize=bytesize,
+                              parity=parity, stopbits=stopbits, **kwargs)
+        self.socket: asyncio.Transport | None = None
+        self.parser = FrameParser()
+        self._waiter: asyncio.Future[bytes] | None = None
+        self._lock: asyncio.Lock | None = None
+        self.flights = AsyncSingleFlight()
+
+    async def __aenter__(self) -> AsyncOwenSerialTransport:
+        """Открытие порта при входе в блок async with."""
+
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Закрытие порта при выходе из блока async with."""
+
+        self.close()
+
+    async def connect(self) -> None:
+        """Открытие порта."""
+
+        if serial_asyncio is None:
+            msg = "pyserial-asyncio is required for asynchronous serial transport"
+            raise ImportError(msg)
+
+        loop = asyncio.get_running_loop()
+        await serial_asyncio.create_serial_connection(loop, lambda: self, self.port,
+                                                      **self._settings)
+
+    def close(self) -> None:
+        """Закрытие порта."""
+
+        if self.socket is not None:
+            self.socket.close()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Сохранение транспорта asyncio после открытия порта."""
+
+        self.socket = cast(asyncio.Transport, transport)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Завершение ожидающего чтения при закрытии порта."""
+
+        self.socket = None
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(b"")
+
+    def data_received(self, data: bytes) -> None:
+        """Разбор входящих данных и передача первого пакета ожидающему чтению."""
+
+        frames = self.parser.feed(data)
+        if frames and self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(frames[0])
+
+    async def write(self, packet: bytes) -> int | None:
+        """Запись данных по интерфейсу."""
+
+        if self.socket is None:
+            msg = f"Port '{self.port}' is not open"
+            raise ConnectionError(msg)
+
+        self.parser.reset(echo=packet)
+        self._waiter = asyncio.get_running_loop().create_future()
+        self.socket.write(packet)
+        return len(packet)
+
+    async def read(self, size: int | None = None) -> bytes:
+        """Чтение данных по интерфейсу.
+
+        Возвращает первый корректный пакет после последней записи или пустую
+        строку по истечении тайм-аута.
+        """
+
+        if self._waiter is None:
+            return b""
+
+        try:
+            return await asyncio.wait_for(self._waiter, self.timeout)
+        except asyncio.TimeoutError:
+            return b""
+        finally:
+            self._waiter = None
+
+    async def exchange(self, packet: bytes, size: int | None = None) -> bytes:
+        """Отправка запроса и получение ответа с блокировкой шины."""
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
 
-        return self.socket.read_until(b"\r")
+        async with self._lock:
+            await self.write(packet)
+            return await self.read(size)
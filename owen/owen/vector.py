@@ -0,0 +1,155 @@
+#! /usr/bin/env python3
+
+"""Векторная распаковка значений протокола ОВЕН в массивы NumPy.
+
+Модуль требует установленного пакета numpy (pip install python-owen[numpy]).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+from owen.exception import OwenError
+from owen.owen.converter import OWEN_TYPE
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import DTypeLike, NDArray
+
+BCD_DIGITS = 18     # максимальное количество цифр BCD, помещающееся в int64
+
+
+DTYPES: dict[str, DTypeLike] = {
+    "U8": ">u1",
+    "I8": ">i1",
+    "U16": ">u2",
+    "I16": ">i2",
+    "U32": ">u4",
+    "I32": ">i4",
+    "F24": ">f4",
+    "F32": ">f4",
+    "U24": [("high", ">u1"), ("low", ">u2")],
+    "F32+T": [("value", ">f4"), ("time", ">u2")],
+}
+
+
+def _matrix(values: Sequence[bytes], index: bool) -> NDArray:
+    """Объединение пакетов одинаковой длины в матрицу байт."""
+
+    sizes = {len(value) for value in values}
+    if len(sizes) > 1:
+        msg = "Values have different sizes"
+        raise OwenError(msg)
+
+    size = sizes.pop() if sizes else 2 * index
+    data = np.frombuffer(b"".join(values), dtype=np.uint8).reshape(len(values), size)
+    return data[:, :-2] if index else data
+
+
+def _fixed(frmt: str, data: NDArray) -> NDArray:
+    """Распаковка данных фиксированного размера."""
+
+    if not len(data):
+        return np.empty(0, dtype=DTYPES[frmt])
+
+    size = OWEN_TYPE[frmt]["size"] or 0                         # у типов из DTYPES размер фиксирован
+    if data.shape[1] < size:
+        msg = f"Values are too short for type '{frmt}'"
+        raise OwenError(msg)
+
+    buffer = np.zeros((len(data), 4 if frmt == "F24" else size), dtype=np.uint8)
+    buffer[:, :size] = data[:, :size]                           # F24 дополняется нулем
+    return buffer.view(DTYPES[frmt]).reshape(len(data))
+
+
+def _integer(data: NDArray) -> NDArray:
+    """Преобразование байт big-endian в целые числа."""
+
+    weights = 1 << 8 * np.arange(data.shape[1] - 1, -1, -1, dtype=np.int64)
+    return data.astype(np.int64) @ weights
+
+
+def _sdot(data: NDArray) -> NDArray:
+    """Распаковка данных типа STORED_DOT одной длины."""
+
+    value = _integer(data)
+    size = data.shape[1] * 8 - 4
+
+    sign = np.where(value >> size + 3 & 1, -1.0, 1.0)
+    exponent = value >> size & 7
+    mantissa = value & (1 << size) - 1
+    # те же множители, что и при скалярной распаковке, для совпадения результата
+    pow10 = np.array([10 ** (-exp) for exp in range(8)], dtype=np.float64)
+    return sign * pow10[exponent] * mantissa
+
+
+def _bcd(data: NDArray) -> NDArray:
+    """Распаковка двоично-десятичных данных одной длины."""
+
+    digits = np.stack((data >> 4, data & 0xF), axis=-1).reshape(len(data), 2 * data.shape[1])
+    if (digits > 9).any():
+        msg = "Invalid BCD value"
+        raise OwenError(msg)
+
+    count = digits.shape[1]
+    if count > BCD_DIGITS:
+        # длинные значения распаковываются в целые числа Python без переполнения
+        weights = np.array([10 ** power for power in range(count - 1, -1, -1)], dtype=object)
+        return digits.astype(object) @ weights
+
+    weights = 10 ** np.arange(count - 1, -1, -1, dtype=np.int64)
+    return digits.astype(np.int64) @ weights
+
+
+def _grouped(func: Callable[[NDArray], NDArray], values: Sequence[bytes],
+             index: bool, dtype: str) -> NDArray:
+    """Распаковка данных переменной длины группами одинаковой длины."""
+
+    result = np.empty(len(values), dtype=dtype)
+    groups: dict[int, list[int]] = {}
+    for pos, value in enumerate(values):
+        groups.setdefault(len(value), []).append(pos)
+
+    for positions in groups.values():
+        part = func(_matrix([values[pos] for pos in positions], index))
+        if part.dtype == object and result.dtype != object:
+            result = result.astype(object)
+        result[positions] = part
+    return result
+
+
+def unpack_array(frmt: str, values: Sequence[bytes], index: bool = False) -> NDArray:
+    """Распаковка последовательности значений одного формата в массив NumPy.
+
+    Args:
+        frmt: Тип данных (F24, F32, I16, SDOT и т.д.)
+        values: Данные, полученные от устройства
+        index: Данные содержат индекс параметра (последние 2 байта)
+
+    """
+
+    if np is None:
+        msg = "NumPy is required for array unpacking"
+        raise ImportError(msg)
+
+    if frmt in DTYPES:
+        return _fixed(frmt, _matrix(values, index))
+    if frmt == "SDOT":
+        return _grouped(_sdot, values, index, "f8")
+    if frmt == "DOT0":
+        return _grouped(_bcd, values, index, "i8")
+    if frmt == "DOT3":
+        return _grouped(_bcd, values, index, "i8") / 1000.0
+    if frmt == "CLK":
+        data = _matrix(values, index)[:, :6]
+        fields = (data[:, :3], data[:, 3:4], data[:, 4:5], data[:, 5:6])
+        return np.stack([_bcd(field) for field in fields], axis=1)
+
+    msg = f"Type '{frmt}' is not supported"
+    raise OwenError(msg)
@@ -0,0 +1,431 @@
+#! /usr/bin/env python3
+
+"""Планировщик периодического опроса параметров устройств ОВЕН."""
+
+from __future__ import annotations
+
+import logging
+from struct import error
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
+from owen.exception import OwenError
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from owen.client import OwenDevice
+
+_logger = logging.getLogger(__name__)
+_logger.addHandler(logging.NullHandler())
+
+
+class PollStats(NamedTuple):
+    """Статистика опроса параметра."""
+
+    reads: int          # количество выполненных чтений
+    errors: int         # количество ошибок чтения
+    skipped: int        # количество пропущенных циклов
+    rate: float         # фактическая частота опроса, 1/с
+    lateness: float     # среднее опоздание чтения относительно расписания, с
+    lateness_max: float  # максимальное опоздание, с
+
+
+class PollItem:
+    """Параметр, опрашиваемый с заданным периодом."""
+
+    def __init__(self, device: OwenDevice, name: str, index: int | None,
+                       period: float, priority: int,
+                       callback: Callable[[PollItem], None] | None) -> None:
+        """Инициализация параметра опроса.
+
+        Args:
+            device: Устройство
+            name: Название параметра
+            index: Индекс параметра
+            period: Период опроса, с
+            priority: Приоритет (при перегрузке шины параметры с меньшим
+                      приоритетом пропускают циклы опроса)
+            callback: Функция, вызываемая после каждого чтения
+
+        """
+
+        if period <= 0:
+            msg = f"Invalid poll period {period}"
+            raise OwenError(msg)
+
+        self.device = device
+        self.name = name
+        self.index = index
+        self.period = period
+        self.priority = priority
+        self.callback = callback
+
+        self.next_due = 0.0
+        self.value: float | str | None = None
+        self.error: OwenError | None = None
+        self.timestamp: float | None = None
+
+        self._count = 0
+        self._errors = 0
+        self._skipped = 0
+        self._lateness = 0.0
+        self._lateness_max = 0.0
+        self._started: float | None = None
+
+    def __repr__(self) -> str:
+        """Строковое представление параметра опроса."""
+
+        return f"PollItem(name={self.name!r}, index={self.index}, period={self.period}, priority={self.priority})"
+
+    def record(self, value: float | str | OwenError, lateness: float, now: float) -> None:
+        """Сохранение результата чтения."""
+
+        if self._started is None:
+            self._started = now
+        self._count += 1
+        self._lateness += lateness
+        self._lateness_max = max(self._lateness_max, lateness)
+
+        self.timestamp = now
+        if isinstance(value, OwenError):
+            self._errors += 1
+            self.error = value
+        else:
+            self.value = value
+            self.error = None
+
+    def decode(self, raw: bytes | OwenError) -> float | str | OwenError:
+        """Распаковка прочитанных данных параметра."""
+
+        if isinstance(raw, OwenError):
+            return raw
+        try:
+            return self.device.decode_raw(self.name, self.index, raw)
+        except OwenError as err:
+            return err
+        except (error, TypeError, ValueError) as err:
+            return OwenError(err)
+
+    def update(self, raw: bytes | OwenError, lateness: float, now: float) -> bool:
+        """Обработка прочитанных данных.
+
+        Returns:
+            Признак необходимости вызова callback
+
+        """
+
+        self.record(self.decode(raw), lateness, now)
+        return True
+
+    def reschedule(self, now: float) -> None:
+        """Расчет времени следующего чтения.
+
+        Время отсчитывается от расписания, а не от момента чтения, поэтому
+        задержки не накапливаются. Пропущенные из-за перегрузки циклы
+        учитываются в статистике.
+        """
+
+        self.next_due += self.period
+        if self.next_due <= now:
+            missed = int((now - self.next_due) // self.period) + 1
+            self._skipped += missed
+            self.next_due += missed * self.period
+
+    def stats(self, now: float | None = None) -> PollStats:
+        """Статистика опроса параметра."""
+
+        now = monotonic() if now is None else now
+        elapsed = now - self._started if self._started is not None else 0.0
+        rate = (self._count - 1) / elapsed if self._count > 1 and elapsed > 0 else 0.0
+        lateness = self._lateness / self._count if self._count else 0.0
+        return PollStats(self._count, self._errors, self._skipped, rate, lateness, self._lateness_max)
+
+
+class Subscription(PollItem):
+    """Параметр, об изменениях которого сообщается через callback.
+
+    Прочитанные данные сравниваются с предыдущими до распаковки: если ответ
+    устройства не изменился, значение не распаковывается. Callback
+    вызывается, только если значение изменилось больше зоны нечувствительности,
+    при появлении или исчезновении ошибки чтения, а также по истечении
+    heartbeat с момента предыдущего вызова.
+    """
+
+    def __init__(self, device: OwenDevice, name: str, index: int | None,
+                       period: float, priority: int,
+                       callback: Callable[[PollItem], None] | None,
+                       deadband: float = 0.0, percent: bool = False,
+                       heartbeat: float | None = None) -> None:
+        """Инициализация подписки на изменения параметра.
+
+        Args:
+            deadband: Зона нечувствительности (абсолютная или в процентах)
+            percent: Зона нечувствительности задана в процентах от последнего
+                     переданного значения
+            heartbeat: Максимальный интервал между вызовами callback, с
+                       (None - только при изменении)
+
+        """
+
+        super().__init__(device, name, index, period, priority, callback)
+        if deadband < 0:
+            msg = f"Invalid deadband {deadband}"
+            raise OwenError(msg)
+
+        self.deadband = deadband
+        self.percent = percent
+        self.heartbeat = heartbeat
+
+        self.raw: bytes | None = None
+        self.reported: float | str | OwenError | None = None
+        self.reported_at: float | None = None
+        self.decoded = 0                # количество распаковок
+        self.notified = 0               # количество вызовов callback
+
+    def __repr__(self) -> str:
+        """Строковое представление подписки."""
+
+        return (f"Subscription(name={self.name!r}, index={self.index}, period={self.period}, "
+                f"deadband={self.deadband}{'%' if self.percent else ''}, heartbeat={self.heartbeat})")
+
+    def changed(self, value: float | str | OwenError) -> bool:
+        """Проверка выхода значения за зону нечувствительности."""
+
+        reported = self.reported
+        if self.reported_at is None or reported is None:
+            return True
+        if isinstance(value, OwenError) or isinstance(reported, OwenError):
+            return isinstance(value, OwenError) != isinstance(reported, OwenError)
+        if isinstance(value, str) or isinstance(reported, str):
+            return value != reported
+
+        deadband = self.deadband * abs(reported) / 100 if self.percent else self.deadband
+        return abs(value - reported) > deadband
+
+    def update(self, raw: bytes | OwenError, lateness: float, now: float) -> bool:
+        """Обработка прочитанных данных.
+
+        Returns:
+            Признак необходимости вызова callback
+
+        """
+
+        if self.raw is not None and raw == self.raw and self.value is not None:
+            self.record(self.value, lateness, now)
+            changed = False
+        else:
+            value = self.decode(raw)
+            # ошибка чтения или распаковки не кэшируется
+            self.raw = None if isinstance(raw, OwenError) or isinstance(value, OwenError) else raw
+            self.decoded += 1
+            self.record(value, lateness, now)
+            changed = self.changed(value)
+
+        expired = (self.heartbeat is not None and self.reported_at is not None
+                   and now - self.reported_at >= self.heartbeat)
+        if not changed and not expired:
+            return False
+
+        self.reported = self.error or self.value
+        self.reported_at = now
+        self.notified += 1
+        return True
+
+
+class Scheduler:
+    """Планировщик периодического опроса параметров.
+
+    Параметры устройств одной шины опрашиваются одним потоком: в каждом цикле
+    параметры, время чтения которых наступило, упорядочиваются по приоритету
+    и читаются группами по устройствам (get_many), что позволяет объединять
+    запросы. Параметр, опоздавший больше чем на свой период, пропускает цикл,
+    если на шине есть параметры с большим приоритетом.
+    """
+
+    def __init__(self, clock: Callable[[], float] = monotonic) -> None:
+        """Инициализация планировщика."""
+
+        self.clock = clock
+        self._buses: dict[Hashable, list[PollItem]] = {}
+        self._wake: dict[Hashable, Event] = {}
+        self._threads: dict[Hashable, Thread] = {}
+        self._lock = Lock()
+        self._stop = Event()
+        self._running = False
+
+    def __enter__(self) -> Scheduler:
+        """Запуск опроса при входе в блок with."""
+
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Остановка опроса при выходе из блока with."""
+
+        self.stop()
+
+    @staticmethod
+    def bus(device: OwenDevice) -> Hashable:
+        """Идентификатор шины устройства (блокировка транспорта)."""
+
+        return device.lock
+
+    def add(self, device: OwenDevice, name: str, index: int | None = None,
+                  period: float = 1.0, priority: int = 0,
+                  callback: Callable[[PollItem], None] | None = None) -> PollItem:
+        """Добавление параметра в расписание опроса."""
+
+        return self._add(PollItem(device, name, index, period, priority, callback))
+
+    def subscribe(self, device: OwenDevice, name: str, index: int | None = None,
+                        callback: Callable[[PollItem], None] | None = None,
+                        period: float = 1.0, deadband: float = 0.0,
+                        percent: bool = False, heartbeat: float | None = None,
+                        priority: int = 0) -> Subscription:
+        """Подписка на изменения параметра (см. Subscription)."""
+
+        item = Subscription(device, name, index, period, priority, callback,
+                            deadband, percent, heartbeat)
+        self._add(item)
+        return item
+
+    def _add(self, item: PollItem) -> PollItem:
+        """Добавление параметра в расписание опроса."""
+
+        item.next_due = self.clock()
+        bus = self.bus(item.device)
+
+        with self._lock:
+            self._buses.setdefault(bus, []).append(item)
+            self._wake.setdefault(bus, Event()).set()
+            if self._running and bus not in self._threads:
+                self._start_bus(bus)
+        return item
+
+    def remove(self, item: PollItem) -> None:
+        """Удаление параметра из расписания опроса."""
+
+        with self._lock:
+            items = self._buses.get(self.bus(item.device), [])
+            if item in items:
+                items.remove(item)
+
+    def items(self) -> list[PollItem]:
+        """Список всех параметров опроса."""
+
+        with self._lock:
+            return [item for items in self._buses.values() for item in items]
+
+    def plan(self) -> dict[Hashable, list[PollItem]]:
+        """План цикла опроса по шинам: параметры в порядке убывания приоритета
+        и возрастания периода.
+        """
+
+        with self._lock:
+            return {bus: sorted(items, key=lambda item: (-item.priority, item.period))
+                    for bus, items in self._buses.items()}
+
+    def load(self, bus: Hashable) -> float:
+        """Требуемая частота чтений на шине, 1/с."""
+
+        with self._lock:
+            return sum(1.0 / item.period for item in self._buses.get(bus, []))
+
+    def step(self, bus: Hashable) -> float:
+        """Выполнение наступивших чтений на шине.
+
+        Returns:
+            Время до следующего чтения, с
+
+        """
+
+        with self._lock:
+            items = list(self._buses.get(bus, []))
+        if not items:
+            return float("inf")
+
+        now = self.clock()
+        due = sorted((item for item in items if item.next_due <= now),
+                     key=lambda item: (-item.priority, item.next_due))
+        top = max(item.priority for item in items)
+
+        groups: dict[OwenDevice, list[PollItem]] = {}
+        for item in due:
+            groups.setdefault(item.device, []).append(item)
+
+        for device, group in groups.items():
+            now = self.clock()
+            batch = []
+            for item in group:
+                if item.priority < top and now - item.next_due >= item.period:
+                    item.reschedule(now)            # перегрузка: цикл пропускается
+                else:
+                    batch.append((item, now - item.next_due))
+            if batch:
+                self.poll(device, batch)
+
+        return min(item.next_due for item in items) - self.clock()
+
+    def poll(self, device: OwenDevice, batch: list[tuple[PollItem, float]]) -> None:
+        """Чтение группы параметров устройства и обработка результатов."""
+
+        result: dict[tuple[str, int | None], bytes | OwenError]
+        try:
+            result = device.get_raw_many([(item.name, item.index) for item, _ in batch])
+        except Exception as err:
+            _logger.exception("Polling failed")
+            result = dict.fromkeys(((item.name, item.index) for item, _ in batch), OwenError(err))
+
+        now = self.clock()
+        for item, lateness in batch:
+            notify = item.update(result[item.name, item.index], lateness, now)
+            item.reschedule(now)
+            if notify and item.callback is not None:
+                try:
+                    item.callback(item)
+                except Exception:
+                    _logger.exception("Poll callback failed")
+
+    def _start_bus(self, bus: Hashable) -> None:
+        """Запуск потока опроса шины."""
+
+        thread = Thread(target=self._run, args=(bus,), name="owen-poll", daemon=True)
+        self._threads[bus] = thread
+        thread.start()
+
+    def _run(self, bus: Hashable) -> None:
+        """Цикл опроса шины."""
+
+        wake = self._wake[bus]
+        while not self._stop.is_set():
+            wake.clear()
+            delay = self.step(bus)
+            if delay > 0:
+                wake.wait(delay if delay != float("inf") else None)
+
+    def start(self) -> None:
+        """Запуск опроса (по одному потоку на шину)."""
+
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._stop.clear()
+            for bus in self._buses:
+                self._start_bus(bus)
+
+    def stop(self) -> None:
+        """Остановка опроса с ожиданием завершения потоков."""
+
+        with self._lock:
+            self._running = False
+            self._stop.set()
+            for wake in self._wake.values():
+                wake.set()
+            threads = list(self._threads.values())
+            self._threads.clear()
+
+        for thread in threads:
+            thread.join()
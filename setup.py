@@ -10,7 +10,9 @@ setup(name="python-owen",
       author_email="aryadno@mail.ru",
       license="MIT",
       packages=find_packages(),
-      install_requires=["pymodbus >= 3.0, < 3.9", "pyserial >= 3.5"],
+      install_requires=["pymodbus >= 3.0, < 3.10", "pyserial >= 3.5"],
+      extras_require={"numpy": ["numpy"],
+                      "asyncio": ["pyserial-asyncio >= 0.6"]},
       platforms=["Linux", "Windows"],
       classifiers=["Development Status :: 4 - Beta",
                    "Intended Audience :: Science/Research",
@@ -0,0 +1,151 @@
+#! /usr/bin/env python3
+
+import asyncio
+import unittest
+from threading import Barrier, Thread
+from time import sleep
+from unittest.mock import MagicMock, patch
+
+from owen.bus import AsyncSingleFlight, BusLock, BusRegistry, SingleFlight, registry
+from owen.exception import OwenError
+from owen.owen.transport import OwenSerialTransport
+
+
+class TestBusRegistry(unittest.TestCase):
+    """The unittest for shared serial port registry."""
+
+    def setUp(self) -> None:
+        self.registry = BusRegistry()
+        self.settings = {"baudrate": 9600, "parity": "N"}
+
+    def tearDown(self) -> None:
+        del self.registry
+
+    def test_shared(self) -> None:
+        factory = MagicMock()
+        buses = [self.registry.acquire("/dev/ttyUSB0", "owen", dict(self.settings), factory) for _ in range(3)]
+
+        factory.assert_called_once()                                  # the port is opened once
+        self.assertTrue(all(bus is buses[0] for bus in buses))
+        self.assertEqual((1, 3), (len(self.registry), buses[0].refs))
+
+        for bus in buses:
+            factory.return_value.close.assert_not_called()
+            self.registry.release(bus)
+        factory.return_value.close.assert_called_once()               # closed with the last user
+        self.assertEqual(0, len(self.registry))
+
+    def test_conflict(self) -> None:
+        self.registry.acquire("/dev/ttyUSB0", "owen", self.settings, MagicMock())
+        self.assertRaises(OwenError, lambda: self.registry.acquire("/dev/ttyUSB0", "owen", {"baudrate": 115200},
+                                                                   MagicMock()))
+        self.assertRaises(OwenError, lambda: self.registry.acquire("/dev/ttyUSB0", "modbus", self.settings,
+                                                                   MagicMock()))
+
+    @patch("owen.owen.transport.Serial")
+    def test_transport(self, serial: MagicMock) -> None:
+        transports = [OwenSerialTransport(port="/dev/ttyUSB9") for _ in range(32)]
+        serial.assert_called_once()
+        self.assertTrue(all(transport.socket is transports[0].socket for transport in transports))
+        self.assertTrue(all(transport.lock is transports[0].lock for transport in transports))
+
+        for transport in transports:
+            transport.close()
+        serial.return_value.close.assert_called_once()
+        self.assertEqual(0, len(registry))
+
+
+class TestBusLock(unittest.TestCase):
+    """The unittest for fair bus lock."""
+
+    def test_fifo(self) -> None:
+        lock = BusLock()
+        order: list[int] = []
+
+        def worker(number: int) -> None:
+            with lock:
+                order.append(number)
+
+        with lock, lock:                                              # reentrant
+            threads = []
+            for number in range(5):
+                threads.append(Thread(target=worker, args=(number,)))
+                threads[-1].start()
+                while lock.stats().waiting <= number:                 # wait until queued
+                    sleep(0.001)
+            sleep(0.01)
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([0, 1, 2, 3, 4], order)
+        stats = lock.stats()
+        self.assertEqual((6, 5, 0), (stats.acquisitions, stats.contended, stats.waiting))
+        self.assertGreater(stats.wait_max, 0.01)
+        self.assertFalse(lock.locked())
+        self.assertRaises(RuntimeError, lock.release)
+
+
+class TestSingleFlight(unittest.TestCase):
+    """The unittest for request coalescing."""
+
+    def test_threads(self) -> None:
+        flights = SingleFlight()
+        barrier = Barrier(8)
+        results: list[int] = []
+
+        def request() -> int:
+            sleep(0.05)                                               # transaction on the bus
+            return len(results)
+
+        def worker() -> None:
+            barrier.wait()
+            results.append(flights.do(("SP", 0), request))
+
+        threads = [Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([0] * 8, results)
+        self.assertEqual((1, 7, 0), flights.stats())
+
+        # exceptions are delivered to every caller, failed requests are not cached
+        self.assertRaises(ZeroDivisionError, lambda: flights.do(("SP", 0), lambda: 1 // 0))
+        self.assertEqual(1, flights.do(("SP", 0), lambda: 1))
+
+
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+    """The unittest for asynchronous request coalescing."""
+
+    async def test_coroutines(self) -> None:
+        flights = AsyncSingleFlight()
+        calls: list[str] = []
+
+        async def request(name: str) -> str:
+            calls.append(name)
+            await asyncio.sleep(0.01)
+            if name == "ERR":
+                raise OwenError(name)
+            return name
+
+        results = await asyncio.gather(*(flights.do(name, lambda name=name: request(name))
+                                         for name in ["SP", "SP", "PV", "SP", "ERR", "ERR"]),
+                                       return_exceptions=True)
+
+        self.assertEqual(["SP", "SP", "PV", "SP"], results[:4])
+        self.assertTrue(all(isinstance(result, OwenError) for result in results[4:]))
+        self.assertEqual(["SP", "PV", "ERR"], calls)
+        self.assertEqual((3, 3, 0), flights.stats())
+
+        # cancellation of one caller does not cancel the request for the others
+        first = asyncio.ensure_future(flights.do("SP", lambda: request("SP")))
+        second = asyncio.ensure_future(flights.do("SP", lambda: request("SP")))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertEqual("SP", await second)
+
+
+if __name__ == "__main__":
+    unittest.main()
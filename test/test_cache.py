@@ -0,0 +1,50 @@
+#! /usr/bin/env python3
+
+import unittest
+
+from owen.cache import ValueCache
+
+
+class TestValueCache(unittest.TestCase):
+    """The unittest for parameter value cache."""
+
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.cache = ValueCache(ttl=1.0, maxsize=2, ttls={"sp": 5.0}, clock=lambda: self.now)
+
+    def tearDown(self) -> None:
+        del self.cache
+
+    def test_ttl(self) -> None:
+        self.cache.put(("PV", None), 20.0)
+        self.cache.put(("SP", 0), 25.0)
+        self.now = 0.5
+        self.assertEqual((20.0, 0.5, True), self.cache.get(("PV", None)))
+
+        self.now = 2.0
+        self.assertIsNone(self.cache.get(("PV", None)))               # expired
+        self.assertEqual(25.0, self.cache.get(("SP", 0)).value)       # per-parameter TTL
+
+        self.cache.put(("DEV", None), "TRM201")
+        self.now = 1e6
+        self.assertEqual("TRM201", self.cache.get(("DEV", None)).value)    # static parameter
+        self.assertEqual((3, 1, 0, 2, 2), self.cache.info())
+
+    def test_lru(self) -> None:
+        self.cache.put(("A", None), 1)
+        self.cache.put(("B", None), 2)
+        self.cache.get(("A", None))
+        self.cache.put(("C", None), 3)                                # B is least recently used
+
+        self.assertIsNone(self.cache.get(("B", None)))
+        self.assertEqual(1, self.cache.get(("A", None)).value)
+        self.assertEqual(1, self.cache.info().evictions)
+
+        self.cache.invalidate(("A", None))
+        self.assertEqual(1, len(self.cache))
+        self.cache.invalidate()
+        self.assertEqual(0, len(self.cache))
+
+
+if __name__ == "__main__":
+    unittest.main()
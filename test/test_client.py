@@ -0,0 +1,122 @@
+#! /usr/bin/env python3
+
+import asyncio
+import unittest
+from threading import Thread
+from time import sleep
+from unittest.mock import MagicMock
+
+from owen.cache import ValueCache
+from owen.client import AsyncOwenDevice, AsyncOwenSerialTransport, OwenDevice, OwenSerialTransport
+from owen.device import TRM201
+
+
+class TestOwenDevice(unittest.TestCase):
+    """The unittest for Owen device client."""
+
+    def setUp(self) -> None:
+        self.transport = OwenSerialTransport(port=None)
+        self.transport.socket = MagicMock(timeout=1.0, inter_byte_timeout=None)
+        self.device = OwenDevice(transport=self.transport, device=TRM201, unit=1)
+
+    def tearDown(self) -> None:
+        del self.device
+        del self.transport
+
+    def test_get_many(self) -> None:
+        self.transport.socket.read_until.side_effect = [b"#GHGHHUTIGGJKGK\r"]
+        self.assertEqual({("a.len", None): 0}, self.device.get_many([("a.len", None)]))
+
+    def test_set_many(self) -> None:
+        # the device replies to a write request with the same packet
+        self.transport.socket.read_until.side_effect = lambda *args, **kwargs: \
+            self.transport.socket.write.call_args.args[0]
+        self.assertEqual({("a.len", None): True}, self.device.set_many({("a.len", None): 0}))
+
+    def test_cache(self) -> None:
+        self.transport.socket.read_until.side_effect = lambda *args, **kwargs: \
+            self.transport.socket.write.call_args.args[0] if \
+            self.transport.socket.write.call_args.args[0][3] == ord("G") else b"#GHGHHUTIGGJKGK\r"
+        self.device.cache = ValueCache(ttl=60.0)
+
+        self.assertEqual((0, False), self.device.get_value("a.len")[::2])
+        self.assertEqual((0, True), self.device.get_value("A.LEN", 0)[::2])   # same parameter
+        self.assertEqual({("A.LEN", None): 0}, self.device.get_many([("A.LEN", None)]))
+        self.assertEqual(1, self.transport.socket.write.call_count)
+
+        self.device.set_param("A.LEN", value=1)                        # write updates the cache
+        self.assertEqual((1, True), self.device.get_value("A.LEN")[::2])
+        self.assertEqual((3, 1, 0, 1024, 1), self.device.cache_info())
+
+    def test_param(self) -> None:
+        self.transport.socket.read_until.side_effect = lambda *args, **kwargs: \
+            self.transport.socket.write.call_args.args[0] if \
+            self.transport.socket.write.call_args.args[0][3] == ord("G") else b"#GHGHHUTIGGJKGK\r"
+        param = self.device.param("a.len")
+        self.device.cache = ValueCache(ttl=60.0)
+
+        self.assertEqual(0, param.read())
+        self.assertEqual(self.device.get_param("A.LEN"), param.read())
+        self.assertTrue(param.write(1))
+        self.assertEqual(1, self.device.get_value("A.LEN").value)    # write updates the cache
+        self.assertRaises(KeyError, lambda: self.device.param("XXX"))
+
+    def test_threads(self) -> None:
+        # each answer is sent after a delay, so unlocked transactions would interleave
+        def reply(*args: object, **kwargs: object) -> bytes:
+            sleep(0.001)
+            packet = self.transport.socket.write.call_args.args[0]
+            return packet if packet[3] == ord("G") else b"#GHGHHUTIGGJKGK\r"
+        self.transport.socket.read_until.side_effect = reply
+
+        devices = [OwenDevice(transport=self.transport, device=TRM201, unit=1) for _ in range(4)]
+        errors: list[Exception] = []
+
+        def worker(device: OwenDevice) -> None:
+            for _ in range(10):
+                try:
+                    device.get_param("A.LEN")
+                    device.set_param("A.LEN", value=0)
+                except Exception as err:
+                    errors.append(err)
+
+        threads = [Thread(target=worker, args=(device,)) for device in devices]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+        # concurrent reads of the same parameter share one transaction
+        self.assertEqual(80, devices[0].lock_stats().acquisitions + self.transport.flights.stats().shared)
+
+        # the same address in 11-bit mode is another device
+        device11 = OwenDevice(transport=self.transport, device=TRM201, unit=1, addr_len_8=False)
+        self.assertNotEqual(devices[0]._flight_key("A.LEN", None), device11._flight_key("A.LEN", None))
+
+
+class TestAsyncOwenDevice(unittest.IsolatedAsyncioTestCase):
+    """The unittest for asynchronous Owen device client."""
+
+    def setUp(self) -> None:
+        self.transport = AsyncOwenSerialTransport(port=None, timeout=0.1)
+        self.transport.connection_made(MagicMock())
+        self.device = AsyncOwenDevice(transport=self.transport, device=TRM201, unit=1)
+
+        # the device replies to a write request with the same packet
+        self.transport.socket.write.side_effect = lambda packet: asyncio.get_running_loop().call_soon(
+            self.transport.data_received, packet if packet[3] == ord("G") else b"#GHGHHUTIGGJKGK\r")
+
+    def tearDown(self) -> None:
+        del self.device
+        del self.transport
+
+    async def test_param(self) -> None:
+        self.assertEqual(0, await self.device.get_param("a.len"))
+        self.assertTrue(await self.device.set_param("a.len", value=0))
+        self.assertEqual({("a.len", None): 0}, await self.device.get_many([("a.len", None)]))
+        self.assertEqual({("a.len", None): True}, await self.device.set_many({("a.len", None): 0}))
+
+
+if __name__ == "__main__":
+    unittest.main()
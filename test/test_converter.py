@@ -0,0 +1,81 @@
+#! /usr/bin/env python3
+
+import unittest
+
+from owen.exception import OwenError
+from owen.modbus.converter import get_codec, pack_registers
+from owen.owen.converter import OWEN_TYPE
+from owen.owen.vector import np, unpack_array
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestOwenArray(unittest.TestCase):
+    """The unittest for vectorised unpacking of Owen values."""
+
+    def assertUnpacked(self, frmt: str, values: list[bytes], index: bool = False) -> None:
+        expected = [OWEN_TYPE[frmt]["unpack"](value[:-2] if index else value) for value in values]
+        result = unpack_array(frmt, values, index)
+        self.assertEqual(expected, [tuple(item) if isinstance(item, (list, tuple)) else item
+                                    for item in result.tolist()])
+
+    def test_fixed(self) -> None:
+        self.assertUnpacked("U8", [bytes([12]), bytes([244])])
+        self.assertUnpacked("I8", [bytes([12]), bytes([244])])
+        self.assertUnpacked("U16", [bytes([4, 210]), bytes([251, 46])])
+        self.assertUnpacked("I16", [bytes([4, 210]), bytes([251, 46])])
+        self.assertUnpacked("F24", [bytes([66, 246, 233]), bytes([194, 71, 255])])
+        self.assertUnpacked("F24", [bytes([66, 246, 233, 0, 0]), bytes([194, 71, 255, 0, 1])], index=True)
+        self.assertUnpacked("F32", [bytes([66, 246, 233, 223])])
+        self.assertUnpacked("U24", [bytes([71, 179, 235])])
+        self.assertUnpacked("F32+T", [bytes([194, 71, 255, 167, 15, 225])])
+
+    def test_variable(self) -> None:
+        self.assertUnpacked("SDOT", [bytes([29, 172]), bytes([16, 16, 4]), bytes([0xA4, 0x0E]), bytes([16])])
+        self.assertUnpacked("SDOT", [bytes([29, 172, 0, 0]), bytes([16, 16, 4, 0, 0])], index=True)
+        self.assertUnpacked("DOT0", [bytes([0]), bytes([3, 4]), bytes([9, 135, 101, 67, 33])])
+        self.assertUnpacked("DOT3", [bytes([3, 4]), bytes([9, 135, 101, 67, 33])])
+        self.assertUnpacked("CLK", [bytes([0, 0, 16, 2, 3, 5]), bytes([18, 52, 86, 50, 72, 87])])
+
+    def test_long_bcd(self) -> None:
+        self.assertUnpacked("DOT0", [bytes([0x12] * 10), bytes([3, 4])])
+        self.assertUnpacked("DOT3", [bytes([0x12] * 10), bytes([3, 4])])
+
+    def test_empty(self) -> None:
+        for frmt in ("U8", "F24", "F32+T", "SDOT", "DOT0", "CLK"):
+            with self.subTest(frmt=frmt):
+                self.assertEqual(0, len(unpack_array(frmt, [])))
+                self.assertEqual(0, len(unpack_array(frmt, [], index=True)))
+
+    def test_errors(self) -> None:
+        self.assertRaises(OwenError, lambda: unpack_array("F32", [bytes([66, 246, 233, 223]), bytes([253])]))
+        self.assertRaises(OwenError, lambda: unpack_array("DOT0", [bytes([0xFA])]))
+        self.assertRaises(OwenError, lambda: unpack_array("STR", [b"abc"]))
+
+
+class TestModbusCodec(unittest.TestCase):
+    """The unittest for Modbus register codec."""
+
+    def test_byteorder(self) -> None:
+        registers = {(">", ">"): [0x4148, 0xF5C3], (">", "<"): [0xF5C3, 0x4148],
+                     ("<", ">"): [0x4841, 0xC3F5], ("<", "<"): [0xC3F5, 0x4841]}
+        for (byteorder, wordorder), value in registers.items():
+            codec = get_codec("F32", byteorder, wordorder)
+            self.assertEqual(value, codec.encode(12.56))
+            self.assertAlmostEqual(12.56, codec.decode(value), places=5)
+            self.assertAlmostEqual(12.56, codec.decode_from(pack_registers([0, *value]), 1), places=5)
+
+        self.assertEqual([0x3412], get_codec("U16", "<", "<").encode(0x1234))
+        self.assertEqual(-2, get_codec("I16", "<", ">").decode([0xFEFF]))
+        self.assertEqual([0x5678, 0x1234], get_codec("U32", ">", "<").encode(0x12345678))
+        self.assertEqual(-2, get_codec("I32", ">", ">").decode_from(pack_registers([0xFFFF, 0xFFFE]), 0))
+
+    def test_string(self) -> None:
+        codec = get_codec("STR8", "<", "<")
+        self.assertEqual([0x5452, 0x4D2D, 0x3230, 0x3200], codec.encode("TRM-202"))
+        self.assertEqual("TRM-2022", codec.decode([0x5452, 0x4D2D, 0x3230, 0x3232]))
+        self.assertEqual("TRM-2022", get_codec("STR64", ">", ">").decode([0x5452, 0x4D2D, 0x3230, 0x3232]))
+        self.assertEqual("TRM", codec.decode_from(pack_registers([0, 0x5452, 0x4D00, 0, 0]), 1).rstrip("\x00"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+#! /usr/bin/env python3
+
+import operator
+import subprocess
+import sys
+import unittest
+
+import owen.device
+from owen.device import TRM201, get_device
+from owen.device._table import DeviceTable, device_table
+from owen.modbus.protocol import Modbus
+from owen.owen.protocol import Owen
+
+
+class TestDeviceTable(unittest.TestCase):
+    """The unittest for compiled device tables."""
+
+    def test_compile(self) -> None:
+        devices = {name: get_device(name) for name in owen.device.devices()}
+        self.assertGreater(len(devices), 30)
+
+        for name, device in devices.items():
+            with self.subTest(device=name):
+                table = device_table(device)
+                self.assertIs(table, device_table(device))            # compiled once per registry table
+                self.assertEqual(set(device.get("modbus", {})), set(table.modbus))
+                self.assertEqual(set(device.get("owen", {})), set(table.owen))
+
+    def test_lookup(self) -> None:
+        table = device_table(TRM201)
+        sp = table.modbus["SP"]
+
+        self.assertEqual((0x0002, 1, "DP", 0), (sp.indexes[None], sp.registers, sp.dp, sp.precision))
+        self.assertIs(sp.type, table.modbus["IN.L"].type)               # interned type name
+        self.assertEqual(frozenset({"DP"}), table.dp_names)
+        self.assertRaises(TypeError, lambda: operator.setitem(table.modbus, "SP", sp))
+
+    def test_protocols(self) -> None:
+        table = device_table(TRM201)
+        self.assertIsInstance(table, DeviceTable)
+        self.assertIs(device_table(table), table)
+
+        # protocols share one table and accept both forms
+        self.assertIs(Modbus(1, TRM201, True).device, Modbus(2, table, True).device)
+        self.assertIs(Owen(1, TRM201, True).device, Owen(2, table, True).device)
+        self.assertIs(Owen(1, TRM201, True).commands, table.commands)
+
+    def test_custom(self) -> None:
+        device = {"owen": dict(TRM201["owen"]), "modbus": dict(TRM201["modbus"])}
+        self.assertIsNot(device_table(device), device_table(device))  # not cached
+
+        # changes of the settings are used by new protocol instances
+        del device["modbus"]["SP"]
+        self.assertNotIn("SP", Modbus(1, device, True).device)
+        self.assertIn("SP", Modbus(1, TRM201, True).device)
+
+
+class TestDeviceRegistry(unittest.TestCase):
+    """The unittest for lazy device registry."""
+
+    def test_lazy(self) -> None:
+        code = ("import sys, owen.device as d; assert 'owen.device.pr103' not in sys.modules; "
+                "d.TRM201; print(sorted(m for m in sys.modules if m.startswith('owen.device.')))")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual("['owen.device.trm201']", result.stdout.strip())
+
+    def test_lookup(self) -> None:
+        self.assertIs(TRM201, get_device("trm201"))
+        self.assertIs(owen.device.PR103_24_1610_03, get_device("PR103-24-1610-03"))
+        self.assertIs(owen.device._2TRM1, get_device("2TRM1"))
+        self.assertIs(owen.device._2TRM1, get_device("_2trm1"))
+        self.assertIn("MV210_101", owen.device.devices())
+        self.assertIn("MV210_101", dir(owen.device))
+        self.assertRaises(KeyError, lambda: get_device("TRM999"))
+        self.assertRaises(AttributeError, lambda: owen.device.TRM999)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,17 @@
 #! /usr/bin/env python3
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
-from owen.device import TRM201
+from pymodbus.exceptions import ModbusIOException
+
+from owen.device import SI8, TRM201, TRM212
 from owen.exception import OwenError
-from owen.modbus.protocol import Modbus
-from owen.owen.protocol import Owen
+from owen.modbus.planner import plan_reads, plan_writes
+from owen.modbus.protocol import AsyncModbus, Modbus
+from owen.owen.converter import unpack_many
+from owen.owen.crc import crc16_update, hash_update
+from owen.owen.protocol import AsyncOwen, Owen
 
 try:
     from pymodbus.register_write_message import WriteMultipleRegistersResponse
@@ -55,6 +60,15 @@ class TestOwenProtocol(unittest.TestCase):
         self.assertEqual(233, self.trm.owen_hash((36, 46, 36, 58)))
         self.assertIsInstance(self.trm.owen_hash((36, 46, 36, 58)), int)
 
+    def test_crc_tables(self) -> None:
+        for crc in range(0, 0x10000, 0x101):
+            for value in range(256):
+                self.assertEqual(self.trm.fast_calc(value, crc, 8), crc16_update(crc, [value]))
+                self.assertEqual(self.trm.fast_calc(value << 1, crc, 7), hash_update(crc, [value]))
+
+        frame = bytes((1, 5, 225, 125, 195, 71, 230, 0, 0))
+        self.assertEqual(23007, crc16_update(crc16_update(0, frame[:4]), memoryview(frame)[4:]))
+
     def test_name2code(self) -> None:
         self.assertEqual((21, 42, 28, 46), self.trm.name2code("A.LEN"))
         self.assertEqual((56, 43, 34, 78), self.trm.name2code("SL.H"))
@@ -67,6 +81,14 @@ class TestOwenProtocol(unittest.TestCase):
         self.assertEqual((36, 46, 36, 58), self.trm.name2code("INIT"))
         self.assertIsInstance(self.trm.name2code("INIT"), tuple)
 
+    def test_command_table(self) -> None:
+        self.assertIs(self.trm.commands, self.trm11.commands)
+        self.assertEqual(7890, self.trm.commands.code("A.LEN"))
+        self.assertEqual("A.LEN", self.trm.commands.name(7890))
+        self.assertEqual(13800, self.trm.commands.code("O"))       # not in table
+        self.assertEqual("O", self.trm.commands.name(13800))
+        self.assertIsNone(self.trm.commands.name(0))
+
     def test_encode_frame(self) -> None:
         self.assertEqual(b"#GHHGHUTIKGJI\r", self.trm.encode_frame((1, 16, 30, 210, 64, 50)))
         self.assertEqual(b"#GHGHHUTIGGJKGK\r", self.trm.encode_frame((1, 1, 30, 210, 0, 52, 4)))
@@ -90,6 +112,11 @@ class TestOwenProtocol(unittest.TestCase):
         self.assertEqual((1, 1, 30, 37, 20, 126, 6), self.trm.decode_frame(b"#GHGHHUILHKNUGM\r"))
         self.assertIsInstance(self.trm.decode_frame(b"#GHGHHUILHKNUGM\r"), tuple)
 
+    def test_decode_bytes(self) -> None:
+        self.assertEqual(bytes([1, 1, 30, 210, 0, 52, 4]), self.trm.decode_bytes(b"#GHGHHUTIGGJKGK\r"))
+        self.assertRaises(OwenError, lambda: self.trm.decode_bytes(b"#GHGHHUTIGGJKG0\r"))    # if invalid character
+        self.assertRaises(OwenError, lambda: self.trm.decode_bytes(b"#GHGHHUTIGGJKG\r"))     # if odd length
+
     def test_pack_value(self) -> None:
         self.assertEqual(bytes([194, 71, 255, 167, 15, 225]), self.trm.pack_value("F32+T", (-49.99966049194336, 4065)))
         self.assertEqual(bytes([66, 246, 233, 223]), self.trm.pack_value("F32", 123.45678))
@@ -144,6 +171,13 @@ class TestOwenProtocol(unittest.TestCase):
         self.assertEqual((123456, 32, 48, 57), self.trm.unpack_value("CLK", bytes([18, 52, 86, 50, 72, 87]), None))
         self.assertRaises(OwenError, lambda: self.trm.unpack_value("F32", bytes([253]), None))  # if error code
 
+    def test_unpack_many(self) -> None:
+        self.assertEqual([350.0, 410.0, -10.38, 100], unpack_many("SDOT", [bytes([29, 172]), bytes([16, 16, 4]),
+                                                                          bytes([0xA4, 0x0E]), bytes([0, 100])]))
+        self.assertEqual([0, 304, 987654321], unpack_many("DOT0", [bytes([0]), bytes([3, 4]), bytes([9, 135, 101, 67, 33])]))
+        self.assertEqual([(10, 2, 3, 5)], unpack_many("CLK", [bytes([0, 0, 16, 2, 3, 5])]))
+        self.assertEqual(bytes([1, 35, 69, 103, 1, 1, 1]), self.trm.pack_value("CLK", (1234567, 1, 1, 1)))   # if overflow
+
     def test_make_packet(self) -> None:
         self.assertEqual(b"#GHHGHUTIKGJI\r", self.trm.make_packet(1, "A.LEN", None, b""))
         self.assertEqual(b"#GHHISOOGGGGGQSUR\r", self.trm.make_packet(1, "DON", 0, b""))
@@ -157,6 +191,34 @@ class TestOwenProtocol(unittest.TestCase):
         self.assertEqual(b"#JIGLPHGNKHRHPQGGGGUMHO\r", self.trm11.make_packet(0, "SP", 0, bytes([65, 177, 154])))
         self.assertIsInstance(self.trm11.make_packet(0, "SP", 0, bytes([65, 177, 154])), bytes)
 
+    def test_frame_cache(self) -> None:
+        packet = self.trm.make_packet(1, "SP", 0, b"")
+        self.assertIs(packet, self.trm.make_packet(1, "SP", 0, b""))
+        self.assertEqual((1, 1), self.trm.cache_info()[:2])
+
+        self.trm.make_packet(0, "SP", 0, bytes([65, 200, 0]))       # not cached
+        self.assertEqual(1, self.trm.cache_info().currsize)
+
+        self.trm.unit = 2
+        self.assertEqual(0, self.trm.cache_info().currsize)
+        self.assertNotEqual(packet, self.trm.make_packet(1, "SP", 0, b""))
+
+        self.trm.frame_cache_size = 1
+        self.trm.make_packet(1, "PV", None, b"")
+        self.assertEqual(1, self.trm.cache_info().currsize)
+
+        # cached packets are logged too
+        with self.assertLogs("owen.owen.protocol", level="DEBUG") as logs:
+            self.trm.make_packet(1, "PV", None, b"")
+            self.trm.make_packet(1, "PV", None, b"")
+        self.assertEqual(2, sum(line.startswith("DEBUG:owen.owen.protocol:Send param: address=2, flag=1")
+                                for line in logs.output))
+
+    def test_response_size(self) -> None:
+        self.assertEqual(len(b"#GHGHHUTIGGJKGK\r"), self.trm.response_size("A.LEN", None))
+        self.assertEqual(len(b"#GHGLUHNTSJKNUMGGGGLPTV\r"), self.trm.response_size("SL.L", 0))
+        self.assertIsNone(self.trm.response_size("VER", None))      # variable size
+
     def test_parse_response(self) -> None:
         self.assertEqual(bytes([0]), self.trm.parse_response(b"#GHHGHUTIKGJI\r", b"#GHGHHUTIGGJKGK\r"))
         self.assertEqual(bytes([0, 0, 0]), self.trm.parse_response(b"#GHHISOOGGGGGQSUR\r", b"#GHGJSOOGGGGGGGUQRK\r"))
@@ -170,6 +232,7 @@ class TestOwenProtocol(unittest.TestCase):
         self.assertRaises(OwenError, lambda: self.trm.parse_response(b"#GHHINNRQGGGGRUIR\r", b"#GHGJGIJJKNNNRQPUSV\r"))        # if error code
         self.assertRaises(OwenError, lambda: self.trm.parse_response(b"#GHHIUHNTGGGGPULL\r", b"#GHGLUHNTSJKNUMGGGGLPTD\r"))    # if checksum error
         self.assertRaises(OwenError, lambda: self.trm.parse_response(b"#GHHGROTVJNPQ\r", b"#IJKJGIJJJHKOKNIJTO\r"))            # if addresses mismatch
+        self.assertRaises(OwenError, lambda: self.trm.parse_response(b"#GHHIUHNTGGGGPULL\r", b"#GHGLUHNTSJKNUMGGGGLP\r"))        # if length mismatch
         self.assertIsInstance(self.trm.parse_response(b"#GHHGJONIJKMN\r", b"#GHGHJONIMKKIMP\r"), bytes)
         self.assertIsInstance(self.trm.parse_response(b"#GHGLUHNTJVOGGGGGGGQGIG\r", b"#GHGLUHNTJVOGGGGGGGQGIG\r"), bytes)
 
@@ -184,6 +247,46 @@ class TestOwenProtocol(unittest.TestCase):
         self.trm.send_message = MagicMock(return_value=bytes([71, 180, 101]))
         self.assertEqual((71, 46181), self.trm.get_param(name="N.ERR", index=None))
 
+    def test_send_message(self) -> None:
+        # read() without arguments
+        self.trm.write = MagicMock()
+        self.trm.read = lambda: b"#GHGHHUTIGGJKGK\r"
+        self.assertEqual(0, self.trm.get_param(name="A.LEN"))
+        self.assertEqual(0, self.trm.prepare("A.LEN").read())
+        self.trm.write.assert_called_with(b"#GHHGHUTIKGJI\r")
+
+        # read with expected answer size
+        self.trm.read_size = MagicMock(return_value=b"#GHGHHUTIGGJKGK\r")
+        self.assertEqual(0, self.trm.get_param(name="A.LEN"))
+        self.trm.read_size.assert_called_once_with(16)
+
+    def test_get_many(self) -> None:
+        self.trm.send_message = MagicMock(side_effect=[bytes([0]), bytes([253])])
+        result = self.trm.get_many([("A.LEN", None), ("A.LEN", 0), ("A.LEN", 2), ("BPS", None), ("XXX", None)])
+
+        self.assertEqual(2, self.trm.send_message.call_count)        # A.LEN is read once
+        self.assertEqual(0, result["A.LEN", None])
+        self.assertEqual(0, result["A.LEN", 0])
+        self.assertIsInstance(result["A.LEN", 2], OwenError)          # invalid index
+        self.assertEqual(0xFD, result["BPS", None])
+        self.assertIsInstance(result["XXX", None], OwenError)         # unknown parameter
+
+        # device error code instead of DOT0 value
+        si8 = Owen(unit=1, device=SI8, addr_len_8=True)
+        si8.send_message = MagicMock(side_effect=[bytes([253]), bytes([0x00, 0x12, 0x34])])
+        result = si8.get_many([("DCNT", None), ("DSPD", None)])
+        self.assertIsInstance(result["DCNT", None], OwenError)
+        self.assertEqual(1234, result["DSPD", None])
+
+    def test_get_raw_many(self) -> None:
+        self.trm.send_message = MagicMock(side_effect=[bytes([253]), OwenError("Checksum error")])
+        result = self.trm.get_raw_many([("BPS", None), ("A.LEN", None), ("XXX", None)])
+
+        self.assertEqual(bytes([253]), result["BPS", None])
+        self.assertEqual(0xFD, self.trm.decode_raw("BPS", None, result["BPS", None]))
+        self.assertIsInstance(result["A.LEN", None], OwenError)
+        self.assertIsInstance(result["XXX", None], OwenError)
+
     def test_set_param(self) -> None:
         # invalid index
         self.assertRaises(OwenError, lambda: self.trm.set_param(name="A.LEN", index=2, value=0))
@@ -192,6 +295,18 @@ class TestOwenProtocol(unittest.TestCase):
         self.trm.send_message = MagicMock(return_value=bytes([0]))
         self.assertIsInstance(self.trm.set_param(name="A.LEN", index=None, value=0), bool)
 
+    def test_set_many(self) -> None:
+        self.trm.send_message = MagicMock(side_effect=[bytes([0]), bytes([253])])
+        result = self.trm.set_many({("A.LEN", None): 0, ("A.LEN", 2): 0, ("BPS", None): 300, ("SP", 0): 1.0,
+                                    ("XXX", None): 0})
+
+        self.assertEqual(2, self.trm.send_message.call_count)
+        self.assertTrue(result["A.LEN", None])
+        self.assertIsInstance(result["A.LEN", 2], OwenError)          # invalid index
+        self.assertIsInstance(result["BPS", None], OwenError)         # value can not be packed
+        self.assertIsInstance(result["SP", 0], OwenError)             # device error
+        self.assertIsInstance(result["XXX", None], OwenError)         # unknown parameter
+
 
 class TestModbusProtocol(unittest.TestCase):
     """The unittest for Modbus protocol."""
@@ -220,6 +335,134 @@ class TestModbusProtocol(unittest.TestCase):
         self.trm.modify_value = MagicMock(return_value=20.0)
         self.assertEqual(20.0, self.trm.get_param(name="SP", index=0))
 
+    @staticmethod
+    def registers(table: dict[int, list[int]]) -> MagicMock:
+        def read(address: int, count: int, unit: int) -> MagicMock:
+            registers = table.get(address, [])[:count]
+            return MagicMock(isError=MagicMock(return_value=len(registers) < count),
+                             registers=registers)
+        return MagicMock(side_effect=read)
+
+    def test_get_many(self) -> None:
+        self.trm.dp_ttl = 10.0
+        self.trm.read = self.registers({0x0002: [250, 7, 1234], 0x0004: [1234], 0x0202: [1]})
+        result = self.trm.get_many([("IN.T", 0), ("R.OUT", None), ("SP", 0), ("SP", 1)])
+
+        # sorted by address, SP depends on DP
+        self.assertEqual([(0x0002, 1), (0x0004, 1), (0x0200, 1), (0x0202, 1)],
+                         [call.args[:2] for call in self.trm.read.call_args_list])
+        self.assertEqual(25.0, result["SP", 0])
+        self.assertEqual(1.234, result["R.OUT", None])
+        self.assertIsInstance(result["IN.T", 0], OwenError)
+        self.assertIsInstance(result["SP", 1], OwenError)             # invalid index
+
+        # coalesced read, DP is cached
+        self.trm.read.reset_mock()
+        self.trm.max_gap = 1
+        result = self.trm.get_many([("IN.T", 0), ("R.OUT", None), ("SP", 0)])
+        self.assertEqual((25.0, 1.234), (result["SP", 0], result["R.OUT", None]))
+        self.assertEqual([(0x0002, 3), (0x0200, 1)],
+                         [call.args[:2] for call in self.trm.read.call_args_list])
+
+        # fallback to single reads if block is rejected
+        self.trm.read = self.registers({0x0002: [250], 0x0004: [1234], 0x0202: [1]})
+        self.assertEqual(1.234, self.trm.get_many([("SP", 0), ("R.OUT", 0)])["R.OUT", 0])
+
+    def test_dp_index(self) -> None:
+        # TRM212 has DP only for inputs 0 and 1, SP and X.1...X.10 have no DP
+        trm = Modbus(unit=1, device=TRM212, addr_len_8=True)
+        trm.read = self.registers({0x1009: [0x4148, 0x0000]})
+        result = trm.get_many([("PV", 0), ("SP", None), ("X", 2)])
+
+        self.assertEqual(12.5, result["PV", 0])
+        self.assertIsInstance(result["SP", None], OwenError)
+        self.assertIsInstance(result["X", 2], OwenError)
+        self.assertRaises(OwenError, lambda: trm.get_param("SP"))
+        self.assertRaises(OwenError, lambda: trm.prepare("SP"))
+        self.assertIsInstance(trm.set_many({("SP", None): 1.0})["SP", None], OwenError)
+
+    def test_dp_cache(self) -> None:
+        self.assertEqual(0, self.trm.dp_ttl)                         # disabled by default
+        self.trm.dp_ttl = 10.0
+        self.trm.read = self.registers({0x0002: [250], 0x0202: [1]})
+        self.trm.write = MagicMock(return_value=WriteMultipleRegistersResponse(1, 2))
+
+        self.assertEqual(25.0, self.trm.get_param(name="SP"))
+        self.assertEqual(25.0, self.trm.get_param(name="SP"))
+        self.assertEqual(3, self.trm.read.call_count)                 # DP is read once
+
+        self.trm.set_param(name="DP", value=2)                       # invalidates cache
+        self.trm.read = self.registers({0x0002: [250], 0x0202: [2]})
+        self.assertEqual(2.5, self.trm.get_param(name="SP"))
+
+        self.trm.dp_ttl = 10.0
+        self.trm.get_param(name="SP")
+        self.trm.invalidate_dp(1, "DP", None)                        # e.g. changed by another client
+        self.trm.read = self.registers({0x0002: [250], 0x0202: [1]})
+        self.assertEqual(25.0, self.trm.get_param(name="SP"))
+
+        self.trm.dp_ttl = 0                                          # cache disabled
+        self.trm.read.reset_mock()
+        self.trm.get_param(name="SP")
+        self.trm.get_param(name="SP")
+        self.assertEqual(4, self.trm.read.call_count)
+
+    def test_block_errors(self) -> None:
+        # DEV is not valid cp1251, VER is read from the same block
+        ver = [0x5631, 0x2E30, 0x0000, 0x0000]
+        self.trm.read = MagicMock(return_value=MagicMock(isError=MagicMock(return_value=False),
+                                                         registers=[0x9898, 0, 0, 0, *ver]))
+        result = self.trm.get_many([("DEV", None), ("VER", None)])
+        self.assertEqual(1, self.trm.read.call_count)
+        self.assertIsInstance(result["DEV", None], OwenError)
+        self.assertTrue(result["VER", None].startswith("V1.0"))
+
+        # block is rejected, single read of DEV fails with a transport error
+        self.trm.read = MagicMock(side_effect=[MagicMock(isError=MagicMock(return_value=True)),
+                                               ModbusIOException("No response"),
+                                               MagicMock(isError=MagicMock(return_value=False), registers=ver)])
+        result = self.trm.get_many([("DEV", None), ("VER", None)])
+        self.assertEqual(3, self.trm.read.call_count)
+        self.assertIsInstance(result["DEV", None], OwenError)
+        self.assertTrue(result["VER", None].startswith("V1.0"))
+
+    def test_get_raw_many(self) -> None:
+        self.trm.read = self.registers({0x0002: [250], 0x0004: [1234], 0x0202: [1]})
+        result = self.trm.get_raw_many([("SP", 0), ("R.OUT", None), ("IN.T", 0)])
+
+        self.assertEqual(bytes([0, 250, 1]), result["SP", 0])          # DP is appended
+        self.assertEqual(bytes([4, 210]), result["R.OUT", None])
+        self.assertIsInstance(result["IN.T", 0], OwenError)
+        self.assertEqual(25.0, self.trm.decode_raw("SP", 0, result["SP", 0]))
+        self.assertEqual(1.234, self.trm.decode_raw("R.OUT", None, result["R.OUT", None]))
+
+        self.trm.read = self.registers({0x0002: [250], 0x0004: [1234], 0x0202: [2]})
+        self.assertNotEqual(bytes([0, 250, 1]), self.trm.get_raw_many([("SP", 0)])["SP", 0])
+
+    def test_prepare(self) -> None:
+        self.assertRaises(OwenError, lambda: self.trm.prepare("SP", 2))
+        self.trm.read = self.registers({0x0002: [250], 0x0004: [1234], 0x0202: [1]})
+        self.trm.write = MagicMock(return_value=WriteMultipleRegistersResponse(2, 1))
+        sp, rout = self.trm.prepare("SP", 0), self.trm.prepare("R.OUT")
+
+        self.assertEqual((25.0, 1.234), (sp.read(), rout.read()))
+        self.assertEqual((self.trm.get_param("SP", 0), self.trm.get_param("R.OUT")), (sp.read(), rout.read()))
+        self.assertTrue(sp.write(30.0))
+        self.trm.write.assert_called_once_with(0x0002, [300], 1)
+        self.assertRaises(OwenError, lambda: sp.write(None))
+        self.assertRaises(TypeError, lambda: sp.write("30"))
+
+    def test_plan_reads(self) -> None:
+        params = [(name, self.trm.device[name], None) for name in ("DP", "IN.T", "DPT", "IN.H", "PV", "DEV", "VER")]
+        blocks = plan_reads(params)
+        self.assertEqual([(0x0200, 3), (0x0204, 1), (0x1000, 8), (0x1009, 2)],
+                         [(block.address, block.count) for block in blocks])
+        self.assertEqual([0, 1, 2], [item.offset for item in blocks[0].items])
+
+        blocks = plan_reads(params, max_count=4, max_gap=1)        # IN.H does not fit
+        self.assertEqual([(0x0200, 3), (0x0204, 1), (0x1000, 4), (0x1004, 4), (0x1009, 2)],
+                         [(block.address, block.count) for block in blocks])
+
     def test_set_param(self) -> None:
         value = 20.0
         # correct index and value
@@ -230,6 +473,129 @@ class TestModbusProtocol(unittest.TestCase):
         # invalid index
         self.assertRaises(OwenError, lambda: self.trm.set_param(name="SP", index=2, value=value))
 
+        # missing value
+        self.assertRaises(OwenError, lambda: self.trm.set_param(name="SP", index=0))
+
+    def test_set_many(self) -> None:
+        def write(address: int, payload: list[int], unit: int) -> MagicMock:
+            return MagicMock(isError=MagicMock(return_value=address <= 0x0102 < address + len(payload)))
+
+        self.trm.read = self.registers({0x0202: [1]})
+        self.trm.write = MagicMock(side_effect=write)
+        result = self.trm.set_many({("SP", None): 25.0, ("R-L", None): 1, ("R.OUT", None): 0.5,
+                                    ("PROT", None): 0, ("BPS", None): 3, ("XXX", None): 0,
+                                    ("PV", 1): 0})
+
+        # SP, R-L and R.OUT are written by one request, DP is read once
+        self.assertEqual([(0x0002, [250, 1, 500]), (0x0100, [0, 3])],
+                         [call.args[:2] for call in self.trm.write.call_args_list])
+        self.assertEqual(1, self.trm.read.call_count)
+        self.assertTrue(all(result[name, None] is True for name in ("SP", "R-L", "R.OUT", "PROT", "BPS")))
+        self.assertIsInstance(result["XXX", None], OwenError)         # unknown parameter
+        self.assertIsInstance(result["PV", 1], OwenError)             # invalid index
+
+        # the block is rejected, A.LEN is the invalid value
+        self.trm.write.reset_mock()
+        result = self.trm.set_many({("BPS", None): 3, ("A.LEN", None): 1, ("SP", None): "x"})
+        self.assertEqual([(0x0101, [3, 1]), (0x0101, [3]), (0x0102, [1])],
+                         [call.args[:2] for call in self.trm.write.call_args_list])
+        self.assertTrue(result["BPS", None])
+        self.assertIsInstance(result["A.LEN", None], OwenError)
+        self.assertIsInstance(result["SP", None], OwenError)          # value can not be packed
+
+        # new DP value is used for scaling
+        self.trm.write.reset_mock()
+        self.trm.set_many({("SP", None): 2.5, ("DP", None): 2})
+        self.assertEqual((0x0002, [250]), self.trm.write.call_args_list[0].args[:2])
+
+    def test_plan_writes(self) -> None:
+        blocks = plan_writes([("b", 11, [2, 3]), ("a", 10, [1]), ("c", 14, [4]), ("d", 15, [5, 6])], max_count=2)
+        self.assertEqual([(10, [1]), (11, [2, 3]), (14, [4]), (15, [5, 6])],
+                         [(block.address, block.registers) for block in blocks])
+        blocks = plan_writes([("b", 11, [2, 3]), ("a", 10, [1]), ("c", 14, [4]), ("d", 15, [5, 6])])
+        self.assertEqual([(10, ["a", "b"], [1, 2, 3]), (14, ["c", "d"], [4, 5, 6])],
+                         [(block.address, block.keys, block.registers) for block in blocks])
+
+
+class TestAsyncOwenProtocol(unittest.IsolatedAsyncioTestCase):
+    """The unittest for asynchronous Owen protocol."""
+
+    def setUp(self) -> None:
+        self.trm = AsyncOwen(unit=1, device=TRM201, addr_len_8=True)
+
+    def tearDown(self) -> None:
+        del self.trm
+
+    async def test_get_param(self) -> None:
+        self.trm.exchange = AsyncMock(return_value=b"#GHGHHUTIGGJKGK\r")
+        self.assertEqual(0, await self.trm.get_param(name="A.LEN"))
+        self.trm.exchange.assert_awaited_once_with(b"#GHHGHUTIKGJI\r", 16)
+
+        result = await self.trm.get_many([("A.LEN", None), ("XXX", None)])
+        self.assertEqual(0, result["A.LEN", None])
+        self.assertIsInstance(result["XXX", None], OwenError)
+
+        si8 = AsyncOwen(unit=1, device=SI8, addr_len_8=True)
+        si8.send_message = AsyncMock(side_effect=[bytes([253]), bytes([0x00, 0x12, 0x34])])
+        result = await si8.get_many([("DCNT", None), ("DSPD", None)])
+        self.assertIsInstance(result["DCNT", None], OwenError)
+        self.assertEqual(1234, result["DSPD", None])
+
+    def test_sync_api(self) -> None:
+        for name in ("read", "write", "prepare", "get_raw_many"):
+            self.assertFalse(hasattr(self.trm, name), name)
+
+    async def test_set_param(self) -> None:
+        self.trm.exchange = AsyncMock(side_effect=lambda packet, size: packet)
+        self.assertTrue(await self.trm.set_param(name="A.LEN", value=0))
+        self.assertEqual({("A.LEN", None): True}, await self.trm.set_many({("A.LEN", None): 0}))
+
+
+class TestAsyncModbusProtocol(unittest.IsolatedAsyncioTestCase):
+    """The unittest for asynchronous Modbus protocol."""
+
+    def setUp(self) -> None:
+        self.trm = AsyncModbus(unit=1, device=TRM201, addr_len_8=True)
+        self.table = {0x0002: [250], 0x0003: [1], 0x0004: [1234], 0x0202: [1]}
+
+        async def read(address: int, count: int, unit: int) -> MagicMock:
+            registers = [value for addr in range(address, address + count) for value in self.table.get(addr, [])]
+            return MagicMock(isError=MagicMock(return_value=len(registers) < count), registers=registers)
+        self.trm.read = AsyncMock(side_effect=read)
+        self.trm.write = AsyncMock(return_value=WriteMultipleRegistersResponse(1, 2))
+
+    def tearDown(self) -> None:
+        del self.trm
+
+    async def test_get_param(self) -> None:
+        self.assertEqual(25.0, await self.trm.get_param(name="SP"))
+        self.assertEqual(2, self.trm.read.await_count)
+
+        result = await self.trm.get_many([("SP", None), ("R-L", None), ("R.OUT", None)])
+        self.assertEqual({("SP", None): 25.0, ("R-L", None): 1, ("R.OUT", None): 1.234}, result)
+        self.assertEqual(4, self.trm.read.await_count)                # one block and DP
+
+        # block is rejected, single read of DEV fails with a transport error
+        self.trm.read = AsyncMock(side_effect=[MagicMock(isError=MagicMock(return_value=True)),
+                                               ModbusIOException("No response"),
+                                               MagicMock(isError=MagicMock(return_value=False),
+                                                         registers=[0x5631, 0x2E30, 0, 0])])
+        result = await self.trm.get_many([("DEV", None), ("VER", None)])
+        self.assertIsInstance(result["DEV", None], OwenError)
+        self.assertTrue(result["VER", None].startswith("V1.0"))
+
+    def test_sync_api(self) -> None:
+        for name in ("prepare", "modify_value", "read_block_raw", "get_raw_many"):
+            self.assertFalse(hasattr(self.trm, name), name)
+
+    async def test_set_param(self) -> None:
+        self.assertTrue(await self.trm.set_param(name="SP", value=20.0))
+        self.trm.write.assert_awaited_once_with(0x0002, [200], 1)
+
+        result = await self.trm.set_many({("SP", None): 20.0, ("R-L", None): 0})
+        self.assertEqual({("SP", None): True, ("R-L", None): True}, result)
+        self.assertEqual((0x0002, [200, 0], 1), self.trm.write.await_args.args)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,130 @@
+#! /usr/bin/env python3
+
+import unittest
+from time import sleep
+from unittest.mock import MagicMock
+
+from owen.exception import OwenError
+from owen.scheduler import Scheduler
+
+
+class TestScheduler(unittest.TestCase):
+    """The unittest for polling scheduler."""
+
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.scheduler = Scheduler(clock=lambda: self.now)
+        self.device = MagicMock(lock=object())
+        self.device.get_raw_many.side_effect = lambda items: {item: b"\x01" for item in items}
+        self.device.decode_raw.side_effect = lambda name, index, raw: float(raw[0])
+
+    def tearDown(self) -> None:
+        del self.scheduler
+
+    def test_drift(self) -> None:
+        item = self.scheduler.add(self.device, "PV", period=0.2)
+        bus = self.scheduler.bus(self.device)
+
+        self.assertAlmostEqual(0.2, self.scheduler.step(bus))
+        self.now = 0.25                                               # executed late
+        self.assertAlmostEqual(0.15, self.scheduler.step(bus))        # next slot is still 0.4
+        self.now = 1.05                                               # 0.4, 0.6 and 0.8 are missed
+        self.scheduler.step(bus)
+        self.assertAlmostEqual(1.2, item.next_due)
+
+        stats = item.stats(now=1.05)
+        self.assertEqual((3, 0, 3), stats[:3])
+        self.assertAlmostEqual(2 / 1.05, stats.rate)
+        self.assertAlmostEqual(0.65, stats.lateness_max)
+
+    def test_priority(self) -> None:
+        alarm = self.scheduler.add(self.device, "STAT", period=1.0, priority=1)
+        pv = self.scheduler.add(self.device, "PV", period=0.1)
+        bus = self.scheduler.bus(self.device)
+        self.assertEqual([alarm, pv], self.scheduler.plan()[bus])
+        self.assertAlmostEqual(11.0, self.scheduler.load(bus))
+
+        self.scheduler.step(bus)                                      # one request for both
+        self.device.get_raw_many.assert_called_once_with([("STAT", None), ("PV", None)])
+
+        self.now = 1.0                                                # overload: PV is 0.9 s late
+        self.device.get_raw_many.reset_mock()
+        self.scheduler.step(bus)
+        self.device.get_raw_many.assert_called_once_with([("STAT", None)])
+        self.assertEqual((1, 9), (pv.stats().reads, pv.stats().skipped))
+
+    def test_errors(self) -> None:
+        callback = MagicMock()
+        item = self.scheduler.add(self.device, "PV", period=1.0, callback=callback)
+        self.device.get_raw_many.side_effect = OSError("port is closed")
+        self.scheduler.step(self.scheduler.bus(self.device))
+
+        callback.assert_called_once_with(item)
+        self.assertIsInstance(item.error, OwenError)
+        self.assertEqual(1, item.stats().errors)
+        self.assertRaises(OwenError, lambda: self.scheduler.add(self.device, "PV", period=0))
+
+        # device error code instead of value
+        self.device.get_raw_many.side_effect = lambda items: {item: b"\xfd" for item in items}
+        self.device.decode_raw.side_effect = ValueError("invalid literal")
+        self.now = 1.0
+        self.scheduler.step(self.scheduler.bus(self.device))
+        self.assertIsInstance(item.error, OwenError)
+        self.assertEqual(2, item.stats().errors)
+
+    def test_subscribe(self) -> None:
+        values = iter([b"\x10", b"\x10", b"\x11", b"\x14", b"\x14", b"\x14", OwenError("timeout"),
+                       b"\x14"])
+        self.device.get_raw_many.side_effect = lambda items: {item: next(values) for item in items}
+        callback = MagicMock()
+        item = self.scheduler.subscribe(self.device, "PV", callback=callback, period=1.0,
+                                        deadband=2.0, heartbeat=2.0)
+        bus = self.scheduler.bus(self.device)
+
+        reported = []
+        for _ in range(8):
+            self.scheduler.step(bus)
+            if callback.call_count > len(reported):
+                reported.append((self.now, item.reported))
+            self.now += 1.0
+
+        self.assertEqual([(0.0, 16.0),                                # first value
+                          (2.0, 17.0),                                # heartbeat, 17 is within deadband
+                          (3.0, 20.0),                                # change of 3 > 2
+                          (5.0, 20.0)],                               # heartbeat
+                         reported[:4])
+        self.assertIsInstance(reported[4][1], OwenError)              # error is reported once
+        self.assertEqual((7.0, 20.0), reported[5])                    # recovered
+        self.assertEqual(4, self.device.decode_raw.call_count)        # unchanged data is not decoded
+
+        item.percent, item.deadband = True, 10.0
+        self.assertFalse(item.changed(21.0))
+        self.assertTrue(item.changed(22.5))
+
+    def test_subscribe_decode_error(self) -> None:
+        self.device.decode_raw.side_effect = ValueError("invalid literal")
+        item = self.scheduler.subscribe(self.device, "PV", period=1.0, heartbeat=1.0)
+        bus = self.scheduler.bus(self.device)
+
+        for _ in range(3):                                            # the same undecodable payload
+            self.scheduler.step(bus)
+            self.assertIsInstance(item.error, OwenError)
+            self.assertIsInstance(item.reported, OwenError)
+            self.now += 1.0
+        self.assertEqual(3, self.device.decode_raw.call_count)
+
+    def test_threads(self) -> None:
+        scheduler = Scheduler()
+        items = [scheduler.add(self.device, "PV", period=0.01) for _ in range(2)]
+        with scheduler:
+            sleep(0.1)
+            items.append(scheduler.add(MagicMock(lock=object(), get_raw_many=self.device.get_raw_many,
+                                                    decode_raw=self.device.decode_raw), "PV", period=0.01))
+            sleep(0.1)
+
+        self.assertTrue(all(item.stats().reads > 3 for item in items))
+        self.assertEqual(1.0, items[0].value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,241 @@
+#! /usr/bin/env python3
+
+import asyncio
+import unittest
+from struct import pack, unpack_from
+from threading import Thread
+from time import sleep
+from unittest.mock import MagicMock
+
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+
+from owen.modbus.pipeline import AsyncModbusPipelineTransport
+from owen.modbus.pool import ConnectionPool
+from owen.modbus.transport import ModbusTcpTransport
+from owen.owen.parser import FrameParser
+from owen.owen.transport import AsyncOwenSerialTransport, OwenSerialTransport
+
+
+class TestFrameParser(unittest.TestCase):
+    """The unittest for Owen frame parser."""
+
+    def setUp(self) -> None:
+        self.parser = FrameParser()
+
+    def tearDown(self) -> None:
+        del self.parser
+
+    def test_feed(self) -> None:
+        self.assertEqual([], self.parser.feed(b"#GHGHHUT"))
+        self.assertEqual([b"#GHGHHUTIGGJKGK\r"], self.parser.feed(b"IGGJKGK\r"))
+        self.assertEqual([b"#GHGHHUTIGGJKGK\r", b"#GHGJSOOGGGGGGGUQRK\r"],
+                         self.parser.feed(b"#GHGHHUTIGGJKGK\r#GHGJSOOGGGGGGGUQRK\r"))
+        self.assertEqual((0, 0), (self.parser.dropped_bytes, self.parser.dropped_frames))
+
+    def test_resync(self) -> None:
+        self.assertEqual([b"#GHGHHUTIGGJKGK\r"], self.parser.feed(b"\x00\xff#GHGH#GHGHHUTIGGJKGK\r"))
+        self.assertEqual((7, 1), (self.parser.dropped_bytes, self.parser.dropped_frames))
+
+        self.assertEqual([], self.parser.feed(b"#GHGHHUTIGGJKG0\r"))       # invalid character
+        self.assertEqual([], self.parser.feed(b"#GHGHHUTIGGJKG\r"))        # odd length
+        self.assertEqual([], self.parser.feed(b"#" + b"G" * 50))           # too long
+        self.assertEqual(4, self.parser.dropped_frames)
+
+    def test_echo(self) -> None:
+        self.parser.reset(echo=b"#GHHGHUTIKGJI\r")                        # read request
+        self.assertEqual([b"#GHGHHUTIGGJKGK\r"], self.parser.feed(b"#GHHGHUTIKGJI\r#GHGHHUTIGGJKGK\r"))
+        self.assertEqual((14, 1), (self.parser.dropped_bytes, self.parser.dropped_frames))
+
+        self.parser.reset(echo=b"#GHGLUHNTJVOGGGGGGGQGIG\r")              # write request
+        self.assertEqual([b"#GHGLUHNTJVOGGGGGGGQGIG\r"], self.parser.feed(b"#GHGLUHNTJVOGGGGGGGQGIG\r"))
+
+
+class TestOwenSerialTransport(unittest.TestCase):
+    """The unittest for Owen serial transport."""
+
+    def setUp(self) -> None:
+        self.transport = OwenSerialTransport(port=None)
+        self.transport.socket = MagicMock(timeout=1.0, inter_byte_timeout=None)
+
+    def tearDown(self) -> None:
+        del self.transport
+
+    def test_read(self) -> None:
+        self.transport.write(b"#GHHGHUTIKGJI\r")
+        self.transport.socket.read_until.side_effect = [b"\x00#GHHGHUTIKGJI\r", b"#GHGHHUTIGGJKGK\r"]
+        self.assertEqual(b"#GHGHHUTIGGJKGK\r", self.transport.read())
+
+        self.transport.socket.read_until.side_effect = [b"#GHGH"]         # timeout
+        self.assertEqual(b"", self.transport.read())
+
+    def test_read_size(self) -> None:
+        self.transport.socket.inter_byte_timeout = 0.01
+        self.transport.write(b"#GHHGHUTIKGJI\r")
+        self.transport.socket.read.side_effect = [b"#GHGHHUTIGGJKGK\r"]
+        self.assertEqual(b"#GHGHHUTIGGJKGK\r", self.transport.read(16))
+        self.transport.socket.read_until.assert_not_called()
+
+        # echo and the beginning of the answer
+        self.transport.write(b"#GHHGHUTIKGJI\r")
+        self.transport.socket.read.side_effect = [b"#GHHGHUTIKGJI\r#G"]
+        self.transport.socket.read_until.side_effect = [b"HGHHUTIGGJKGK\r"]
+        self.assertEqual(b"#GHGHHUTIGGJKGK\r", self.transport.read(16))
+
+        # short error answer
+        self.transport.socket.read.side_effect = [b"#GHGHHUTIGGJKGK\r"]
+        self.assertEqual(b"#GHGHHUTIGGJKGK\r", self.transport.read(20))
+
+
+class TestAsyncOwenSerialTransport(unittest.IsolatedAsyncioTestCase):
+    """The unittest for asynchronous Owen serial transport."""
+
+    def setUp(self) -> None:
+        self.transport = AsyncOwenSerialTransport(port=None, timeout=0.1)
+        self.transport.connection_made(MagicMock())
+
+    def tearDown(self) -> None:
+        del self.transport
+
+    def reply(self, *chunks: bytes) -> None:
+        def write(packet: bytes) -> None:
+            loop = asyncio.get_running_loop()
+            for chunk in chunks:
+                loop.call_soon(self.transport.data_received, chunk)
+        self.transport.socket.write.side_effect = write
+
+    async def test_exchange(self) -> None:
+        self.reply(b"\x00#GHHGHUTIKGJI\r#GHGH", b"HUTIGGJKGK\r")
+        self.assertEqual(b"#GHGHHUTIGGJKGK\r", await self.transport.exchange(b"#GHHGHUTIKGJI\r"))
+
+        self.reply(b"#GHGH")                                             # timeout
+        self.assertEqual(b"", await self.transport.exchange(b"#GHHGHUTIKGJI\r"))
+
+    async def test_lock(self) -> None:
+        self.reply(b"#GHGHHUTIGGJKGK\r")
+        result = await asyncio.gather(*(self.transport.exchange(b"#GHHGHUTIKGJI\r") for _ in range(3)))
+        self.assertEqual([b"#GHGHHUTIGGJKGK\r"] * 3, result)
+        self.assertEqual(3, self.transport.socket.write.call_count)
+
+    async def test_connection_lost(self) -> None:
+        await self.transport.write(b"#GHHGHUTIKGJI\r")
+        self.transport.connection_lost(None)
+        self.assertEqual(b"", await self.transport.read())
+        with self.assertRaises(ConnectionError):
+            await self.transport.write(b"#GHHGHUTIKGJI\r")
+
+
+class TestAsyncModbusPipelineTransport(unittest.IsolatedAsyncioTestCase):
+    """The unittest for pipelined Modbus TCP transport."""
+
+    async def asyncSetUp(self) -> None:
+        self.requests: list[tuple[int, int, int]] = []
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            # collects three requests, answers in reverse order and drops unit 3
+            batch = []
+            while True:
+                try:
+                    header = await reader.readexactly(7)
+                except asyncio.IncompleteReadError:
+                    break
+                tid, _, length, unit = unpack_from(">HHHB", header)
+                pdu = await reader.readexactly(length - 1)
+                self.requests.append((tid, unit, pdu[0]))
+                if pdu[0] == 0x10:
+                    reply = pdu[:5]
+                elif unit == 2:
+                    reply = bytes([0x83, 0x02])
+                else:
+                    reply = pack(">BBH", 0x03, 2, unit * 100)
+                batch.append(pack(">HHHB", tid, 0, len(reply) + 1, unit) + reply if unit != 3 else b"")
+                if len(batch) == 3:
+                    writer.write(b"".join(reversed(batch)))
+                    batch.clear()
+
+        self.server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.transport = AsyncModbusPipelineTransport("127.0.0.1", port, timeout=0.5, max_pending=4)
+        await self.transport.connect()
+
+    async def asyncTearDown(self) -> None:
+        self.transport.close()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_pipeline(self) -> None:
+        result = await asyncio.gather(*(self.transport.read(0x0002, 1, unit) for unit in (1, 2, 3)),
+                                      return_exceptions=True)
+
+        # all requests are sent before the first answer
+        self.assertEqual([(1, 1, 3), (2, 2, 3), (3, 3, 3)], self.requests)
+        self.assertEqual([100], result[0].registers)
+        self.assertTrue(result[1].isError())
+        self.assertEqual(2, result[1].exception_code)
+        self.assertIsInstance(result[2], ModbusIOException)           # lost answer
+
+        result = await asyncio.gather(self.transport.write(0x0002, [1, 2], 1), self.transport.read(0x0003, 1, 4),
+                                      self.transport.read(0x0003, 1, 1))
+        self.assertFalse(result[0].isError())
+        self.assertEqual(([400], [100]), (result[1].registers, result[2].registers))
+
+
+class TestConnectionPool(unittest.TestCase):
+    """The unittest for Modbus TCP connection pool."""
+
+    def setUp(self) -> None:
+        self.clients: list[MagicMock] = []
+
+        def factory(host: str, port: int) -> MagicMock:
+            client = MagicMock(connected=False)
+            client.connect.side_effect = lambda: setattr(client, "connected", True) or True
+            self.clients.append(client)
+            return client
+        self.pool = ConnectionPool(backoff=10.0, factory=factory)
+
+    def tearDown(self) -> None:
+        del self.pool
+
+    def test_shared(self) -> None:
+        transports = [ModbusTcpTransport("10.0.0.1", pool=self.pool) for _ in range(3)]
+        transports.append(ModbusTcpTransport("10.0.0.2", pool=self.pool))
+        for transport in transports:
+            transport.read(0x0002, 1, 1)
+
+        self.assertEqual(2, len(self.clients))                        # one socket per host
+        self.assertEqual(3, self.clients[0].read_holding_registers.call_count)
+        self.clients[0].connect.assert_called_once()
+
+    def test_threads(self) -> None:
+        active: list[int] = []
+        peak: list[int] = []
+
+        def read(**kwargs: int) -> None:
+            active.append(1)
+            peak.append(len(active))
+            sleep(0.01)
+            active.pop()
+
+        transport = ModbusTcpTransport("10.0.0.1", pool=self.pool)
+        threads = [Thread(target=transport.read, args=(0x0002, 1, unit)) for unit in range(8)]
+        with self.pool.connection("10.0.0.1") as client:
+            client.read_holding_registers.side_effect = read
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(8, self.clients[0].read_holding_registers.call_count)
+        self.assertEqual(1, max(peak))                                # exclusive use
+
+    def test_backoff(self) -> None:
+        with self.pool.connection("10.0.0.1") as client:
+            client.connected = False
+            client.connect.side_effect = lambda: False
+
+        transport = ModbusTcpTransport("10.0.0.1", pool=self.pool)
+        self.assertRaises(ConnectionException, lambda: transport.read(0x0002, 1, 1))
+        self.assertRaises(ConnectionException, lambda: transport.read(0x0002, 1, 1))
+        self.assertEqual(2, client.connect.call_count)                # second attempt is postponed
+
+
+if __name__ == "__main__":
+    unittest.main()